@@ -66,13 +66,27 @@ event_scraper = EventScraper()
 event_categorizer = EventCategorizer()
 newsletter_generator = NewsletterGenerator()
 
-def scrape_events_callback(start_date, end_date):
-    """Callback function for Step 1: Scrape Events"""
-    logger.info(f"Scraping events from {start_date} to {end_date}")
+def scrape_events_callback(start_date, end_date, incremental=False, on_update=None, resume=False, lazy_details=False,
+                           refresh=False):
+    """
+    Callback function for Step 1: Scrape Events
+    
+    on_update, if given, receives every streamed scraper update (see EventScraper.iter_events)
+    """
+    logger.info(f"Scraping events from {start_date} to {end_date} "
+                f"(incremental: {incremental}, resume: {resume}, lazy details: {lazy_details}, refresh: {refresh})")
     
     try:
-        # Call the scraper service
-        success, events_data = event_scraper.scrape_events(start_date, end_date)
+        # Stream events from the scraper service
+        success, events_data = False, {"error": "Scraping ended without a result"}
+        for update in event_scraper.iter_events(start_date, end_date, incremental=incremental, resume=resume,
+                                                lazy_details=lazy_details, refresh=refresh):
+            if on_update:
+                on_update(update)
+            if update["type"] == "complete":
+                success, events_data = True, update["events_data"]
+            elif update["type"] == "error":
+                events_data = {"error": update["error"]}
         
         if success:
             # Store results in session state
@@ -91,6 +105,14 @@ def scrape_events_callback(start_date, end_date):
         logger.error(f"Exception in scrape_events_callback: {e}")
         st.error(f"An error occurred during scraping: {e}")
 
+def day_cache_coverage_callback(start_date, end_date, lazy_details=False):
+    """Day cache coverage of a date range per calendar, for the Step 1 summary"""
+    try:
+        return event_scraper.day_cache_coverage(start_date, end_date, lazy_details=lazy_details)
+    except Exception as e:
+        logger.error(f"Could not read day cache coverage: {e}")
+        return {}
+
 def categorize_events_callback(api_key: str, model: str, provider: str = "openwebui"):
     """
     Callback function for Step 2: Categorize Events
@@ -179,7 +201,7 @@ def main():
         sidebar_ui = SidebarUI()
         sidebar_ui.render()
 
-        step1_ui = Step1UI(scrape_events_callback)
+        step1_ui = Step1UI(scrape_events_callback, day_cache_coverage_callback)
         step1_ui.render()
 
         step2_ui = Step2UI(categorize_events_callback)
@@ -0,0 +1,163 @@
+# app/benchmarks/browser_memory.py
+"""
+Compare browser memory per concurrent page: Selenium drivers vs the async browser
+
+The Selenium engine needs a whole Chrome per concurrent page, while the async
+engine opens every page as a context of one shared Chromium. For each
+concurrency level, both engines load that many recorded pages at once and
+hold them open while the resident memory of their browser processes is read.
+Results are printed and saved as JSON next to the engine benchmarks.
+
+Usage (from the src directory):
+    python -m benchmarks.browser_memory recorded_pages --concurrency 1,2,4,8
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+# Make the app modules importable when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.scraper import EventScraper
+from benchmarks.fixtures import ReplayServer
+from utils.async_browser import AsyncBrowser
+from utils.driver_pool import browser_rss_mb
+
+
+def recorded_urls(server: ReplayServer) -> List[str]:
+    """Local URLs of every recorded page"""
+    return [
+        f"{server.base_url}/{page.parent.relative_to(server.pages_dir).as_posix()}"
+        for page in sorted(server.pages_dir.rglob("index.html"))
+    ]
+
+
+def memory_result(engine: str, pages: int, rss_mb: Optional[float], seconds: float,
+                  baseline_mb: Optional[float] = None) -> Dict[str, Any]:
+    """One row of results; per-page memory includes the engine's fixed browser cost"""
+    return {
+        "engine": engine,
+        "concurrent_pages": pages,
+        "rss_mb": round(rss_mb, 1) if rss_mb is not None else None,
+        "mb_per_page": round(rss_mb / pages, 1) if rss_mb is not None else None,
+        "browser_baseline_mb": round(baseline_mb, 1) if baseline_mb is not None else None,
+        "load_seconds": round(seconds, 3)
+    }
+
+
+def measure_selenium(urls: List[str], pages: int, browser_profile: str) -> Dict[str, Any]:
+    """Start one Chrome per page, load every page at once and sum their browsers' memory"""
+    scraper = EventScraper()
+    scraper.browser_profile = browser_profile
+    drivers = []
+    try:
+        for _ in range(pages):
+            driver = scraper._create_driver()
+            scraper._apply_browser_profile(driver)
+            drivers.append(driver)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=pages) as executor:
+            list(executor.map(lambda i: drivers[i].get(urls[i % len(urls)]), range(pages)))
+        elapsed = time.perf_counter() - started
+
+        readings = [browser_rss_mb(driver) for driver in drivers]
+        rss_mb = None if None in readings else sum(readings)
+        return memory_result("selenium", pages, rss_mb, elapsed)
+    finally:
+        for driver in drivers:
+            driver.quit()
+
+
+def measure_async(urls: List[str], pages: int, browser_profile: str) -> Dict[str, Any]:
+    """Open every page as a context of one Chromium, load them at once and read the browser's memory"""
+    browser = AsyncBrowser(max_pages=pages, lean=browser_profile == "lean").start()
+
+    async def hold_pages():
+        # Pages stay open until memory is read, unlike fetch_html which closes each one
+        contexts = []
+
+        async def open_page(url):
+            context = await browser._browser.new_context()
+            contexts.append(context)
+            if browser.lean:
+                await context.route("**/*", browser._route_lean)
+            page = await context.new_page()
+            await page.goto(url, wait_until="domcontentloaded")
+
+        try:
+            started = time.perf_counter()
+            await asyncio.gather(*(open_page(urls[i % len(urls)]) for i in range(pages)))
+            return browser.rss_mb(), time.perf_counter() - started
+        finally:
+            await asyncio.gather(*(context.close() for context in contexts))
+
+    try:
+        baseline_mb = browser.rss_mb()
+        rss_mb, elapsed = browser.run(hold_pages())
+        return memory_result("async", pages, rss_mb, elapsed, baseline_mb)
+    finally:
+        browser.shutdown()
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    """One summary line per engine and concurrency level"""
+    line = (f"{result['engine']:>9} x{result['concurrent_pages']:<3}: "
+            f"{result['rss_mb'] if result['rss_mb'] is not None else '?':>8}MB total  "
+            f"{result['mb_per_page'] if result['mb_per_page'] is not None else '?':>7}MB/page  "
+            f"loaded in {result['load_seconds']:.2f}s")
+    if result["browser_baseline_mb"] is not None:
+        line += f"  (idle browser {result['browser_baseline_mb']}MB)"
+    return line
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare browser memory per concurrent page")
+    parser.add_argument("pages_dir", help="Directory of recorded pages")
+    parser.add_argument("--concurrency", default="1,2,4,8", help="Comma-separated numbers of pages open at once")
+    parser.add_argument("--engines", default="selenium,async", help="Comma-separated engines to measure")
+    parser.add_argument("--browser-profile", default="lean", help="Browser profile for both engines (lean or full)")
+    parser.add_argument("--output", help="JSON results file (default: benchmark_results/browser-memory-<timestamp>.json)")
+    args = parser.parse_args()
+
+    run_at = datetime.datetime.now()
+    output = Path(args.output or f"benchmark_results/browser-memory-{run_at:%Y%m%d-%H%M%S}.json").resolve()
+    measures = {"selenium": measure_selenium, "async": measure_async}
+
+    results = []
+    with ReplayServer(args.pages_dir) as server:
+        urls = recorded_urls(server)
+        if not urls:
+            sys.exit(f"No recorded pages in {args.pages_dir}")
+        for pages in (int(level) for level in args.concurrency.split(",")):
+            for engine in args.engines.split(","):
+                try:
+                    result = measures[engine.strip()](urls, pages, args.browser_profile)
+                except Exception as e:
+                    print(f"{engine} x{pages} failed: {e}")
+                    continue
+                print(format_result(result))
+                results.append(result)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({
+            "run_at": run_at.isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pages_dir": str(Path(args.pages_dir).resolve()),
+            "browser_profile": args.browser_profile,
+            "results": results
+        }, f, indent=2)
+    print(f"Results saved to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+# app/benchmarks/fixtures.py
+"""
+Record calendar pages from a real scrape and replay them from a local server
+
+Pages are stored under a directory that mirrors the URL path, e.g.
+``recorded_pages/cte/all/index.html`` for ``https://calendar.tamu.edu/cte/all``.
+A query string goes into the file name, so ``/cte/all?page=2`` is saved as
+``recorded_pages/cte/all/index.page%3D2.html``.
+
+Usage (from the src directory):
+    python -m benchmarks.fixtures record recorded_pages 2025-07-21 2025-08-04
+    python -m benchmarks.fixtures serve recorded_pages --latency-ms 150
+"""
+import argparse
+import datetime
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from pathlib import Path
+from urllib.parse import urlsplit, quote
+
+# Make the app modules importable when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.scraper import EventScraper
+from utils.page_cache import PageCache
+
+LIVE_HOST = "https://calendar.tamu.edu"
+
+
+def page_file(pages_dir: Path, url: str) -> Path:
+    """File a recorded page is kept in, keyed by the URL's path and query"""
+    parts = urlsplit(url)
+    name = f"index.{quote(parts.query, safe='')}.html" if parts.query else "index.html"
+    return pages_dir / parts.path.strip("/") / name
+
+
+def make_handler(pages_dir: Path, base_url: str, latency: float = 0.0):
+    """
+    Build a request handler that serves recorded pages with links rewritten to the local server
+
+    Args:
+        pages_dir: Directory of recorded pages
+        base_url: URL of the local server
+        latency: Seconds to wait before answering each request
+    """
+
+    class RecordedPageHandler(SimpleHTTPRequestHandler):
+        def do_GET(self):
+            if latency:
+                time.sleep(latency)
+            page_path = page_file(pages_dir, self.path)
+            if not page_path.exists():
+                self.send_error(404)
+                return
+            body = page_path.read_text(encoding="utf-8").replace(LIVE_HOST, base_url).encode("utf-8")
+            content_type = "application/json" if body.lstrip()[:1] in (b"{", b"[") else "text/html"
+            self.send_response(200)
+            self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return RecordedPageHandler
+
+
+class ReplayServer:
+    """Local HTTP server that replays recorded pages, optionally with added latency"""
+
+    def __init__(self, pages_dir: str, latency_ms: float = 0.0, port: int = 0):
+        """
+        Initialize the replay server
+
+        Args:
+            pages_dir: Directory of recorded pages
+            latency_ms: Delay added to every response
+            port: Port to listen on (0 picks a free port)
+        """
+        self.pages_dir = Path(pages_dir).resolve()
+        self.latency = latency_ms / 1000
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), None)
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._server.RequestHandlerClass = make_handler(self.pages_dir, self.base_url, self.latency)
+
+    def __enter__(self) -> "ReplayServer":
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def configure(self, scraper: EventScraper):
+        """Point a scraper's default calendar sources at this server"""
+        for name in ("cte", "elp"):
+            source = scraper.sources.get(name)
+            if source:
+                source["url"] = f"{self.base_url}/{name}/all"
+
+
+def record_pages(pages_dir: str, start_date: datetime.date, end_date: datetime.date, engine: str = "http") -> int:
+    """
+    Run a live scrape and save every page it fetched
+
+    The scrape goes through a fresh page cache whose entries are then written
+    out as fixtures, so recording sees exactly the pages a real run loads.
+    Browser listings never pass through the page cache, so the Selenium engine's
+    rendered listing pages are captured as they load.
+
+    Returns:
+        Number of pages saved
+    """
+    pages_dir = Path(pages_dir).resolve()
+    cache_dir = tempfile.mkdtemp(prefix="record_cache_")
+
+    scraper = EventScraper()
+    scraper.use_page_cache = True
+    # No TTL so browser fetches always load the live page
+    scraper._page_cache = PageCache(cache_dir=cache_dir, max_bytes=1 << 40, ttl_seconds=0)
+    # Every listing must be fetched to be recorded
+    scraper.use_day_cache = False
+
+    listing_pages = {}
+    load_listing_page = scraper._load_listing_page
+
+    def record_listing_page(driver, listing_url, selectors, timeout):
+        loaded = load_listing_page(driver, listing_url, selectors, timeout)
+        if loaded:
+            listing_pages[listing_url] = driver.page_source
+        return loaded
+
+    scraper._load_listing_page = record_listing_page
+
+    # The scraper writes events.json to the working directory; keep it out of the app's copy
+    cwd = os.getcwd()
+    os.chdir(tempfile.mkdtemp(prefix="record_run_"))
+    try:
+        success, events_data = scraper.scrape_events(start_date, end_date, engine=engine)
+    finally:
+        os.chdir(cwd)
+    if not success:
+        raise RuntimeError(events_data.get("error", "Recording scrape failed"))
+
+    pages = dict(listing_pages)
+    for url in scraper._page_cache.urls():
+        entry = scraper._page_cache.get(url)
+        if entry is not None:
+            pages[url] = entry["body"]
+
+    saved = 0
+    for url, body in pages.items():
+        if not url.startswith(LIVE_HOST):
+            print(f"Skipping page outside {LIVE_HOST}: {url}")
+            continue
+        page_path = page_file(pages_dir, url)
+        page_path.parent.mkdir(parents=True, exist_ok=True)
+        page_path.write_text(body, encoding="utf-8")
+        saved += 1
+    return saved
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record and replay calendar page fixtures")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record = commands.add_parser("record", help="Save the pages of a live scrape")
+    record.add_argument("pages_dir", help="Directory to save pages to")
+    record.add_argument("start_date", help="Start date (YYYY-MM-DD)")
+    record.add_argument("end_date", help="End date (YYYY-MM-DD)")
+    record.add_argument("--engine", default="http", help="Engine used for the recording run")
+
+    serve = commands.add_parser("serve", help="Replay recorded pages until interrupted")
+    serve.add_argument("pages_dir", help="Directory of recorded pages")
+    serve.add_argument("--port", type=int, default=8000, help="Port to listen on")
+    serve.add_argument("--latency-ms", type=float, default=0.0, help="Delay added to every response")
+
+    args = parser.parse_args()
+
+    if args.command == "record":
+        saved = record_pages(
+            args.pages_dir,
+            datetime.date.fromisoformat(args.start_date),
+            datetime.date.fromisoformat(args.end_date),
+            args.engine
+        )
+        print(f"Saved {saved} pages to {args.pages_dir}")
+        return
+
+    with ReplayServer(args.pages_dir, args.latency_ms, args.port) as server:
+        print(f"Replaying {server.pages_dir} at {server.base_url} (latency {args.latency_ms:.0f}ms)")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+# app/benchmarks/scraper_engines.py
+"""
+Benchmark the scraping engines on recorded calendar pages
+
+Pages recorded with ``benchmarks.fixtures record`` are replayed from a local
+HTTP server, so every engine sees identical content and network timing.
+Results (events/sec, browser startup, listing parse time and detail fetch
+latency percentiles) are printed and saved as JSON to track regressions.
+
+Usage (from the src directory):
+    python -m benchmarks.scraper_engines recorded_pages 2025-07-21 2025-08-04
+
+Selenium can be run with either browser profile, e.g.
+``--engines selenium:lean,selenium:full``.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+# Make the app modules importable when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.scraper import EventScraper
+from benchmarks.fixtures import ReplayServer
+
+
+def measure_browser_startup(browser_profile: Optional[str] = None) -> Optional[float]:
+    """Start and quit one Chrome outside the pool; returns startup time in ms, or None if Chrome is unavailable"""
+    scraper = EventScraper()
+    if browser_profile:
+        scraper.browser_profile = browser_profile
+    try:
+        started = time.perf_counter()
+        driver = scraper._create_driver()
+        elapsed = time.perf_counter() - started
+    except Exception as e:
+        print(f"Could not start Chrome: {e}")
+        return None
+    driver.quit()
+    return round(elapsed * 1000, 1)
+
+
+def run_engine(engine: str, server: ReplayServer, start_date: datetime.date, end_date: datetime.date) -> Dict[str, Any]:
+    """Run one scrape with the given engine ("selenium:full" picks a browser profile) and return timing results"""
+    label = engine
+    engine, _, browser_profile = engine.partition(":")
+    scraper = EventScraper()
+    # Every run fetches every page so engines are compared like for like
+    scraper.use_page_cache = False
+    scraper.use_day_cache = False
+    if browser_profile:
+        scraper.browser_profile = browser_profile
+    server.configure(scraper)
+
+    started = time.perf_counter()
+    success, events_data = scraper.scrape_events(start_date, end_date, engine=engine)
+    elapsed = time.perf_counter() - started
+
+    event_count = len(events_data.get("cte_events", [])) + len(events_data.get("elp_events", [])) if success else 0
+    stats = events_data.get("scrape_stats", {}) if success else {}
+    browser = stats.get("browser", {})
+    return {
+        "engine": label,
+        "success": success,
+        "error": None if success else events_data.get("error"),
+        "seconds": round(elapsed, 3),
+        "events": event_count,
+        "events_per_second": round(event_count / elapsed, 2) if elapsed > 0 else 0.0,
+        "browser_startup_ms": measure_browser_startup(browser_profile) if engine == "selenium" else None,
+        "browser_bytes": browser.get("bytes_transferred"),
+        "avg_page_load_ms": browser.get("avg_load_ms"),
+        "listing_parse": stats.get("timings", {}).get("listing_parse"),
+        "detail_fetch": stats.get("timings", {}).get("detail_fetch"),
+    }
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    """One summary line per engine"""
+    line = (f"{result['engine']:>14}: {result['seconds']:>8.2f}s  "
+            f"{result['events']:>4} events  {result['events_per_second']:>7.2f} events/s  "
+            f"success={result['success']}")
+    if result["listing_parse"]:
+        line += f"  parse p50 {result['listing_parse']['p50_ms']}ms"
+    if result["detail_fetch"]:
+        line += (f"  detail p50/p90/p99 {result['detail_fetch']['p50_ms']}/"
+                 f"{result['detail_fetch']['p90_ms']}/{result['detail_fetch']['p99_ms']}ms")
+    if result["browser_startup_ms"] is not None:
+        line += f"  startup {result['browser_startup_ms']}ms"
+    if result["browser_bytes"] is not None:
+        line += f"  {result['browser_bytes']} bytes  {result['avg_page_load_ms']}ms/page"
+    return line
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scraping engines on recorded pages")
+    parser.add_argument("pages_dir", help="Directory of recorded pages")
+    parser.add_argument("start_date", help="Start date (YYYY-MM-DD)")
+    parser.add_argument("end_date", help="End date (YYYY-MM-DD)")
+    parser.add_argument("--engines", default="http,selenium", help="Comma-separated engines to run")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay the replay server adds to every response")
+    parser.add_argument("--output", help="JSON results file (default: benchmark_results/<timestamp>.json)")
+    args = parser.parse_args()
+
+    start_date = datetime.date.fromisoformat(args.start_date)
+    end_date = datetime.date.fromisoformat(args.end_date)
+    run_at = datetime.datetime.now()
+    output = Path(args.output or f"benchmark_results/{run_at:%Y%m%d-%H%M%S}.json").resolve()
+    pages_dir = Path(args.pages_dir).resolve()
+
+    # The scraper writes events.json to the working directory; keep it out of the app's copy
+    os.chdir(tempfile.mkdtemp(prefix="scraper_bench_"))
+
+    results = []
+    with ReplayServer(str(pages_dir), args.latency_ms) as server:
+        for engine in args.engines.split(","):
+            result = run_engine(engine.strip(), server, start_date, end_date)
+            print(format_result(result))
+            results.append(result)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({
+            "run_at": run_at.isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pages_dir": str(pages_dir),
+            "date_range": {"start_date": args.start_date, "end_date": args.end_date},
+            "latency_ms": args.latency_ms,
+            "results": results
+        }, f, indent=2)
+    print(f"Results saved to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,9 @@ import pandas as pd
 import logging
 from typing import List, Dict, Any, Tuple
 
+from utils.date_normalizer import DateNormalizer
+from services.detail_hydrator import get_detail_hydrator, pending_events
+
 logger = logging.getLogger("tamu_newsletter")
 
 class EventEditor:
@@ -32,6 +35,14 @@ class EventEditor:
         st.subheader("📝 Review and Edit Events")
         st.info("Review the scraped events below. You can edit missing or incorrect information before proceeding to categorization.")
         
+        # Pick up details the background hydrator fetched since the last rerun (lazy scrapes)
+        if pending_events(events_data):
+            hydrator = get_detail_hydrator()
+            hydrator.schedule(pending_events(events_data))
+            if hydrator.apply(events_data) and self.data_persistence:
+                self.data_persistence.save_events_data(events_data, create_backup=False)
+                logger.info("Saved details hydrated in the background")
+        
         # Create tabs for Summary, CTE and ELP events (Summary first and leftmost)
         summary_tab, cte_tab, elp_tab = st.tabs(["Summary", "CTE Events", "ELP Events"])
         
@@ -143,13 +154,18 @@ class EventEditor:
             current_missing_fields = self._get_missing_fields(event)
             
             # Simple expander with status icon - calculate fresh each time
-            status_icon = "⚠️" if current_missing_fields else "✅"
+            details_pending = bool(event.get("details_pending"))
+            status_icon = "⏳" if details_pending else "⚠️" if current_missing_fields else "✅"
             title = f"{status_icon} {event.get('event_name', 'Unnamed Event')}"
             
-            # Expand if has missing fields
-            with st.expander(title, expanded=bool(current_missing_fields)):
+            # Expand if has missing fields (pending details are not missing yet)
+            with st.expander(title, expanded=bool(current_missing_fields) and not details_pending):
+                if details_pending:
+                    st.info("⏳ Details are still loading in the background.")
+                    if st.button("⬇️ Fetch details now", key=f"hydrate_{section_key}_{original_idx}"):
+                        self._hydrate_event_now(event, section_key, original_idx)
                 # Show what's missing at the top
-                if current_missing_fields:
+                elif current_missing_fields:
                     st.warning(f"⚠️ Missing: {', '.join(current_missing_fields)}")
                 
                 # Render the editor and get the updated event
@@ -162,6 +178,23 @@ class EventEditor:
         
         return updated_events
     
+    def _hydrate_event_now(self, event: Dict[str, Any], section_key: str, event_idx: int):
+        """Fetch a pending event's detail page on demand and store the result"""
+        with st.spinner("Fetching event details..."):
+            hydrated = get_detail_hydrator().hydrate(event)
+        
+        if hydrated.get("details_pending"):
+            st.error("❌ Could not fetch the event page. Fill in the details by hand or try again.")
+            return
+        
+        events = st.session_state.events_data.get(f"{section_key}_events", [])
+        if event_idx < len(events):
+            events[event_idx] = hydrated
+        if self.data_persistence:
+            self.data_persistence.save_events_data(st.session_state.events_data, create_backup=False)
+        logger.info(f"Hydrated details on demand for {event.get('event_name', 'unknown')}")
+        st.rerun()
+    
     def _render_single_event_editor(self, event: Dict[str, Any], section_key: str, event_idx: int) -> Dict[str, Any]:
         """Render editor for a single event"""
         
@@ -268,6 +301,9 @@ class EventEditor:
                     'event_location': event_location,
                 }
                 
+                # Recompute the ISO start/end fields from the edited date and time
+                DateNormalizer.normalize_event(updated_event)
+                
                 # Only include registration link if not empty
                 if event_registration_link.strip():
                     updated_event['event_registration_link'] = event_registration_link
@@ -349,11 +385,24 @@ class EventEditor:
             missing_count = total_events - total_complete
             st.info(f"ℹ️ {missing_count} events have optional fields that could be filled in.")
         
+        # Show how many lazily scraped events are still waiting for their detail pages
+        pending_count = len([e for e in cte_events + elp_events if e.get("details_pending")])
+        if pending_count:
+            st.info(f"⏳ {pending_count} events are still loading their details in the background.")
+        
         # Show date range
         if events_data.get("date_range"):
             date_range = events_data["date_range"]
             st.info(f"📅 Date Range: {date_range.get('start_date')} to {date_range.get('end_date')}")
         
+        # Show what an incremental scrape reused
+        incremental_stats = events_data.get("scrape_stats", {}).get("incremental")
+        if incremental_stats:
+            st.info(
+                f"🔁 Incremental scrape: {incremental_stats['added']} added, {incremental_stats['changed']} changed, "
+                f"{incremental_stats['removed']} removed, {incremental_stats['reused']} reused"
+            )
+        
         # Show detailed breakdown
         st.subheader("📋 Event List")
         
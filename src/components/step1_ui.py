@@ -10,14 +10,17 @@ logger = logging.getLogger("tamu_newsletter")
 class Step1UI:
     """UI component for Step 1: Scraping Events"""
     
-    def __init__(self, scrape_callback: Callable):
+    def __init__(self, scrape_callback: Callable, coverage_callback: Optional[Callable] = None):
         """
         Initialize the Step 1 UI
         
         Args:
             scrape_callback: Callback function to execute when scraping is triggered
+            coverage_callback: Returns the day cache coverage of a date range per calendar
+                (see EventScraper.day_cache_coverage)
         """
         self.scrape_callback = scrape_callback
+        self.coverage_callback = coverage_callback
         # Import event editor here to avoid circular imports
         from components.event_editor import EventEditor
         self.event_editor = EventEditor()
@@ -45,15 +48,98 @@ class Step1UI:
             
             logger.info(f"Date inputs rendered: {start_date} to {end_date}")
             
+            incremental = st.checkbox(
+                "Only fetch new or changed events",
+                value=False,
+                help="Reuse events from the last saved scrape whose date, time and location are unchanged"
+            )
+            
+            resume = st.checkbox(
+                "Resume an interrupted scrape for these dates",
+                value=False,
+                help="Keep the events a failed scrape already fetched and only fetch the rest"
+            )
+            
+            lazy_details = st.checkbox(
+                "Load event details in the background",
+                value=False,
+                help="Show events as soon as the calendar listings are read; descriptions, facilitators "
+                     "and registration links are filled in afterwards or when you fetch them"
+            )
+            
+            refresh = st.checkbox(
+                "Scrape every day again",
+                value=False,
+                help="Ignore days already scraped recently and fetch the whole range from the calendars"
+            )
+            
+            if self.coverage_callback and not refresh and start_date <= end_date:
+                self._show_cache_coverage(self.coverage_callback(start_date, end_date, lazy_details))
+            
             if st.button("Scrape Events"):
                 logger.info("Scrape Events button clicked")
                 with st.spinner("Scraping events... This may take a few minutes."):
-                    # Call the scrape callback function
-                    self.scrape_callback(start_date, end_date)
+                    # Call the scrape callback function; events appear in the table as they arrive
+                    self.scrape_callback(start_date, end_date, incremental, on_update=self._live_event_table(),
+                                         resume=resume, lazy_details=lazy_details, refresh=refresh)
         
         # Display events data if step 1 is complete
         self._display_events_if_complete()
     
+    def _show_cache_coverage(self, coverage: Dict[str, Dict[str, Any]]):
+        """Show how many days of the range each calendar will serve from the day cache"""
+        import streamlit as st
+        
+        cached = sum(source["cached_days"] for source in coverage.values())
+        total = sum(source["total_days"] for source in coverage.values())
+        if not cached:
+            st.caption("No recently scraped days in this range; every day will be fetched.")
+            return
+        
+        oldest = min(source["oldest"] for source in coverage.values() if source["oldest"])
+        details = ", ".join(
+            f"{source['label']} {source['cached_days']}/{source['total_days']} days" for source in coverage.values()
+        )
+        st.info(f"📦 {cached} of {total} calendar-days already scraped (oldest at {oldest.replace('T', ' ')}); "
+                f"only the remaining {total - cached} will be fetched. {details}")
+    
+    def _live_event_table(self) -> Callable[[Dict[str, Any]], None]:
+        """
+        Create placeholders for a progress bar and event table filled while scraping
+        
+        Returns:
+            Update handler for the scrape callback
+        """
+        import streamlit as st
+        
+        progress_bar = st.progress(0.0, text="Reading calendar listings...")
+        table = st.empty()
+        rows = []
+        
+        def on_update(update: Dict[str, Any]):
+            if update["type"] == "event":
+                event = update["event"]
+                rows.append({
+                    "Calendar": update["label"],
+                    "Event": event.get("event_name", ""),
+                    "Date": event.get("event_date", ""),
+                    "Time": event.get("event_time", ""),
+                    "Location": event.get("event_location", "")
+                })
+                progress = update["progress"]
+                fraction = progress["completed"] / progress["total"] if progress["total"] else 0.0
+                progress_bar.progress(
+                    min(fraction, 1.0),
+                    text=f"Fetched {progress['completed']} of {progress['total']} events found so far"
+                )
+                table.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+            elif update["type"] == "source_complete":
+                logger.info(f"{update['label']} finished with {update['events']} events")
+            elif update["type"] in ("complete", "error"):
+                progress_bar.empty()
+        
+        return on_update
+    
     def _display_events_if_complete(self):
         """Display events data if Step 1 is complete"""
         # Import streamlit only when needed
@@ -0,0 +1,209 @@
+# app/services/calendar_feed.py
+import json
+import datetime
+import logging
+from typing import Dict, List, Any, Optional
+from zoneinfo import ZoneInfo
+
+import lxml.html
+
+from .calendar_parser import CalendarPageParser
+
+# Get logger
+logger = logging.getLogger("tamu_newsletter")
+
+class CalendarFeedParser:
+    """
+    Converts LiveWhale JSON and iCal feeds into scraper event dicts
+
+    One feed response carries the title, times, location, URL and description
+    of every event, so no detail pages need to be visited.
+    """
+
+    def __init__(self, timezone: str = "America/Chicago"):
+        """
+        Initialize the feed parser
+
+        Args:
+            timezone: Time zone used to render event dates and times
+        """
+        self.timezone = ZoneInfo(timezone)
+        self.page_parser = CalendarPageParser()
+
+    def parse(self, text: str, feed_format: str) -> List[Dict[str, Any]]:
+        """
+        Parse a feed body
+
+        Args:
+            text: Raw feed body
+            feed_format: "json" or "ics"
+
+        Returns:
+            List of event dicts in the scraper schema
+        """
+        if feed_format == "ics":
+            return self.parse_ics(text)
+        return self.parse_json(text)
+
+    def parse_json(self, text: str) -> List[Dict[str, Any]]:
+        """Parse a LiveWhale JSON events feed"""
+        data = json.loads(text) if text else []
+        # Widget responses wrap the list in {"data": [...]}
+        if isinstance(data, dict):
+            data = data.get("data", [])
+
+        events = []
+        for item in data:
+            try:
+                start = self._parse_json_datetime(item, "date")
+                end = self._parse_json_datetime(item, "date2")
+                events.append(self._build_event(
+                    title=item.get("title", ""),
+                    url=item.get("url", ""),
+                    start=start,
+                    end=end,
+                    all_day=bool(item.get("is_all_day")),
+                    location=item.get("location", "") or "",
+                    description_html=item.get("description") or item.get("summary") or "",
+                    registration_link=item.get("online_url", "") or ""
+                ))
+            except Exception as e:
+                logger.warning(f"Skipping feed item {item.get('title', 'unknown')}: {e}")
+        return events
+
+    def parse_ics(self, text: str) -> List[Dict[str, Any]]:
+        """Parse a LiveWhale iCal feed"""
+        events = []
+        for component in self._read_vevents(text or ""):
+            try:
+                start, all_day = self._parse_ics_datetime(component.get("DTSTART"))
+                end, _ = self._parse_ics_datetime(component.get("DTEND"))
+                events.append(self._build_event(
+                    title=self._ics_value(component.get("SUMMARY")),
+                    url=self._ics_value(component.get("URL")),
+                    start=start,
+                    end=end,
+                    all_day=all_day,
+                    location=self._ics_value(component.get("LOCATION")),
+                    description_html=self._ics_value(component.get("X-ALT-DESC")) or self._ics_value(component.get("DESCRIPTION")),
+                    registration_link=""
+                ))
+            except Exception as e:
+                logger.warning(f"Skipping iCal event {self._ics_value(component.get('SUMMARY'))}: {e}")
+        return events
+
+    def _build_event(self, title: str, url: str, start: Optional[datetime.datetime], end: Optional[datetime.datetime],
+                     all_day: bool, location: str, description_html: str, registration_link: str) -> Dict[str, Any]:
+        """Build an event dict with display strings matching the listing pages"""
+        event_date = ""
+        event_time = ""
+        if start:
+            start = start.astimezone(self.timezone) if start.tzinfo else start.replace(tzinfo=self.timezone)
+            event_date = f"{start:%A}, {start:%B} {start.day}, {start.year}"
+            if all_day:
+                event_time = "All day"
+            else:
+                event_time = self._format_time(start)
+                if end:
+                    end = end.astimezone(self.timezone) if end.tzinfo else end.replace(tzinfo=self.timezone)
+                    event_time += f" - {self._format_time(end)}"
+                event_time += f" {start.tzname()}"
+
+        description_text = self._html_to_text(description_html)
+        facilitators, description = self.page_parser.parse_intro_text(description_text)
+
+        return {
+            "event_name": " ".join((title or "").split()),
+            "event_link": url or "",
+            "event_date": event_date,
+            "event_time": event_time,
+            "event_location": " ".join(location.split()),
+            "event_facilitators": facilitators,
+            "event_registration_link": registration_link,
+            "event_description": description or description_text
+        }
+
+    def _format_time(self, value: datetime.datetime) -> str:
+        """Format a time the way LiveWhale listings do, e.g. 11:30am"""
+        hour = value.hour % 12 or 12
+        return f"{hour}:{value.minute:02d}{'am' if value.hour < 12 else 'pm'}"
+
+    def _html_to_text(self, html: str) -> str:
+        """Convert a feed description (HTML or plain text) to text"""
+        if not html or not html.strip():
+            return ""
+        if "<" not in html:
+            return html.strip()
+        return self.page_parser.block_text(lxml.html.fragment_fromstring(html, create_parent="div"))
+
+    def _parse_json_datetime(self, item: Dict[str, Any], prefix: str) -> Optional[datetime.datetime]:
+        """Read a start/end timestamp from a JSON feed item"""
+        iso_value = item.get(f"{prefix}_iso")
+        if iso_value:
+            return datetime.datetime.fromisoformat(iso_value)
+
+        utc_value = item.get(f"{prefix}_utc")
+        if utc_value:
+            return datetime.datetime.fromisoformat(utc_value).replace(tzinfo=datetime.timezone.utc)
+
+        local_value = item.get(prefix)
+        if local_value:
+            return datetime.datetime.fromisoformat(local_value)
+
+        return None
+
+    def _read_vevents(self, text: str) -> List[Dict[str, Any]]:
+        """Split an iCal body into VEVENT property maps"""
+        # Unfold continuation lines (RFC 5545 3.1)
+        lines = []
+        for raw_line in text.splitlines():
+            if raw_line[:1] in (" ", "\t") and lines:
+                lines[-1] += raw_line[1:]
+            else:
+                lines.append(raw_line)
+
+        components = []
+        current = None
+        for line in lines:
+            if line == "BEGIN:VEVENT":
+                current = {}
+            elif line == "END:VEVENT":
+                if current is not None:
+                    components.append(current)
+                current = None
+            elif current is not None and ":" in line:
+                name_and_params, value = line.split(":", 1)
+                name, _, params = name_and_params.partition(";")
+                current[name.upper()] = (params, value)
+        return components
+
+    def _ics_value(self, prop) -> str:
+        """Unescape an iCal text value"""
+        if not prop:
+            return ""
+        value = prop[1]
+        return (value.replace("\\n", "\n").replace("\\N", "\n")
+                .replace("\\,", ",").replace("\\;", ";").replace("\\\\", "\\"))
+
+    def _parse_ics_datetime(self, prop) -> tuple:
+        """
+        Parse a DTSTART/DTEND property
+
+        Returns:
+            Tuple of (datetime or None, is_all_day)
+        """
+        if not prop:
+            return None, False
+
+        params, value = prop
+        param_map = dict(p.split("=", 1) for p in params.split(";") if "=" in p)
+
+        if param_map.get("VALUE") == "DATE" or len(value) == 8:
+            return datetime.datetime.strptime(value, "%Y%m%d"), True
+
+        if value.endswith("Z"):
+            return datetime.datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(tzinfo=datetime.timezone.utc), False
+
+        parsed = datetime.datetime.strptime(value, "%Y%m%dT%H%M%S")
+        tzid = param_map.get("TZID")
+        return parsed.replace(tzinfo=ZoneInfo(tzid) if tzid else self.timezone), False
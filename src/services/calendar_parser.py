@@ -0,0 +1,380 @@
+# app/services/calendar_parser.py
+import re
+import json
+import logging
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import urljoin
+
+import lxml.html
+
+# Get logger
+logger = logging.getLogger("tamu_newsletter")
+
+# Listing selectors; calendar sources may override any of them
+DEFAULT_SELECTORS = {
+    "card": "lw_cal_event",      # class of each event card
+    "title": ".//h4//a",         # XPath (relative to the card) of the title link
+    "date_time": "date-time",    # class of the "date · time" element
+    "location": "map-marker",    # class of the location element
+    # XPath of links to further pages of the same listing (paginated or "load more" views)
+    "pagination": "//*[contains(@class, 'lw_paginate') or contains(@class, 'lw_cal_next')]//a[@href] | //a[@rel='next'][@href]",
+    # XPath of the listing container or its empty-state marker, present on a server-rendered
+    # listing even when it has no events in the range
+    "listing": "//*[contains(@class, 'lw_cal_event_list') or contains(@class, 'lw_widget_events')"
+               " or contains(@class, 'lw_cal_no_events') or contains(@class, 'lw_widget_empty')]"
+}
+
+# "Facilitators: ... Description: ..." intro text
+INTRO_FACILITATORS = re.compile(r'Facilitator[s]?:\s*(.*?)(?:\s*Description:|$)', re.DOTALL)
+INTRO_DESCRIPTION = re.compile(r'Description:\s*(.*?)$', re.DOTALL)
+# Facilitator lines anywhere in the page text, tried in order
+BODY_FACILITATOR_PATTERNS = [
+    re.compile(r'Facilitator[s]?:\s*(.*?)(?:\n|Description:)', re.DOTALL),
+    re.compile(r'Presenter[s]?:\s*(.*?)(?:\n|Description:)', re.DOTALL),
+    re.compile(r'Instructor[s]?:\s*(.*?)(?:\n|Description:)', re.DOTALL)
+]
+
+# Detail extraction strategies, in the order they are tried
+DETAIL_STRATEGIES = ("json_ld", "intro", "description", "body_text")
+# CSS selector of the detail page nodes those strategies read; a browser can parse the page once one exists
+DETAIL_READY_SELECTOR = "script[type='application/ld+json'], .intro, .lw_calendar_event_description"
+
+# Tags that Selenium's .text renders on their own line
+BLOCK_TAGS = {"p", "div", "li", "ul", "ol", "h1", "h2", "h3", "h4", "h5", "h6", "tr", "section", "article"}
+
+class CalendarPageParser:
+    """
+    Parses LiveWhale listing and detail pages from raw HTML
+
+    Produces the same event dicts as the Selenium scraper so both engines
+    can be used interchangeably.
+    """
+
+    def parse_listing(self, html: str, base_url: str, selectors: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """
+        Parse the event cards of a LiveWhale listing page
+
+        Args:
+            html: Listing page HTML
+            base_url: URL the page was loaded from (used to resolve relative links)
+            selectors: Overrides for DEFAULT_SELECTORS
+
+        Returns:
+            List of listing-level event dicts (detail fields left empty)
+        """
+        events, _ = self.parse_listing_page(html, base_url, selectors)
+        return events
+
+    def parse_listing_page(self, html: str, base_url: str,
+                           selectors: Optional[Dict[str, str]] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Parse the event cards and the links to further pages of a listing page in one pass
+
+        Args:
+            html: Listing page HTML
+            base_url: URL the page was loaded from (used to resolve relative links)
+            selectors: Overrides for DEFAULT_SELECTORS
+
+        Returns:
+            Tuple of (listing-level event dicts, absolute URLs of further listing pages)
+        """
+        if not html:
+            return [], []
+
+        selectors = self.listing_selectors(selectors)
+        tree = lxml.html.fromstring(html)
+        return self._parse_cards(tree, base_url, selectors), self._parse_page_links(tree, base_url, selectors)
+
+    def _parse_cards(self, tree, base_url: str, selectors: Dict[str, str]) -> List[Dict[str, Any]]:
+        """Listing-level event dicts for every card in a parsed listing page"""
+        events = []
+
+        for i, card in enumerate(tree.find_class(selectors["card"])):
+            title_elements = card.xpath(selectors["title"])
+            if not title_elements:
+                logger.warning(f"No title found for event {i+1}")
+                continue
+
+            title_element = title_elements[0]
+            event_name = self._inline_text(title_element)
+            event_link = title_element.get("href", "")
+            if event_link:
+                event_link = urljoin(base_url, event_link)
+
+            if not event_name:
+                logger.warning(f"Empty event name for event {i+1}")
+                continue
+
+            # Get date/time
+            date_time_elements = card.find_class(selectors["date_time"])
+            date_time = self._inline_text(date_time_elements[0]) if date_time_elements else ""
+            if date_time:
+                event_date = date_time.split("·")[0].strip() if "·" in date_time else date_time
+                event_time = date_time.split("·")[1].strip() if "·" in date_time else ""
+            else:
+                logger.warning(f"No date-time for event: {event_name}")
+                event_date = ""
+                event_time = ""
+
+            # Get location
+            location_elements = card.find_class(selectors["location"])
+            location = self._inline_text(location_elements[0]) if location_elements else ""
+
+            events.append({
+                "event_name": event_name,
+                "event_link": event_link,
+                "event_date": event_date,
+                "event_time": event_time,
+                "event_location": location,
+                "event_facilitators": "",
+                "event_registration_link": "",
+                "event_description": ""
+            })
+
+        return events
+
+    def _parse_page_links(self, tree, base_url: str, selectors: Dict[str, str]) -> List[str]:
+        """Absolute URLs of pagination links, in page order without repeats or fragments"""
+        links = []
+        for element in tree.xpath(selectors["pagination"]):
+            link = urljoin(base_url, element.get("href", "")).split("#")[0]
+            if link and link != base_url and link not in links:
+                links.append(link)
+        return links
+
+    def parse_detail(self, html: str, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fill the detail fields of an event from its detail page HTML
+
+        Args:
+            html: Detail page HTML
+            event: Event dict to update
+
+        Returns:
+            The updated event dict
+        """
+        event, _ = self.extract_detail(html, event)
+        return event
+
+    def extract_detail(self, html: str, event: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Fill the detail fields of an event from one parse of its detail page
+
+        schema.org Event JSON-LD is read first when the page has it; the
+        .intro div, the description div and the whole page text then fill
+        whatever is still missing.
+
+        Args:
+            html: Detail page HTML
+            event: Event dict to update
+
+        Returns:
+            Tuple of (updated event, names of the strategies that supplied a field)
+        """
+        if not html:
+            return event, []
+
+        tree = lxml.html.fromstring(html)
+        strategies = []
+
+        # Get registration link if available
+        reg_elements = tree.find_class("lw_join_online")
+        if reg_elements:
+            reg_link = reg_elements[0].get("href")
+            if reg_link:
+                event["event_registration_link"] = reg_link
+
+        # Strategy 1: schema.org Event JSON-LD
+        json_ld = self._find_json_ld_event(tree)
+        if json_ld and self._apply_json_ld(json_ld, event):
+            strategies.append("json_ld")
+
+        # Strategy 2: the intro div ("Facilitators: ... Description: ...")
+        if not (event.get("event_facilitators") and event.get("event_description")):
+            intro_elements = tree.find_class("intro")
+            if intro_elements:
+                intro_text = self.block_text(intro_elements[0])
+                if intro_text:
+                    facilitators, description = self.parse_intro_text(intro_text)
+                    supplied = False
+                    if facilitators and not event.get("event_facilitators"):
+                        event["event_facilitators"] = facilitators
+                        supplied = True
+                    if description and not event.get("event_description"):
+                        event["event_description"] = description
+                        supplied = True
+                    if supplied:
+                        strategies.append("intro")
+
+        # Strategy 3: the description div
+        if not event.get("event_description"):
+            desc_elements = tree.find_class("lw_calendar_event_description")
+            if desc_elements:
+                desc_text = self.block_text(desc_elements[0])
+                if desc_text:
+                    event["event_description"] = desc_text.strip()
+                    strategies.append("description")
+
+        # Strategy 4: facilitator lines anywhere in the page text
+        if not event.get("event_facilitators"):
+            body = tree.find("body")
+            page_content = self.block_text(body) if body is not None else ""
+            if page_content:
+                for pattern in BODY_FACILITATOR_PATTERNS:
+                    match = pattern.search(page_content)
+                    if match:
+                        event["event_facilitators"] = match.group(1).strip()
+                        strategies.append("body_text")
+                        break
+
+        return event, strategies
+
+    def parse_intro_text(self, text: str) -> Tuple[str, str]:
+        """
+        Split "Facilitators: ... Description: ..." text into its two parts
+
+        Returns:
+            Tuple of (facilitators, description), empty strings when absent
+        """
+        facilitators = ""
+        description = ""
+
+        facilitator_match = INTRO_FACILITATORS.search(text)
+        if facilitator_match:
+            facilitators = facilitator_match.group(1).strip()
+
+        description_match = INTRO_DESCRIPTION.search(text)
+        if description_match:
+            description = description_match.group(1).strip()
+
+        return facilitators, description
+
+    def listing_selectors(self, selectors: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """Merge source-specific selector overrides into the defaults"""
+        return {**DEFAULT_SELECTORS, **(selectors or {})}
+
+    def needs_javascript(self, html: Optional[str], selectors: Optional[Dict[str, str]] = None) -> bool:
+        """Return True if a listing page was not rendered server-side (see listing_rendered)"""
+        return not self.listing_rendered(html, selectors)
+
+    def listing_rendered(self, html: Optional[str], selectors: Optional[Dict[str, str]] = None) -> bool:
+        """
+        Whether a page holds a rendered LiveWhale listing
+
+        A listing with no events in the range is still rendered: it has the
+        listing container or the empty-state marker instead of event cards.
+        """
+        if not html:
+            return False
+        selectors = self.listing_selectors(selectors)
+        if selectors["card"] in html:
+            return True
+        try:
+            tree = lxml.html.fromstring(html)
+        except (lxml.etree.ParserError, ValueError):
+            return False
+        return bool(tree.xpath(selectors["listing"]))
+
+    def block_text(self, element) -> str:
+        """
+        Approximate Selenium's rendered .text for an element
+
+        Line breaks are kept for <br> and block-level tags, runs of
+        whitespace inside a line are collapsed and script/style content is dropped.
+        """
+        parts = []
+
+        def walk(node):
+            if not isinstance(node.tag, str) or node.tag in ("script", "style", "noscript"):
+                if node.tail:
+                    parts.append(node.tail)
+                return
+            is_block = node.tag in BLOCK_TAGS
+            if is_block:
+                parts.append("\n")
+            if node.tag == "br":
+                parts.append("\n")
+            if node.text:
+                parts.append(node.text)
+            for child in node:
+                walk(child)
+            if is_block:
+                parts.append("\n")
+            if node.tail:
+                parts.append(node.tail)
+
+        # The element's own tail belongs to its parent
+        tail = element.tail
+        element.tail = None
+        try:
+            walk(element)
+        finally:
+            element.tail = tail
+
+        lines = [" ".join(line.split()) for line in "".join(parts).split("\n")]
+        return "\n".join(line for line in lines if line)
+
+    def _find_json_ld_event(self, tree) -> Optional[Dict[str, Any]]:
+        """Return the first schema.org Event object in the page's JSON-LD blocks"""
+        for script in tree.xpath('//script[@type="application/ld+json"]'):
+            try:
+                data = json.loads(script.text or "")
+            except ValueError:
+                continue
+
+            candidates = data if isinstance(data, list) else [data]
+            for candidate in list(candidates):
+                if isinstance(candidate, dict) and isinstance(candidate.get("@graph"), list):
+                    candidates.extend(candidate["@graph"])
+
+            for candidate in candidates:
+                if not isinstance(candidate, dict):
+                    continue
+                types = candidate.get("@type")
+                types = types if isinstance(types, list) else [types]
+                # Covers subtypes such as EducationEvent
+                if any(isinstance(t, str) and t.endswith("Event") for t in types):
+                    return candidate
+        return None
+
+    def _apply_json_ld(self, data: Dict[str, Any], event: Dict[str, Any]) -> bool:
+        """Copy JSON-LD fields into empty event fields; returns True if any field was filled"""
+        supplied = False
+
+        description = data.get("description") or ""
+        if "<" in description:
+            description = self.block_text(lxml.html.fragment_fromstring(description, create_parent="div"))
+        description = description.strip()
+        if description:
+            # LiveWhale descriptions often start with the same intro as the page
+            facilitators, intro_description = self.parse_intro_text(description)
+            if facilitators and not event.get("event_facilitators"):
+                event["event_facilitators"] = facilitators
+                supplied = True
+            if not event.get("event_description"):
+                event["event_description"] = intro_description or description
+                supplied = True
+
+        if not event.get("event_facilitators"):
+            people = data.get("performer") or []
+            people = people if isinstance(people, list) else [people]
+            names = [p.get("name", "").strip() if isinstance(p, dict) else str(p).strip() for p in people]
+            names = [name for name in names if name]
+            if names:
+                event["event_facilitators"] = "\n".join(names)
+                supplied = True
+
+        if not event.get("event_registration_link"):
+            offers = data.get("offers") or []
+            offers = offers if isinstance(offers, list) else [offers]
+            for offer in offers:
+                if isinstance(offer, dict) and offer.get("url"):
+                    event["event_registration_link"] = offer["url"]
+                    supplied = True
+                    break
+
+        return supplied
+
+    def _inline_text(self, element) -> str:
+        """Get the whitespace-normalized text of an inline element"""
+        return " ".join(element.text_content().split())
@@ -0,0 +1,131 @@
+# app/services/calendar_sources.py
+import json
+import logging
+from typing import Dict, List, Any, Optional
+from pathlib import Path
+
+# Get logger
+logger = logging.getLogger("tamu_newsletter")
+
+# Newsletter sections a source can feed; each maps to "<section>_events" in events.json
+SECTIONS = ("cte", "elp")
+
+DEFAULT_SOURCES = [
+    {
+        "name": "cte",
+        "label": "CTE",
+        "url": "https://calendar.tamu.edu/cte/all",
+        "feed_url": "https://calendar.tamu.edu/live/json/events/group/cte/start_date/{start_date}/end_date/{end_date}",
+        "section": "cte",
+        "engine": None,
+        "selectors": {}
+    },
+    {
+        "name": "elp",
+        "label": "ELP",
+        "url": "https://calendar.tamu.edu/elp/all",
+        "feed_url": "https://calendar.tamu.edu/live/json/events/group/elp/start_date/{start_date}/end_date/{end_date}",
+        "section": "elp",
+        "engine": None,
+        "selectors": {}
+    }
+]
+
+def events_by_source(events_data: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Group the section lists in events_data by the source each event came from
+
+    The section lists are the only copy saved in events.json, so edits made in
+    the editor show up here too. Events without a source (added by hand) are
+    grouped under their section's name.
+
+    Returns:
+        Source name -> events, in section then listing order
+    """
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    for section in SECTIONS:
+        for event in events_data.get(f"{section}_events") or []:
+            grouped.setdefault(event.get("source") or section, []).append(event)
+    return grouped
+
+class CalendarSourceRegistry:
+    """
+    Registry of the calendars the scraper reads
+
+    Each source has a name, display label, listing URL, optional feed URL,
+    the newsletter section its events belong to, an optional engine
+    override and optional listing selector overrides.
+    """
+
+    def __init__(self, sources: Optional[List[Dict[str, Any]]] = None):
+        """
+        Initialize the registry
+
+        Args:
+            sources: Source definitions (defaults to the CTE and ELP calendars)
+        """
+        self._sources: Dict[str, Dict[str, Any]] = {}
+        for source in (sources if sources is not None else DEFAULT_SOURCES):
+            self.register(**source)
+
+    @classmethod
+    def load(cls, path: str = "calendar_sources.json") -> "CalendarSourceRegistry":
+        """
+        Load sources from a JSON file (a list of source definitions)
+
+        Falls back to the default CTE/ELP sources when the file is missing or invalid.
+        """
+        try:
+            if Path(path).exists():
+                with open(path, "r", encoding="utf-8") as f:
+                    sources = json.load(f)
+                logger.info(f"Loaded {len(sources)} calendar sources from {path}")
+                return cls(sources)
+        except Exception as e:
+            logger.error(f"Error loading calendar sources from {path}: {e}")
+        return cls()
+
+    def register(self, name: str, url: str, label: Optional[str] = None, section: str = "cte",
+                 engine: Optional[str] = None, feed_url: Optional[str] = None,
+                 selectors: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Add or replace a calendar source
+
+        Args:
+            name: Unique key, stored as each scraped event's "source"
+            url: Listing URL
+            label: Display name (defaults to the upper-cased name)
+            section: Newsletter section the events are merged into ("cte" or "elp")
+            engine: Engine override for this source (None uses the run's engine)
+            feed_url: LiveWhale feed URL template for the feed engine
+            selectors: Listing selector overrides (see CalendarPageParser)
+
+        Returns:
+            The registered source definition
+        """
+        if section not in SECTIONS:
+            raise ValueError(f"Unknown newsletter section '{section}' for source '{name}'")
+
+        source = {
+            "name": name,
+            "label": label or name.upper(),
+            "url": url,
+            "feed_url": feed_url,
+            "section": section,
+            "engine": engine,
+            "selectors": selectors or {}
+        }
+        self._sources[name] = source
+        return source
+
+    def unregister(self, name: str):
+        """Remove a calendar source if present"""
+        self._sources.pop(name, None)
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get a source definition by name"""
+        return self._sources.get(name)
+
+    def all(self) -> List[Dict[str, Any]]:
+        """Get every source in registration order"""
+        return list(self._sources.values())
@@ -11,6 +11,9 @@ from google.oauth2.service_account import Credentials
 from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
 
+from utils.date_normalizer import DateNormalizer
+from .detail_hydrator import get_detail_hydrator, pending_events
+
 # Get logger
 logger = logging.getLogger("tamu_newsletter")
 
@@ -291,6 +294,11 @@ class EventCategorizer:
             if not data:
                 raise Exception("Failed to load events data. Make sure events.json exists.")
             
+            # Descriptions are read below, so events from a lazy scrape need their detail pages first
+            if pending_events(data):
+                logger.info(f"Hydrating {len(pending_events(data))} events with pending details...")
+                get_detail_hydrator().apply(data, wait=True)
+            
             # Extract event lists and separate weekly events
             cte_events, cte_weekly_events = self._separate_weekly_events(data.get("cte_events", []))
             elp_events, elp_weekly_events = self._separate_weekly_events(data.get("elp_events", []))
@@ -745,7 +753,7 @@ class EventCategorizer:
         days = set()
         times = set()
         for event in weekly_group["events"]:
-            day = event.get("event_date", "").split(",")[0].strip()
+            day = self._event_weekday(event)
             time = event.get("event_time", "").split(" Weekly")[0].strip()
             if day:
                 days.add(day)
@@ -756,6 +764,14 @@ class EventCategorizer:
         schedule_hash = f"{len(days)}days_{len(times)}times"
         return f"{event_name}|{event_count}|{schedule_hash}"
     
+    def _event_weekday(self, event: Dict[str, Any]) -> str:
+        """Get the weekday name of an event (e.g. "Monday") from its normalized start date"""
+        event_day = DateNormalizer.event_day(event) if event.get("start") else None
+        if event_day:
+            return event_day.strftime("%A")
+        # Older records without "start": "Monday, June 9, 2025" -> "Monday"
+        return event.get("event_date", "").split(",")[0].strip()
+    
     def _generate_weekly_description_with_llm(self, weekly_event: Dict[str, Any], llm: ChatOpenAI) -> str:
         """Generate a description for a weekly event using LLM"""
         import time as time_module
@@ -815,7 +831,7 @@ class EventCategorizer:
         facilitators = set()
         
         for event in events:
-            day = event.get("event_date", "").split(",")[0].strip()
+            day = self._event_weekday(event)
             event_time = event.get("event_time", "").split(" Weekly")[0].strip()
             location = event.get("event_location", "").strip()
             facilitator = event.get("event_facilitators", "").strip()
@@ -0,0 +1,189 @@
+# app/services/detail_hydrator.py
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, Any, List, Optional, Callable
+
+logger = logging.getLogger("tamu_newsletter")
+
+# Fields only the detail page supplies; a lazy scrape leaves them for hydration
+DETAIL_FIELDS = ("event_facilitators", "event_registration_link", "event_description")
+
+def pending_events(events_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Events in events_data whose detail fields have not been fetched yet"""
+    return [event for events in _event_lists(events_data) for event in events if event.get("details_pending")]
+
+def _event_lists(events_data: Dict[str, Any]) -> List[List[Dict[str, Any]]]:
+    """Every event list in events_data (one per newsletter section)"""
+    return [events_data.get("cte_events") or [], events_data.get("elp_events") or []]
+
+
+class DetailHydrator:
+    """
+    Fetches detail pages for events scraped in lazy mode
+
+    Pending events are queued on a small background pool as soon as a lazy
+    scrape finishes. Anything that needs a pending event's details before its
+    turn (the editor's "Fetch details" button, categorization) fetches it on
+    the spot; each detail page is fetched at most once. Results are kept by
+    event link and merged into whichever copy of events_data asks for them.
+    """
+
+    def __init__(self, fetch_detail: Callable[[Dict[str, Any]], Dict[str, Any]], workers: int = 2):
+        """
+        Initialize the hydrator
+
+        Args:
+            fetch_detail: Callable taking a listing event and returning it with its detail fields
+            workers: Background detail fetches in flight at once
+        """
+        self.fetch_detail = fetch_detail
+        self.workers = workers
+        self._executor = None
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.stats = {"background": 0, "on_demand": 0, "failed": 0}
+
+    def schedule(self, events: List[Dict[str, Any]]) -> int:
+        """
+        Queue background fetches for pending events
+
+        Returns:
+            Number of detail pages newly queued
+        """
+        queued = 0
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=max(1, self.workers), thread_name_prefix="detail-hydrator")
+            for event in events:
+                link = event.get("event_link")
+                if not event.get("details_pending") or not link or link in self._futures:
+                    continue
+                self._futures[link] = self._executor.submit(self._fetch, dict(event), "background")
+                queued += 1
+        if queued:
+            logger.info(f"Queued {queued} detail pages for background hydration")
+        return queued
+
+    def hydrate(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get an event with its details now, waiting for a queued fetch or fetching on this thread
+
+        Returns:
+            A hydrated copy of the event, or the event unchanged if its page could not be fetched
+        """
+        link = event.get("event_link")
+        if not event.get("details_pending") or not link:
+            return event
+
+        owner = False
+        with self._lock:
+            future = self._futures.get(link)
+            # Jump the background queue rather than wait behind it
+            if future is not None and future.cancel():
+                future = None
+            if future is None:
+                future = Future()
+                self._futures[link] = future
+                owner = True
+
+        if owner:
+            future.set_result(self._fetch(dict(event), "on_demand"))
+        return self._merge(event, future.result())
+
+    def apply(self, events_data: Dict[str, Any], wait: bool = False) -> int:
+        """
+        Merge fetched details into every pending event of events_data, in place
+
+        Args:
+            events_data: Scraped events data (as saved to events.json)
+            wait: Fetch details that are not ready yet instead of leaving them pending
+
+        Returns:
+            Number of events hydrated
+        """
+        if not pending_events(events_data):
+            return 0
+
+        if wait:
+            pending = {event["event_link"]: event for event in pending_events(events_data) if event.get("event_link")}
+            with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(pending) or 1))) as executor:
+                results = dict(zip(pending, executor.map(self.hydrate, pending.values())))
+        else:
+            with self._lock:
+                results = {
+                    link: future.result()
+                    for link, future in self._futures.items()
+                    if future.done() and not future.cancelled()
+                }
+
+        hydrated = 0
+        for events in _event_lists(events_data):
+            for i, event in enumerate(events):
+                if not event.get("details_pending"):
+                    continue
+                result = results.get(event.get("event_link"))
+                if result is None or result.get("details_pending"):
+                    continue
+                events[i] = self._merge(event, result)
+                hydrated += 1
+        return hydrated
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Fetch counts and the number of detail pages still queued"""
+        with self._lock:
+            queued = sum(1 for future in self._futures.values() if not future.done())
+        return dict(self.stats, queued=queued)
+
+    def _fetch(self, event: Dict[str, Any], mode: str) -> Optional[Dict[str, Any]]:
+        """Fetch one detail page; a failure forgets the link so a later request retries it"""
+        try:
+            hydrated = self.fetch_detail(event)
+        except Exception as e:
+            logger.warning(f"Could not hydrate {event.get('event_name', 'unknown')}: {e}")
+            with self._lock:
+                self._futures.pop(event.get("event_link"), None)
+                self.stats["failed"] += 1
+            return None
+        hydrated.pop("details_pending", None)
+        with self._lock:
+            self.stats[mode] += 1
+        return hydrated
+
+    def _merge(self, event: Dict[str, Any], hydrated: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Fill a pending event's empty detail fields, keeping anything already entered"""
+        if hydrated is None:
+            return event
+        merged = dict(event)
+        for field in DETAIL_FIELDS:
+            if hydrated.get(field) and not merged.get(field):
+                merged[field] = hydrated[field]
+        merged.pop("details_pending", None)
+        return merged
+
+
+# Process-wide hydrator: results must outlive the scraper instance Streamlit recreates on every rerun
+_shared_hydrator: Optional[DetailHydrator] = None
+_shared_hydrator_lock = threading.Lock()
+
+def get_detail_hydrator(fetch_detail: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+                        workers: int = 2) -> DetailHydrator:
+    """
+    Get the process-wide detail hydrator, creating it on first use
+
+    Args:
+        fetch_detail: Detail fetcher (only applied on creation; defaults to a new EventScraper's)
+        workers: Background fetches in flight at once (only applied on creation)
+
+    Returns:
+        The shared DetailHydrator
+    """
+    global _shared_hydrator
+    with _shared_hydrator_lock:
+        if _shared_hydrator is None:
+            if fetch_detail is None:
+                from .scraper import EventScraper
+                fetch_detail = EventScraper().fetch_event_details
+            _shared_hydrator = DetailHydrator(fetch_detail, workers)
+            logger.info(f"Created shared detail hydrator ({workers} background workers)")
+        return _shared_hydrator
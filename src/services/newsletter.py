@@ -5,6 +5,8 @@ from typing import Dict, List, Any, Optional, Tuple
 import gspread
 from google.oauth2.service_account import Credentials
 
+from utils.date_normalizer import DateNormalizer
+
 # Get logger
 logger = logging.getLogger("tamu_newsletter")
 
@@ -521,8 +523,12 @@ class NewsletterGenerator:
         # Convert event title to uppercase
         event_name_uppercase = event_name.upper()
         
-        # Parse date to extract day and month for calendar icon
-        calendar_day, calendar_month = self._parse_date_for_calendar(event_date)
+        # Use the normalized start date for the calendar icon, parsing the display string only for older records
+        event_day = DateNormalizer.event_day(event) if event.get('start') else None
+        if event_day:
+            calendar_day, calendar_month = str(event_day.day), event_day.strftime("%b").upper()
+        else:
+            calendar_day, calendar_month = self._parse_date_for_calendar(event_date)
         
         # Use full event name for links (no shortening)
         event_name_for_links = event_name
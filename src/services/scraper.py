@@ -1,11 +1,20 @@
 # app/services/scraper.py
+import os
+import re
 import json
+import codecs
+import math
 import datetime
 import time
-import re
 from datetime import date
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterator, Callable
 import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from pathlib import Path
+from urllib.parse import urlsplit
+from contextlib import contextmanager
 
 # Selenium imports
 from selenium import webdriver
@@ -13,14 +22,65 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import StaleElementReferenceException, NoSuchElementException, TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
-from dateutil.parser import parse
+
+# HTTP engine imports
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .calendar_parser import CalendarPageParser, DETAIL_STRATEGIES, DETAIL_READY_SELECTOR
+from .calendar_feed import CalendarFeedParser
+from .calendar_sources import CalendarSourceRegistry, SECTIONS
+from .detail_hydrator import DetailHydrator, get_detail_hydrator
+from utils.driver_pool import get_driver_pool
+from utils.webdriver_grid import get_webdriver_grid
+from utils.async_browser import AsyncBrowser, BrowserPageError, get_async_browser
+from utils.page_cache import PageCache
+from utils.day_cache import DayCache
+from utils.rate_limiter import HostRateLimiter, get_rate_limiter
+from utils.scrape_journal import ScrapeJournal
+from utils.data_persistence import DataPersistence
+from utils.date_normalizer import DateNormalizer
 
 # Get logger
 logger = logging.getLogger("tamu_newsletter")
 
+# Requests the lean browser profile blocks: we only read text and hrefs
+LEAN_BLOCKED_URLS = [
+    # Images
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp", "*.avif",
+    # Web fonts
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    # Stylesheets
+    "*.css",
+    # Analytics and tag managers
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*hotjar.com*", "*siteimproveanalytics.com*"
+]
+
+# Bytes transferred for the current page, as reported by the Resource Timing API
+PAGE_TRANSFER_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+let bytes = nav ? nav.transferSize : 0;
+for (const entry of resources) { bytes += entry.transferSize || 0; }
+return {bytes: bytes, resources: resources.length};
+"""
+
+# Readiness check: true once the page has finished loading and no new resource request
+# has started for arguments[0] ms (state lives on window, so each navigation starts over)
+NETWORK_IDLE_SCRIPT = """
+const state = window.__scraperNetwork || (window.__scraperNetwork = {requests: -1, since: 0});
+const requests = performance.getEntriesByType('resource').length;
+if (requests !== state.requests) { state.requests = requests; state.since = performance.now(); }
+return document.readyState === 'complete' && performance.now() - state.since >= arguments[0];
+"""
+
+# Upper bounds in ms of the readiness wait histogram buckets; the last bucket is open-ended
+WAIT_HISTOGRAM_BOUNDS_MS = (50, 100, 250, 500, 1000, 2000, 5000)
+
 class EventScraper:
     """
     Service class to handle event scraping functionality
@@ -28,10 +88,111 @@ class EventScraper:
     
     def __init__(self):
         """Initialize the event scraper"""
-        self.cte_url = "https://calendar.tamu.edu/cte/all"
-        self.elp_url = "https://calendar.tamu.edu/elp/all"
+        # Calendars to scrape (calendar_sources.json, or the CTE and ELP defaults)
+        self.sources = CalendarSourceRegistry.load()
+        
+        # Number of calendars scraped in parallel (1 = one after another)
+        self.max_workers = 4
+        # Page loads in flight at once across every calendar (HTTP requests and browser navigations)
+        self.max_concurrent_fetches = 8
+        self._fetch_slots = None
+        # Adaptive per-host token bucket shared by every worker in the process
+        self.use_rate_limiter = True
+        self.rate_limit_per_host = 4.0
+        self.rate_limit_burst = 4
+        # Extra attempts for an HTTP fetch answered with 429/503, made at the reduced rate
+        self.throttle_retries = 3
+        # Concurrent detail page fetches per calendar (HTTP requests or Chrome drivers);
+        # also the number of listing pages fetched at once over HTTP
+        self.detail_workers = 4
+        # Load date-bounded listing views instead of the full /all listing; long ranges
+        # are split into windows of listing_window_days, each read as its own listing page
+        self.use_date_window = True
+        self.date_window_template = "{url}/start/{start_date}/end/{end_date}"
+        self.listing_window_days = 7
+        # Most listing pages (date windows plus pagination links) read per calendar,
+        # and the time budget for reading them
+        self.max_listing_pages = 24
+        self.listing_crawl_timeout = 60
+        # Selenium listing extraction: "page_source" (one round trip, parsed with lxml)
+        # or "elements" (one WebDriver lookup per card field)
+        self.listing_extraction = "page_source"
+        # Warm browsers kept alive across scrape runs (shared by the whole process)
+        self.driver_pool_size = 4
+        # Chrome options and driver path per browser profile, built on first use
+        self._chrome_config = {}
+        # Replace a browser after this many pages or this much resident memory (None disables)
+        self.driver_max_pages = 150
+        self.driver_max_rss_mb = 1024
+        # Remote WebDriver endpoints (Selenium Grid or standalone nodes); when set, browser work
+        # is sharded across them instead of local Chrome. Defaults to the comma-separated
+        # SCRAPER_WEBDRIVER_URLS environment variable
+        self.remote_webdrivers = [
+            url.strip() for url in os.environ.get("SCRAPER_WEBDRIVER_URLS", "").split(",") if url.strip()
+        ]
+        self.drivers_per_node = 2
+        # "lean" blocks images, fonts, stylesheets and analytics in the browser; "full" loads everything
+        self.browser_profile = "lean"
+        self._browser_stats = None
+        # "async" engine: pages open at once in its single shared Chromium
+        self.async_max_pages = 8
+        # Per-run latency samples by phase ("listing_parse", "detail_fetch")
+        self._timings = None
+        # Browser pages are parsed as soon as a readiness check passes instead of after fixed sleeps:
+        # checks are polled every readiness_poll_seconds, the network counts as idle after
+        # network_idle_ms without a new request, and a detail page that never becomes ready
+        # is parsed as-is after detail_ready_timeout seconds
+        self.readiness_poll_seconds = 0.1
+        self.network_idle_ms = 500
+        self.detail_ready_timeout = 5
+        # Per-run readiness waits by page type ("listing", "detail"): (seconds, check that passed)
+        self._waits = None
+        # Per-run count of detail pages each extraction strategy filled fields for
+        self._detail_stats = None
+        # Per-run index of detail fetches shared by every source, so duplicate events are fetched once
+        self._dedupe = None
+        
+        # HTTP engine configuration
+        self.engines = ("http", "selenium", "feed", "async")
+        self.http_pool_size = 10
+        self.http_timeout = 20
+        self.user_agent = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+        self._http_session = None
+        self.parser = CalendarPageParser()
+        
+        # On-disk page cache (conditional GETs for HTTP, TTL for browser fetches)
+        self.use_page_cache = True
+        self._page_cache = None
+        
+        # On-disk cache of scraped events per source and day; overlapping date ranges
+        # are served from days scraped within the TTL and only fetch the rest
+        self.use_day_cache = True
+        self.day_cache_dir = "day_cache"
+        self.day_cache_ttl_hours = 6
+        self._day_cache = None
+        
+        # Incremental mode state for the current run (None when disabled)
+        self._incremental = None
+        # Checkpoint journal of hydrated events, one file per date range; deleted when a run completes
+        self.journal_dir = "scrape_journal"
+        self.journal_batch_size = 10
+        self._journal = None
+        # Per-source-thread state; holds the callback that streams hydrated events and
+        # the listing pages of the current range that could not be read
+        self._source_context = threading.local()
+        # Lazy mode state for the current run (None when details are fetched during the scrape);
+        # pending detail pages are then fetched by the shared hydrator's background workers
+        self.lazy_detail_workers = 2
+        self._lazy = None
+        
+        # LiveWhale feed format; each source's feed_url is a template with
+        # {start_date}/{end_date} filled in per run, or a saved feed file on disk
+        self.feed_format = "json"
+        self.feed_parser = CalendarFeedParser()
     
-    def scrape_events(self, start_date: date, end_date: date, debug_mode: bool = False) -> Tuple[bool, Dict[str, Any]]:
+    def scrape_events(self, start_date: date, end_date: date, debug_mode: bool = False, engine: str = "http",
+                      incremental: bool = False, resume: bool = False,
+                      lazy_details: bool = False, refresh: bool = False) -> Tuple[bool, Dict[str, Any]]:
         """
         Scrape events from TAMU calendars
         
@@ -39,51 +200,193 @@ class EventScraper:
             start_date: Start date for event range
             end_date: End date for event range
             debug_mode: Whether to run in debug mode (ignored now - always runs directly)
+            engine: "http" (pooled HTTP client + lxml, Selenium fallback), "selenium",
+                "feed" (LiveWhale JSON/iCal feeds, no detail pages) or "async"
+                (concurrent pages in one shared Chromium, needs Playwright)
+            incremental: Reuse events from the last saved events.json whose listing
+                entry is unchanged instead of fetching their detail pages again
+            resume: Replay the journal of an interrupted run for the same dates and
+                fetch only the detail pages it had not finished
+            lazy_details: Return listing-level events without visiting detail pages;
+                they are marked "details_pending" and hydrated in the background
+                (see get_detail_hydrator)
+            refresh: Scrape every day again instead of serving days from the day cache;
+                the new results replace the cached ones
             
         Returns:
             Tuple of (success, events_data)
         """
+        # Drain the stream; only the final update matters here
+        for update in self.iter_events(start_date, end_date, engine=engine, incremental=incremental, resume=resume,
+                                       lazy_details=lazy_details, refresh=refresh):
+            if update["type"] == "complete":
+                return (True, update["events_data"])
+            if update["type"] == "error":
+                return (False, {"error": update["error"]})
+        
+        return (False, {"error": "Scraping ended without a result"})
+    
+    def iter_events(self, start_date: date, end_date: date, engine: str = "http",
+                    incremental: bool = False, resume: bool = False,
+                    lazy_details: bool = False, refresh: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Scrape events from TAMU calendars, yielding each event as soon as it is hydrated
+        
+        Yields dicts with a "type" key:
+            "event": one hydrated event, with "source", "label", "section" and
+                "progress" ({"source_completed", "source_total", "completed", "total"};
+                "total" only counts sources whose listing has been read so far)
+            "source_complete": a calendar finished ("source", "label", "events", "seconds")
+            "complete": the run finished; "events_data" is what scrape_events returns
+            "error": the run failed; "error" holds the message
+        
+        The scrape runs on a background thread. Abandoning the generator does
+        not cancel it; the run still completes and saves events.json.
+        
+        Args:
+            start_date: Start date for event range
+            end_date: End date for event range
+            engine: Scraping engine to use (see scrape_events)
+            incremental: Reuse unchanged events from the last saved scrape
+            resume: Continue an interrupted run for the same dates from its journal
+            lazy_details: Skip detail pages during the run (see scrape_events)
+            refresh: Ignore the day cache and scrape every day again
+        """
         start_date_str = start_date.strftime('%Y-%m-%d')
         end_date_str = end_date.strftime('%Y-%m-%d')
         
-        logger.info(f"Starting scraping for date range: {start_date_str} to {end_date_str}")
+        if engine not in self.engines:
+            logger.error(f"Unknown scraping engine: {engine}")
+            yield {"type": "error", "error": f"Unknown scraping engine: {engine}"}
+            return
+        
+        logger.info(f"Starting scraping for date range: {start_date_str} to {end_date_str} (engine: {engine})")
+        
+        updates = queue.Queue()
+        
+        def run():
+            try:
+                success, events_data = self._scrape_direct(start_date, end_date, engine, incremental, updates.put,
+                                                           resume, lazy_details, refresh)
+            except Exception as e:
+                success, events_data = False, {"error": f"Error during scraping: {str(e)}"}
+            if success:
+                updates.put({"type": "complete", "events_data": events_data})
+            else:
+                updates.put({"type": "error", "error": events_data.get("error", "Unknown error during scraping")})
         
-        # Always run directly now - no subprocess needed
-        return self._scrape_direct(start_date, end_date)
+        runner = threading.Thread(target=run, name="event-scrape", daemon=True)
+        runner.start()
+        
+        # Add run-wide counters to each event update as it passes through
+        source_progress = {}
+        while True:
+            update = updates.get()
+            if update["type"] == "event":
+                progress = update["progress"]
+                source_progress[update["source"]] = (progress["source_completed"], progress["source_total"])
+                progress["completed"] = sum(done for done, _ in source_progress.values())
+                progress["total"] = sum(total for _, total in source_progress.values())
+            yield update
+            if update["type"] in ("complete", "error"):
+                break
+        
+        runner.join()
     
-    def _scrape_direct(self, start_date: date, end_date: date) -> Tuple[bool, Dict[str, Any]]:
+    def _scrape_direct(self, start_date: date, end_date: date, engine: str = "http", incremental: bool = False,
+                       publish: Optional[Callable[[Dict[str, Any]], None]] = None,
+                       resume: bool = False, lazy_details: bool = False,
+                       refresh: bool = False) -> Tuple[bool, Dict[str, Any]]:
         """
         Run scraping directly with integrated functionality
         
         Args:
             start_date: Start date for event range
             end_date: End date for event range
+            engine: Scraping engine to use
+            incremental: Whether to reuse unchanged events from the previous run
+            publish: Receives "event" and "source_complete" updates while the run is in progress
+            resume: Replay the journal left by an interrupted run for the same dates
+            lazy_details: Leave detail pages to the background hydrator
+            refresh: Scrape every day again instead of serving cached days
             
         Returns:
             Tuple of (success, events_data)
         """
         logger.info("Running scraping directly with integrated functionality")
         
+        cache = self._get_page_cache()
+        if cache:
+            cache.reset_stats()
+        
+        limiter = self._get_rate_limiter()
+        if limiter:
+            limiter.reset_stats()
+        
+        day_cache = self._get_day_cache()
+        if day_cache:
+            day_cache.reset_stats()
+        
+        self._get_driver_pool().reset_stats()
+        self._get_async_browser().reset_stats()
+        
+        if incremental:
+            self._incremental = self._load_incremental_index()
+        
+        # One cap on page loads shared by every calendar in this run
+        self._fetch_slots = threading.BoundedSemaphore(max(1, self.max_concurrent_fetches))
+        self._browser_stats = {"lock": threading.Lock(), "pages": 0, "bytes": 0, "load_seconds": []}
+        self._timings = {"lock": threading.Lock(), "listing_parse": [], "detail_fetch": []}
+        self._waits = {"lock": threading.Lock(), "listing": [], "detail": []}
+        self._detail_stats = {"lock": threading.Lock(), "pages": 0, "counts": {name: 0 for name in DETAIL_STRATEGIES}}
+        self._dedupe = {"lock": threading.Lock(), "fetches": {}, "unique": 0, "saved": 0}
+        if lazy_details:
+            self._lazy = {"lock": threading.Lock(), "pending": 0}
+        
+        completed = False
         try:
-            # Scrape CTE events
-            logger.info(f"Scraping CTE events from {self.cte_url}")
-            cte_events = []
-            try:
-                cte_events = self._scrape_events_from_url(self.cte_url, start_date, end_date)
-                logger.info(f"Found {len(cte_events)} CTE events")
-            except Exception as e:
-                logger.error(f"Error scraping CTE events: {str(e)}")
-                return (False, {"error": f"Error scraping CTE events: {str(e)}"})
+            self._journal = self._open_journal(start_date, end_date, resume)
             
-            # Scrape ELP events
-            logger.info(f"Scraping ELP events from {self.elp_url}")
-            elp_events = []
-            try:
-                elp_events = self._scrape_events_from_url(self.elp_url, start_date, end_date)
-                logger.info(f"Found {len(elp_events)} ELP events")
-            except Exception as e:
-                logger.error(f"Error scraping ELP events: {str(e)}")
-                return (False, {"error": f"Error scraping ELP events: {str(e)}"})
+            # Scrape the calendars concurrently; each Selenium scrape owns its own driver
+            sources = self.sources.all()
+            if not sources:
+                return (False, {"error": "No calendar sources configured"})
+            workers = max(1, min(self.max_workers, len(sources)))
+            logger.info(f"Scraping {len(sources)} calendars with {workers} worker(s), "
+                        f"at most {self.max_concurrent_fetches} page loads at once")
+            
+            run_started = time.perf_counter()
+            source_timings = {}
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    source["name"]: executor.submit(self._scrape_source_timed, source, start_date, end_date, engine,
+                                                    source_timings, publish, refresh)
+                    for source in sources
+                }
+            
+            # Report failures in source order, the same way the sequential scrape did
+            events_by_source = {}
+            for source in sources:
+                try:
+                    events_by_source[source["name"]] = futures[source["name"]].result()
+                except Exception as e:
+                    logger.error(f"Error scraping {source['label']} events: {str(e)}")
+                    return (False, {"error": f"Error scraping {source['label']} events: {str(e)}"})
+            
+            logger.info(f"Scraped all calendars in {time.perf_counter() - run_started:.2f}s")
+            
+            # Merge sources into the newsletter sections the rest of the app reads; each event keeps
+            # its source name so the per-source lists can be derived again (see events_by_source)
+            section_events = {section: [] for section in SECTIONS}
+            for source in sources:
+                section_events[source["section"]].extend(
+                    dict(event, source=source["name"]) for event in events_by_source[source["name"]]
+                )
+            
+            if self._incremental is not None:
+                self._count_removed_events(
+                    [event for events in events_by_source.values() for event in events], start_date, end_date
+                )
             
             # Prepare and save the data
             events_data = {
@@ -91,9 +394,11 @@ class EventScraper:
                     "start_date": start_date.strftime('%Y-%m-%d'),
                     "end_date": end_date.strftime('%Y-%m-%d')
                 },
-                "cte_events": cte_events,
-                "elp_events": elp_events
+                "cte_events": section_events["cte"],
+                "elp_events": section_events["elp"],
+                "scrape_stats": self._collect_run_stats()
             }
+            events_data["scrape_stats"]["sources"] = source_timings
             
             # Save data to file
             try:
@@ -104,27 +409,1014 @@ class EventScraper:
                 logger.error(f"Error saving events data to file: {str(e)}")
                 return (False, {"error": f"Error saving events data: {str(e)}"})
             
+            # Lazy events, and pending ones an incremental run reused, are hydrated in the background
+            pending = [event for events in section_events.values() for event in events if event.get("details_pending")]
+            if pending:
+                self.get_detail_hydrator().schedule(pending)
+            
+            completed = True
             logger.info("Direct scraping completed successfully")
             return (True, events_data)
             
         except Exception as e:
             logger.error(f"Error during scraping: {str(e)}")
             return (False, {"error": f"Error during scraping: {str(e)}"})
+        
+        finally:
+            if self._journal is not None:
+                self._journal.close(completed=completed)
+            self._journal = None
+            self._incremental = None
+            self._fetch_slots = None
+            self._browser_stats = None
+            self._timings = None
+            self._waits = None
+            self._detail_stats = None
+            self._dedupe = None
+            self._lazy = None
+    
+    def get_detail_hydrator(self) -> DetailHydrator:
+        """Get the process-wide hydrator that fetches details for lazily scraped events"""
+        return get_detail_hydrator(self.fetch_event_details, self.lazy_detail_workers)
+    
+    def fetch_event_details(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fetch one event's detail page over HTTP outside a scrape run
+        
+        Used to hydrate events from a lazy scrape. Unlike the in-run detail
+        fetch, errors are raised so the caller can retry later.
+        
+        Returns:
+            A copy of the event with its detail fields filled in
+        """
+        html = self._fetch_page(event["event_link"])
+        return self._parse_detail(html, dict(event))
+    
+    def _open_journal(self, start_date: date, end_date: date, resume: bool) -> Optional[ScrapeJournal]:
+        """Open this date range's checkpoint journal, or return None if it cannot be created"""
+        path = Path(self.journal_dir) / f"{start_date:%Y-%m-%d}_{end_date:%Y-%m-%d}.jsonl"
+        try:
+            return ScrapeJournal(str(path), self.journal_batch_size).open(resume=resume)
+        except OSError as e:
+            logger.warning(f"Scraping without a checkpoint journal: {e}")
+            return None
+    
+    @contextmanager
+    def _fetch_slot(self, url: str):
+        """
+        Wait for the host's rate limit, then hold one of the run's page-load slots
+        
+        Yields a dict the caller can fill with the response's "status" and
+        "retry_after" so the rate limiter can adapt to it. The slot cap only
+        applies inside a scrape run.
+        """
+        limiter = self._get_rate_limiter()
+        if limiter:
+            limiter.acquire(url)
+        
+        outcome = {"status": None, "retry_after": None}
+        slots = self._fetch_slots
+        if slots is not None:
+            slots.acquire()
+        started = time.perf_counter()
+        try:
+            yield outcome
+        finally:
+            elapsed = time.perf_counter() - started
+            if slots is not None:
+                slots.release()
+            if limiter:
+                limiter.report(url, outcome["status"], elapsed, outcome["retry_after"])
+    
+    def _get_rate_limiter(self) -> Optional[HostRateLimiter]:
+        """Get the process-wide rate limiter, or None when rate limiting is disabled"""
+        if not self.use_rate_limiter:
+            return None
+        return get_rate_limiter(self.rate_limit_per_host, self.rate_limit_burst)
+    
+    def _collect_run_stats(self) -> Dict[str, Any]:
+        """Gather per-run scraper statistics and log them"""
+        stats = {}
+        
+        cache = self._get_page_cache()
+        limiter = self._get_rate_limiter()
+        if limiter:
+            stats["rate_limiter"] = limiter.get_stats()
+            for host, host_stats in stats["rate_limiter"].items():
+                logger.info(
+                    f"Rate limiter for {host}: {host_stats['rate']} req/s, {host_stats['requests']} requests, "
+                    f"{host_stats['throttled']} throttled, {host_stats['slow']} slow, {host_stats['waited_seconds']}s waiting"
+                )
+        
+        if cache:
+            cache.flush()
+            stats["page_cache"] = cache.get_stats()
+            logger.info(
+                f"Page cache: {stats['page_cache']['hits']} hits "
+                f"({stats['page_cache']['revalidated']} revalidated), {stats['page_cache']['misses']} misses, "
+                f"{stats['page_cache']['bytes_saved']} bytes and ~{stats['page_cache']['seconds_saved']}s saved"
+            )
+        
+        day_cache = self._get_day_cache()
+        if day_cache and day_cache.stats:
+            stats["day_cache"] = day_cache.get_stats()
+            logger.info(
+                f"Day cache: {stats['day_cache']['cached_days']} source-days served from cache, "
+                f"{stats['day_cache']['fetched_days']} fetched"
+            )
+        
+        browser = self._browser_stats
+        if browser is not None and browser["pages"]:
+            load_seconds = sorted(browser["load_seconds"])
+            pool_stats = self._get_driver_pool().get_stats()
+            stats["browser"] = {
+                "profile": self.browser_profile,
+                "pages": browser["pages"],
+                "bytes_transferred": browser["bytes"],
+                "avg_load_ms": round(sum(load_seconds) / len(load_seconds) * 1000, 1),
+                "max_load_ms": round(load_seconds[-1] * 1000, 1),
+                "peak_rss_mb": pool_stats["peak_rss_mb"] or None,
+                "drivers_recycled": pool_stats["recycled"]
+            }
+            if "nodes" in pool_stats:
+                stats["browser"]["drivers_rebalanced"] = pool_stats["rebalanced"]
+                stats["browser"]["nodes"] = pool_stats["nodes"]
+                for node_url, node in pool_stats["nodes"].items():
+                    logger.info(
+                        f"WebDriver node {node_url}: {node['pages']} pages, "
+                        f"{node['avg_load_ms'] or '?'}ms average load, "
+                        f"{'healthy' if node['healthy'] else 'unhealthy'}{', slow' if node['slow'] else ''}"
+                    )
+            logger.info(
+                f"Browser ({self.browser_profile} profile): {stats['browser']['pages']} pages, "
+                f"{stats['browser']['bytes_transferred']} bytes transferred, "
+                f"{stats['browser']['avg_load_ms']}ms average load ({stats['browser']['max_load_ms']}ms max), "
+                f"peak memory {stats['browser']['peak_rss_mb'] or 'unknown'}MB, "
+                f"{stats['browser']['drivers_recycled']} driver(s) recycled"
+            )
+        
+        async_stats = self._get_async_browser().get_stats()
+        if async_stats["pages"]:
+            stats["async_browser"] = async_stats
+            logger.info(
+                f"Async browser: {async_stats['pages']} pages, at most {async_stats['peak_open_pages']} open at once, "
+                f"peak memory {async_stats['peak_rss_mb'] or 'unknown'}MB"
+            )
+        
+        timings = self._timings
+        if timings is not None:
+            stats["timings"] = {
+                phase: self._summarize_timings(samples)
+                for phase, samples in timings.items()
+                if phase != "lock" and samples
+            }
+            for phase, summary in stats["timings"].items():
+                logger.info(f"{phase}: {summary['count']} samples, p50 {summary['p50_ms']}ms, "
+                            f"p90 {summary['p90_ms']}ms, max {summary['max_ms']}ms")
+        
+        waits = self._waits
+        if waits is not None:
+            stats["waits"] = {
+                page_type: self._summarize_waits(samples)
+                for page_type, samples in waits.items()
+                if page_type != "lock" and samples
+            }
+            for page_type, summary in stats["waits"].items():
+                logger.info(
+                    f"{page_type} readiness waits: {summary['count']} totalling {summary['total_seconds']}s, "
+                    f"p50 {summary['p50_ms']}ms, p90 {summary['p90_ms']}ms, max {summary['max_ms']}ms; ready by " +
+                    ", ".join(f"{check} {count}" for check, count in summary["ready_by"].items())
+                )
+        
+        detail = self._detail_stats
+        if detail is not None and detail["pages"]:
+            stats["detail_strategies"] = {
+                "pages": detail["pages"],
+                "counts": dict(detail["counts"]),
+                "hit_rates": {name: round(count / detail["pages"], 3) for name, count in detail["counts"].items()}
+            }
+            logger.info(f"Detail strategies over {detail['pages']} pages: " + ", ".join(
+                f"{name} {rate:.0%}" for name, rate in stats["detail_strategies"]["hit_rates"].items()
+            ))
+        
+        dedupe = self._dedupe
+        if dedupe is not None and (dedupe["unique"] or dedupe["saved"]):
+            stats["dedupe"] = {"unique_fetches": dedupe["unique"], "saved_fetches": dedupe["saved"]}
+            logger.info(f"Deduplication: {dedupe['unique']} unique detail pages, {dedupe['saved']} fetches saved")
+        
+        if self._journal is not None:
+            stats["journal"] = dict(self._journal.stats)
+            logger.info(
+                f"Scrape journal: {stats['journal']['replayed']} events replayed, "
+                f"{stats['journal']['journaled']} journaled"
+            )
+        
+        if self._lazy is not None:
+            stats["lazy_details"] = {"pending": self._lazy["pending"]}
+            logger.info(f"Lazy details: {self._lazy['pending']} detail pages left for background hydration")
+        
+        if self._incremental is not None:
+            stats["incremental"] = dict(self._incremental["counts"])
+            logger.info(
+                f"Incremental scrape: {stats['incremental']['added']} added, {stats['incremental']['changed']} changed, "
+                f"{stats['incremental']['removed']} removed, {stats['incremental']['reused']} reused"
+            )
+        
+        return stats
+    
+    def _record_timing(self, phase: str, seconds: float):
+        """Add a latency sample for the current run (ignored outside a run)"""
+        timings = self._timings
+        if timings is None:
+            return
+        with timings["lock"]:
+            timings[phase].append(seconds)
+    
+    def _summarize_timings(self, samples: List[float]) -> Dict[str, Any]:
+        """Summarize latency samples as count, average and nearest-rank percentiles in ms"""
+        ordered = sorted(samples)
+        
+        def percentile(p):
+            index = max(0, math.ceil(p / 100 * len(ordered)) - 1)
+            return round(ordered[index] * 1000, 1)
+        
+        return {
+            "count": len(ordered),
+            "avg_ms": round(sum(ordered) / len(ordered) * 1000, 1),
+            "p50_ms": percentile(50),
+            "p90_ms": percentile(90),
+            "p99_ms": percentile(99),
+            "max_ms": round(ordered[-1] * 1000, 1)
+        }
+    
+    def _summarize_waits(self, samples: List[Tuple[float, str]]) -> Dict[str, Any]:
+        """Summarize readiness waits as latency percentiles, a histogram and how many each check ended"""
+        seconds = [wait_seconds for wait_seconds, _ in samples]
+        summary = self._summarize_timings(seconds)
+        
+        labels = [f"<{WAIT_HISTOGRAM_BOUNDS_MS[0]}ms"] + [
+            f"{low}-{high}ms" for low, high in zip(WAIT_HISTOGRAM_BOUNDS_MS, WAIT_HISTOGRAM_BOUNDS_MS[1:])
+        ] + [f">={WAIT_HISTOGRAM_BOUNDS_MS[-1]}ms"]
+        histogram = dict.fromkeys(labels, 0)
+        for wait_seconds in seconds:
+            bucket = next((i for i, bound in enumerate(WAIT_HISTOGRAM_BOUNDS_MS) if wait_seconds * 1000 < bound),
+                          len(WAIT_HISTOGRAM_BOUNDS_MS))
+            histogram[labels[bucket]] += 1
+        
+        ready_by: Dict[str, int] = {}
+        for _, check in samples:
+            ready_by[check] = ready_by.get(check, 0) + 1
+        
+        summary.update(total_seconds=round(sum(seconds), 2), histogram=histogram, ready_by=ready_by)
+        return summary
+    
+    def _event_fingerprint(self, event: Dict[str, Any]) -> str:
+        """Stable fingerprint of an event's listing entry (link plus date/time/location)"""
+        return "|".join(
+            (event.get(field) or "").strip()
+            for field in ("event_link", "event_date", "event_time", "event_location")
+        )
+    
+    def _load_incremental_index(self) -> Dict[str, Any]:
+        """Index the last saved events (events.json, else the newest backup) by fingerprint"""
+        persistence = DataPersistence()
+        previous_data = persistence.load_events_data()
+        if previous_data is None:
+            for backup_path in persistence.get_backup_files():
+                previous_data = DataPersistence(events_file=str(backup_path)).load_events_data()
+                if previous_data:
+                    logger.info(f"Using backup {backup_path} as the previous run")
+                    break
+        
+        previous_events = []
+        if previous_data:
+            previous_events = previous_data.get("cte_events", []) + previous_data.get("elp_events", [])
+        
+        logger.info(f"Incremental mode: {len(previous_events)} events from the previous run")
+        return {
+            # Events whose detail fetch failed last time are fetched again
+            "by_fingerprint": {
+                self._event_fingerprint(event): event
+                for event in previous_events if event.get("event_link") and not event.get("details_failed")
+            },
+            "links": {event.get("event_link") for event in previous_events if event.get("event_link")},
+            "previous_events": previous_events,
+            "counts": {"added": 0, "changed": 0, "removed": 0, "reused": 0},
+            "lock": threading.Lock()
+        }
+    
+    def _reuse_previous_event(self, event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Return the previous record for an unchanged event, or None if it needs a detail fetch
+        
+        Also counts the event as added, changed or reused for the run summary.
+        """
+        index = self._incremental
+        if index is None:
+            return None
+        
+        previous = index["by_fingerprint"].get(self._event_fingerprint(event))
+        with index["lock"]:
+            if previous is not None:
+                index["counts"]["reused"] += 1
+            elif event.get("event_link") in index["links"]:
+                index["counts"]["changed"] += 1
+            else:
+                index["counts"]["added"] += 1
+        
+        return dict(previous) if previous is not None else None
+    
+    def _dedupe_keys(self, event: Dict[str, Any]) -> List[str]:
+        """Keys that identify the same event across listings: normalized link and title + start time"""
+        keys = []
+        link = event.get("event_link", "")
+        if link:
+            parts = urlsplit(link.strip())
+            keys.append(f"link:{parts.netloc.lower()}{parts.path.rstrip('/').lower()}")
+        
+        title = " ".join(event.get("event_name", "").split()).casefold()
+        event_day = DateNormalizer.parse_date(event.get("event_date", ""))
+        if title and event_day:
+            start_time, _ = DateNormalizer.parse_time_range(event.get("event_time", ""))
+            keys.append(f"title:{title}|{event_day.isoformat()}|{start_time.isoformat() if start_time else ''}")
+        return keys
+    
+    def _claim_detail_fetch(self, event: Dict[str, Any]) -> Tuple[Optional[Future], bool]:
+        """
+        Find or register the detail fetch for an event
+        
+        Returns:
+            Tuple of (future holding the hydrated event, True if the caller must
+            do the fetch). The future is None outside a scrape run.
+        """
+        index = self._dedupe
+        keys = self._dedupe_keys(event)
+        if index is None or not keys:
+            return None, True
+        
+        with index["lock"]:
+            for key in keys:
+                if key in index["fetches"]:
+                    return index["fetches"][key], False
+            future = Future()
+            for key in keys:
+                index["fetches"][key] = future
+            index["unique"] += 1
+        return future, True
+    
+    def _copy_detail_fields(self, source: Dict[str, Any], event: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy hydrated detail fields to a duplicate, keeping its own listing fields"""
+        hydrated = dict(event)
+        for field in ("event_facilitators", "event_registration_link", "event_description"):
+            if source.get(field):
+                hydrated[field] = source[field]
+        with self._dedupe["lock"]:
+            self._dedupe["saved"] += 1
+        return hydrated
+    
+    def _count_removed_events(self, current_events: List[Dict[str, Any]], start_date: date, end_date: date):
+        """Count previous events in the requested range that no longer appear in the listings"""
+        current_links = {event.get("event_link") for event in current_events}
+        removed = 0
+        for event in self._incremental["previous_events"]:
+            if event.get("event_link") in current_links:
+                continue
+            if event.get("event_date") and self._is_within_date_range(event["event_date"], start_date, end_date):
+                removed += 1
+        self._incremental["counts"]["removed"] = removed
     
     def _is_within_date_range(self, event_date: str, start_date: date, end_date: date) -> bool:
         """Check if event_date is within the given range"""
+        return self._date_range_position(event_date, start_date, end_date) == 0
+    
+    def _date_range_position(self, event_date: str, start_date: date, end_date: date) -> Optional[int]:
+        """
+        Locate event_date relative to the range
+        
+        Returns:
+            -1 before the range, 0 inside it, 1 after it, None if the date cannot be parsed
+        """
+        # Memoized fast-path parse; unparseable dates are excluded to be safe
+        event_day = DateNormalizer.parse_date(event_date)
+        if event_day is None:
+            return None
+        
+        if event_day < start_date:
+            return -1
+        if event_day > end_date:
+            return 1
+        return 0
+    
+    def _filter_listing_by_date(self, listing_events: List[Dict[str, Any]], start_date: date, end_date: date,
+                                chronological: bool = True) -> List[Dict[str, Any]]:
+        """
+        Keep listing events inside the date range
+        
+        LiveWhale listings are chronological, so the scan stops at the first
+        event past end_date instead of parsing every remaining card.
+        """
+        event_data = []
+        for i, event in enumerate(listing_events):
+            if not event["event_date"]:
+                event_data.append(event)
+                continue
+            
+            position = self._date_range_position(event["event_date"], start_date, end_date)
+            if position == 0:
+                event_data.append(event)
+            elif position == 1 and chronological:
+                logger.info(f"Passed end date at '{event['event_name']}', skipping {len(listing_events) - i} remaining cards")
+                break
+            else:
+                logger.info(f"Event outside date range: {event['event_name']}")
+        
+        return event_data
+    
+    def _listing_windows(self, url: str, start_date: date, end_date: date) -> List[str]:
+        """
+        Date-bounded listing URLs covering the range, one per listing_window_days
+        
+        Short windows keep each listing page small, so a long range is read as
+        several pages fetched concurrently. Windows are widened when needed so a
+        range never takes more than max_listing_pages of them.
+        
+        Returns:
+            Window URLs in date order (empty when date windows are disabled)
+        """
+        if not self.use_date_window:
+            return []
+        
+        total_days = (end_date - start_date).days + 1
+        days = max(1, self.listing_window_days, math.ceil(total_days / max(1, self.max_listing_pages)))
+        windows = []
+        window_start = start_date
+        while window_start <= end_date:
+            window_end = min(end_date, window_start + datetime.timedelta(days=days - 1))
+            windows.append(self.date_window_template.format(
+                url=url.rstrip("/"),
+                start_date=window_start.strftime('%Y-%m-%d'),
+                end_date=window_end.strftime('%Y-%m-%d')
+            ))
+            window_start = window_end + datetime.timedelta(days=1)
+        return windows
+    
+    def _follows_page_links(self, events: List[Dict[str, Any]], start_date: date, end_date: date) -> bool:
+        """
+        Whether a listing page's pagination links are worth following
+        
+        Listings are chronological, so once a page's last dated card is past
+        end_date every later page is too. An empty page has no further pages.
+        """
+        dated = [event for event in events if event["event_date"]]
+        if not dated:
+            return bool(events)
+        return self._date_range_position(dated[-1]["event_date"], start_date, end_date) != 1
+    
+    def _merge_listing_pages(self, pages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Merge the cards of several listing pages into one list in date order
+        
+        Windows and pages can overlap at their boundaries, so a card whose link
+        (or title, without a link), date and time were already seen is dropped.
+        Cards are sorted by day, keeping page order within a day; undated cards go last.
+        """
+        merged = []
+        seen = set()
+        duplicates = 0
+        for page in sorted(pages, key=lambda page: page["order"]):
+            for event in page["events"]:
+                key = (event["event_link"] or event["event_name"].casefold(), event["event_date"], event["event_time"])
+                if key in seen:
+                    duplicates += 1
+                    continue
+                seen.add(key)
+                merged.append(event)
+        
+        if duplicates:
+            logger.info(f"Dropped {duplicates} cards repeated across listing pages")
+        merged.sort(key=lambda event: DateNormalizer.parse_date(event["event_date"]) or date.max)
+        return merged
+    
+    def _scrape_source_timed(self, source: Dict[str, Any], start_date: date, end_date: date, engine: str,
+                             timings: Dict[str, Any], publish: Optional[Callable[[Dict[str, Any]], None]] = None,
+                             refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        Scrape one calendar, log how long it took and record the timing in timings
+        
+        Days found fresh in the day cache are served from it (unless refresh is
+        set); each contiguous run of missing or stale days is scraped and cached.
+        With publish set, each event is also streamed as soon as it is hydrated.
+        """
+        # A source's own engine wins over the run's engine
+        engine = source.get("engine") or engine
+        name = source["label"]
+        url = source.get("feed_url") if engine == "feed" else source["url"]
+        if not url:
+            raise Exception(f"No {'feed ' if engine == 'feed' else ''}URL configured for {name}")
+        
+        progress = {"completed": 0}
+        progress_lock = threading.Lock()
+        
+        def emit(event: Dict[str, Any], total: int):
+            DateNormalizer.normalize_event(event)
+            with progress_lock:
+                progress["completed"] += 1
+                completed = progress["completed"]
+            publish({
+                "type": "event",
+                "source": source["name"],
+                "label": name,
+                "section": source["section"],
+                "event": event,
+                "progress": {"source_completed": completed, "source_total": total}
+            })
+        
+        started = time.perf_counter()
+        day_cache = self._get_day_cache()
+        cached_days, missing_days = {}, DayCache.days(start_date, end_date)
+        if day_cache and not refresh:
+            cached_days, missing_days = day_cache.lookup(source["name"], start_date, end_date, engine, self._lazy is not None)
+        cached_events = [event for day in sorted(cached_days) for event in cached_days[day]]
+        if cached_days:
+            logger.info(f"Serving {len(cached_days)} of {len(cached_days) + len(missing_days)} days of {name} "
+                        f"events from the day cache ({len(cached_events)} events)")
+        if publish:
+            for event in cached_events:
+                emit(event, len(cached_events))
+        
+        fetched = []
+        for range_start, range_end in DayCache.missing_ranges(missing_days):
+            logger.info(f"Scraping {name} events from {url} for {range_start} to {range_end} (engine: {engine})")
+            # Progress totals count the events already streamed for this source
+            streamed = progress["completed"]
+            self._source_context.emit = (lambda event, total, streamed=streamed: emit(event, streamed + total)) if publish else None
+            self._source_context.listing_failures = []
+            try:
+                range_events = self._scrape_source(url, range_start, range_end, engine, source.get("selectors"))
+                listing_failures = self._source_context.listing_failures
+            finally:
+                self._source_context.emit = None
+                self._source_context.listing_failures = None
+            
+            # Add canonical ISO start/end fields so later stages don't re-parse display strings
+            for event in range_events:
+                DateNormalizer.normalize_event(event)
+            
+            # Engines without a detail phase (feeds) stream their events once the source is read
+            if publish and progress["completed"] == streamed:
+                for event in range_events:
+                    emit(event, streamed + len(range_events))
+            
+            # Days of an unread listing page are unknown rather than empty, so the range is not cached;
+            # days with failed detail fetches are cached but never served (see DayCache)
+            if day_cache and listing_failures:
+                logger.warning(f"Not caching {name} days {range_start} to {range_end}: "
+                               f"{len(listing_failures)} listing page(s) could not be read")
+            elif day_cache:
+                day_cache.put_range(source["name"], range_start, range_end, range_events, engine)
+            fetched.append((range_start, range_end, range_events))
+        
+        events = self._merge_cached_days(cached_days, fetched)
+        if day_cache:
+            day_cache.record(source["name"], len(cached_days), len(missing_days), len(cached_events))
+        
+        elapsed = time.perf_counter() - started
+        timings[source["name"]] = {"engine": engine, "events": len(events), "seconds": round(elapsed, 2),
+                                   "cached_days": len(cached_days)}
+        logger.info(f"Found {len(events)} {name} events in {elapsed:.2f}s")
+        if publish:
+            publish({"type": "source_complete", "source": source["name"], "label": name,
+                     "events": len(events), "seconds": round(elapsed, 2)})
+        return events
+    
+    def _merge_cached_days(self, cached_days: Dict[date, List[Dict[str, Any]]],
+                           fetched: List[Tuple[date, date, List[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """
+        Combine cached days with freshly scraped ranges in date order
+        
+        Without cached days the scraped events keep their listing order. An
+        undated event is cached with the first day of its range, so it can
+        come back from both the cache and a new range; only its first copy is kept.
+        """
+        if not cached_days:
+            return [event for _, _, range_events in fetched for event in range_events]
+        
+        by_day = dict(cached_days)
+        for range_start, range_end, range_events in fetched:
+            by_day.update(DayCache.split_by_day(range_events, range_start, range_end))
+        
+        events = []
+        undated_links = set()
+        for day in sorted(by_day):
+            for event in by_day[day]:
+                if DateNormalizer.event_day(event) is None and event.get("event_link"):
+                    if event["event_link"] in undated_links:
+                        continue
+                    undated_links.add(event["event_link"])
+                events.append(event)
+        return events
+    
+    def _scrape_source(self, url: str, start_date: date, end_date: date, engine: str,
+                       selectors: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """Scrape a single calendar URL with the selected engine"""
+        if engine == "selenium":
+            return self._scrape_events_from_url(url, start_date, end_date, selectors)
+        if engine == "feed":
+            return self._scrape_events_feed(url, start_date, end_date)
+        if engine == "async":
+            return self._scrape_events_async(url, start_date, end_date, selectors)
+        return self._scrape_events_http(url, start_date, end_date, selectors)
+    
+    def _get_http_session(self) -> requests.Session:
+        """Get the pooled HTTP session, creating it on first use"""
+        if self._http_session is None:
+            session = requests.Session()
+            # 429 and 503 (with or without Retry-After) are left to _fetch_page so the rate limiter sees them
+            retries = Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 504),
+                            respect_retry_after_header=False)
+            adapter = HTTPAdapter(
+                pool_connections=self.http_pool_size,
+                pool_maxsize=self.http_pool_size,
+                max_retries=retries
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({"User-Agent": self.user_agent})
+            self._http_session = session
+            logger.info(f"Created HTTP session (pool size {self.http_pool_size})")
+        return self._http_session
+    
+    def _get_page_cache(self) -> Optional[PageCache]:
+        """Get the on-disk page cache, or None when caching is disabled"""
+        if not self.use_page_cache:
+            return None
+        if self._page_cache is None:
+            self._page_cache = PageCache()
+        return self._page_cache
+    
+    def _get_day_cache(self) -> Optional[DayCache]:
+        """Get the per-day event cache, or None if disabled"""
+        if not self.use_day_cache:
+            return None
+        if self._day_cache is None:
+            self._day_cache = DayCache(self.day_cache_dir, int(self.day_cache_ttl_hours * 3600))
+        return self._day_cache
+    
+    def day_cache_coverage(self, start_date: date, end_date: date, engine: str = "http",
+                           lazy_details: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        How much of a date range each calendar would serve from the day cache
+        
+        Args:
+            start_date: Start date for event range
+            end_date: End date for event range
+            engine: Engine the scrape would run with (a source's own engine wins)
+            lazy_details: Whether the scrape would run in lazy mode
+        
+        Returns:
+            Coverage per source name (see DayCache.coverage) plus its "label"; empty when the cache is disabled
+        """
+        day_cache = self._get_day_cache()
+        if day_cache is None:
+            return {}
+        return {
+            source["name"]: dict(
+                day_cache.coverage(source["name"], start_date, end_date, source.get("engine") or engine, lazy_details),
+                label=source["label"]
+            )
+            for source in self.sources.all()
+        }
+    
+    def _fetch_page(self, url: str) -> str:
+        """
+        Fetch a page over HTTP and return its HTML
+        
+        Cached pages are revalidated with If-None-Match / If-Modified-Since
+        and served from disk on a 304.
+        """
+        cache = self._get_page_cache()
+        entry = cache.get(url) if cache else None
+        
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        
+        for attempt in range(self.throttle_retries + 1):
+            started = time.perf_counter()
+            with self._fetch_slot(url) as fetch:
+                response = self._get_http_session().get(url, headers=headers, timeout=self.http_timeout)
+                fetch["status"] = response.status_code
+                fetch["retry_after"] = response.headers.get("Retry-After")
+            
+            if response.status_code not in (429, 503) or attempt == self.throttle_retries:
+                break
+            logger.warning(f"{url} answered {response.status_code}, retrying at a reduced rate")
+        
+        if response.status_code == 304 and entry:
+            cache.touch(url)
+            cache.record_hit(entry, revalidated=True)
+            return entry["body"]
+        
+        response.raise_for_status()
+        html = self._response_text(response)
+        if cache:
+            cache.record_miss()
+            cache.put(
+                url,
+                html,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                fetch_seconds=time.perf_counter() - started
+            )
+        return html
+    
+    def _response_text(self, response: requests.Response) -> str:
+        """
+        Decode a response body the way a browser would
+        
+        Without a charset in Content-Type, requests falls back to ISO-8859-1
+        for text/html, which garbles UTF-8 pages (the "·" date separator
+        becomes "Â·"). The page's own <meta charset> wins in that case, then
+        the detected encoding.
+        """
+        if "charset" not in response.headers.get("Content-Type", "").lower():
+            declared = re.search(rb"""<meta[^>]+charset=["']?([\w-]+)""", response.content[:4096], re.IGNORECASE)
+            encoding = declared.group(1).decode("ascii") if declared else None
+            try:
+                codecs.lookup(encoding or "")
+            except LookupError:
+                encoding = response.apparent_encoding or "utf-8"
+            response.encoding = encoding
+        return response.text
+    
+    def _scrape_events_http(self, url: str, start_date: date, end_date: date,
+                            selectors: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """
+        Scrape events from a specified URL without a browser
+        
+        Falls back to Selenium when the listing is not rendered server-side. A
+        date window without events is a rendered (empty) listing, not a reason to fall back.
+        """
+        try:
+            pages = self._read_listing(url, start_date, end_date, selectors)
+            if not pages:
+                logger.warning(f"Could not fetch {url} over HTTP. Falling back to Selenium")
+                return self._scrape_events_from_url(url, start_date, end_date, selectors)
+            
+            listing_events = self._merge_listing_pages(pages)
+            if not any(self.parser.listing_rendered(page["html"], selectors) for page in pages):
+                logger.warning(f"No server-rendered events at {url}. Falling back to Selenium")
+                return self._scrape_events_from_url(url, start_date, end_date, selectors)
+            
+            logger.info(f"Found {len(listing_events)} event cards on {len(pages)} listing pages")
+            
+            # Merged pages are in date order, but undated cards at the end must still be kept
+            event_data = self._filter_listing_by_date(listing_events, start_date, end_date, chronological=False)
+            
+            logger.info(f"Successfully processed {len(event_data)} events")
+            
+            # Get additional details for each event
+            return self._hydrate_details(event_data, self._get_event_details_http)
+            
+        except Exception as e:
+            logger.error(f"Error in _scrape_events_http: {str(e)}")
+            raise Exception(f"Failed to scrape events: {str(e)}")
+    
+    def _read_listing(self, url: str, start_date: date, end_date: date, selectors: Optional[Dict[str, str]] = None,
+                      fetch_page: Optional[Callable[[str], str]] = None, workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Crawl a calendar's date windows, adding the full listing when any window could not be fetched
+        
+        A window that loads but has no events is a success: its days are empty, and
+        they are not read again from the full listing.
+        """
+        windows = self._listing_windows(url, start_date, end_date)
+        pages, failed = self._crawl_listing_pages(windows, start_date, end_date, selectors, fetch_page, workers) if windows else ([], [])
+        
+        # Days whose window could not be fetched are read from the full listing instead
+        if not windows or failed:
+            full_pages, full_failed = self._crawl_listing_pages([url], start_date, end_date, selectors, fetch_page, workers)
+            pages.extend(dict(page, order=(len(windows),) + page["order"]) for page in full_pages)
+            failed = failed + full_failed
+        self._record_listing_failures(failed)
+        return pages
+    
+    def _record_listing_failures(self, failed: List[str]):
+        """Note listing pages of the current source range that could not be read, so the range is not day-cached"""
+        failures = getattr(self._source_context, "listing_failures", None)
+        if failures is not None:
+            failures.extend(failed)
+    
+    def _crawl_listing_pages(self, seed_urls: List[str], start_date: date, end_date: date,
+                             selectors: Optional[Dict[str, str]] = None,
+                             fetch_page: Optional[Callable[[str], str]] = None,
+                             workers: Optional[int] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Fetch listing pages concurrently, following pagination links as they are found
+        
+        At most max_listing_pages pages are fetched, and the crawl stops waiting
+        after listing_crawl_timeout seconds, so a range takes bounded time however
+        many pages it spans.
+        
+        Args:
+            seed_urls: Listing pages to start from, in date order
+            start_date: Start date for event range
+            end_date: End date for event range
+            selectors: Overrides for the parser's listing selectors
+            fetch_page: Callable returning a page's HTML (defaults to the HTTP client)
+            workers: Pages fetched at once (defaults to detail_workers)
+            
+        Returns:
+            Tuple of (pages as {"order", "url", "html", "events"}, URLs that could not be fetched)
+        """
+        fetch_page = fetch_page or self._fetch_page
+        
+        def load(page_url):
+            logger.info(f"Fetching listing: {page_url}")
+            html = fetch_page(page_url)
+            parse_started = time.perf_counter()
+            events, links = self.parser.parse_listing_page(html, page_url, selectors)
+            self._record_timing("listing_parse", time.perf_counter() - parse_started)
+            return html, events, links
+        
+        deadline = time.monotonic() + self.listing_crawl_timeout
+        seen = set(seed_urls)
+        pages = []
+        failed = []
+        executor = ThreadPoolExecutor(max_workers=max(1, min(workers or self.detail_workers, self.max_listing_pages)))
+        try:
+            in_flight = {executor.submit(load, page_url): ((i,), page_url) for i, page_url in enumerate(seed_urls)}
+            while in_flight:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning(f"Listing crawl ran out of time with {len(in_flight)} pages unfinished")
+                    failed.extend(page_url for _, page_url in in_flight.values())
+                    break
+                
+                done, _ = wait(in_flight, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    order, page_url = in_flight.pop(future)
+                    try:
+                        html, events, links = future.result()
+                    except (requests.RequestException, BrowserPageError) as e:
+                        logger.warning(f"Fetch failed for {page_url}: {e}")
+                        failed.append(page_url)
+                        continue
+                    pages.append({"order": order, "url": page_url, "html": html, "events": events})
+                    
+                    if not self._follows_page_links(events, start_date, end_date):
+                        continue
+                    for n, link in enumerate(links):
+                        if link in seen:
+                            continue
+                        if len(seen) >= self.max_listing_pages:
+                            logger.warning(f"Reached {self.max_listing_pages} listing pages, not following {link}")
+                            break
+                        seen.add(link)
+                        in_flight[executor.submit(load, link)] = (order + (n,), link)
+        finally:
+            # Pages still loading past the deadline are abandoned
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        return pages, failed
+    
+    def _scrape_events_async(self, url: str, start_date: date, end_date: date,
+                             selectors: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """
+        Scrape events with the shared async browser
+        
+        Listing and detail pages are rendered as concurrent pages of one
+        Chromium (capped by async_max_pages across every calendar) instead of
+        one browser per worker. The crawl, date filtering and detail pass are
+        the same as the HTTP engine's, so the event schema is identical. Both
+        passes run as many fetches at once as the browser has pages; each fetch
+        thread only waits on the browser's loop, so the cap is the browser's,
+        not detail_workers.
+        """
+        card_class = self.parser.listing_selectors(selectors)["card"]
+        workers = self._get_async_browser().max_pages
         try:
-            # Parse the event date
-            event_date_obj = parse(event_date, fuzzy=True)
+            pages = self._read_listing(url, start_date, end_date, selectors,
+                                       lambda page_url: self._fetch_page_async(page_url, card_class), workers)
+            listing_events = self._merge_listing_pages(pages)
+            logger.info(f"Found {len(listing_events)} event cards on {len(pages)} listing pages")
+            
+            event_data = self._filter_listing_by_date(listing_events, start_date, end_date, chronological=False)
+            logger.info(f"Successfully processed {len(event_data)} events")
+            
+            # Get additional details for each event
+            return self._hydrate_details(event_data, self._get_event_details_async, workers)
             
-            # Compare with start and end dates
-            return start_date <= event_date_obj.date() <= end_date
         except Exception as e:
-            # If there's an error in parsing, exclude the event to be safe
-            logger.warning(f"Could not parse date '{event_date}': {e}")
-            return False
-    def _get_chrome_options_and_service(self):
-        """Get Chrome options and service based on the current platform"""
+            logger.error(f"Error in _scrape_events_async: {str(e)}")
+            raise Exception(f"Failed to scrape events: {str(e)}")
+    
+    def _get_async_browser(self) -> AsyncBrowser:
+        """Get the process-wide async browser (Chromium starts on its first page)"""
+        return get_async_browser(self.async_max_pages, user_agent=self.user_agent)
+    
+    def _fetch_page_async(self, url: str, wait_for_class: Optional[str] = None) -> str:
+        """Render a page in the async browser and return its HTML"""
+        started = time.perf_counter()
+        with self._fetch_slot(url) as fetch:
+            html, fetch["status"] = self._get_async_browser().fetch_html(
+                url, wait_for_class, self.http_timeout, lean=self.browser_profile == "lean"
+            )
+        logger.info(f"Rendered {url} in {(time.perf_counter() - started) * 1000:.0f}ms")
+        
+        if fetch["status"] and fetch["status"] >= 400:
+            raise BrowserPageError(f"{url} answered {fetch['status']}")
+        return html
+    
+    def _get_event_details_async(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Render the event detail page in the async browser and extract additional information
+        
+        Errors are raised so the caller can tell a failed fetch from a hydrated event.
+        """
+        event_link = event.get("event_link", "")
+        if not event_link:
+            logger.warning("No event link provided")
+            return event
+        
+        # Serve recently visited pages from the cache without touching the browser
+        cache = self._get_page_cache()
+        cached = cache.get(event_link) if cache else None
+        if cached and cache.is_fresh(cached):
+            logger.info(f"Using cached detail page: {event_link}")
+            cache.record_hit(cached)
+            return self._parse_detail(cached["body"], event)
+        
+        started = time.perf_counter()
+        html = self._fetch_page_async(event_link)
+        if cache:
+            cache.record_miss()
+            cache.put(event_link, html, fetch_seconds=time.perf_counter() - started)
+        return self._parse_detail(html, event)
+    
+    def _scrape_events_feed(self, feed_url: str, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        """
+        Load events for the date range from a LiveWhale JSON or iCal feed
+        
+        One request per calendar replaces the listing scrape and every detail page visit.
+        """
+        url = feed_url.format(start_date=start_date.strftime('%Y-%m-%d'), end_date=end_date.strftime('%Y-%m-%d'))
+        feed_format = "ics" if url.endswith(".ics") or "/ical/" in url else self.feed_format
+        
+        try:
+            logger.info(f"Fetching {feed_format} feed: {url}")
+            if url.startswith(("http://", "https://")):
+                text = self._fetch_page(url)
+            else:
+                # Saved feed fixture on disk
+                with open(url, "r", encoding="utf-8") as f:
+                    text = f.read()
+            
+            feed_events = self.feed_parser.parse(text, feed_format)
+            logger.info(f"Found {len(feed_events)} feed events")
+            
+            # Feed order is not guaranteed, so every item is checked
+            event_data = self._filter_listing_by_date(feed_events, start_date, end_date, chronological=False)
+            
+            logger.info(f"Successfully processed {len(event_data)} events")
+            return event_data
+            
+        except Exception as e:
+            logger.error(f"Error in _scrape_events_feed: {str(e)}")
+            raise Exception(f"Failed to load event feed: {str(e)}")
+    
+    def _get_event_details_http(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fetch the event detail page over HTTP and extract additional information
+        
+        Errors are raised so the caller can tell a failed fetch from a hydrated event.
+        """
+        event_link = event.get("event_link", "")
+        if not event_link:
+            logger.warning("No event link provided")
+            return event
+        
+        html = self._fetch_page(event_link)
+        return self._parse_detail(html, event)
+    
+    def _parse_detail(self, html: str, event: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract an event's detail fields and count which strategies supplied them"""
+        event, strategies = self.parser.extract_detail(html, event)
+        logger.info(f"Detail fields for {event.get('event_name', 'unknown')} from: {', '.join(strategies) or 'nothing'}")
+        
+        stats = self._detail_stats
+        if stats is not None:
+            with stats["lock"]:
+                stats["pages"] += 1
+                for name in strategies:
+                    stats["counts"][name] += 1
+        return event
+    
+    def _get_chrome_options_and_service(self, browser_profile: Optional[str] = None):
+        """Get Chrome options and service based on the current platform and a browser profile (default: this scraper's)"""
         import platform
         import shutil
         import os
@@ -162,7 +1454,8 @@ class EventScraper:
             chrome_options.add_argument("--disable-backgrounding-occluded-windows")
             
             # Additional options for better compatibility
-            chrome_options.add_argument("--remote-debugging-port=9222")
+            # No fixed --remote-debugging-port: concurrent scrapes would fight over it,
+            # chromedriver picks a free port for each browser instead
             chrome_options.add_argument("--disable-setuid-sandbox")
             chrome_options.add_argument("--disable-software-rasterizer")
             
@@ -236,241 +1529,602 @@ class EventScraper:
             # Use ChromeDriverManager as fallback
             service = Service(ChromeDriverManager().install())
         
+        if (browser_profile or self.browser_profile) == "lean":
+            # Never decode images; the remaining resource types are blocked per lease over CDP
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+            logger.info("Using lean browser profile (images, fonts, stylesheets and analytics blocked)")
+        
         return chrome_options, service
     
-    def _scrape_events_from_url(self, url: str, start_date: date, end_date: date) -> List[Dict[str, Any]]:
-        """Scrape events from a specified URL within the date range"""
+    def _create_driver(self, browser_profile: Optional[str] = None):
+        """Start a new Chrome driver with the platform-specific configuration and a browser profile (default: this scraper's)"""
+        browser_profile = browser_profile or self.browser_profile
+        # Platform detection and driver lookup only run once per scraper and profile
+        if browser_profile not in self._chrome_config:
+            chrome_options, service = self._get_chrome_options_and_service(browser_profile)
+            self._chrome_config[browser_profile] = (chrome_options, service.path)
         
-        # Get platform-specific Chrome configuration
-        chrome_options, service = self._get_chrome_options_and_service()
+        chrome_options, driver_path = self._chrome_config[browser_profile]
+        return webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+    
+    def _create_remote_driver(self, url: str, browser_profile: Optional[str] = None):
+        """Start a Chrome session on a remote WebDriver endpoint with a browser profile (default: this scraper's)"""
+        chrome_options = Options()
+        for argument in ("--headless=new", "--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu",
+                         "--window-size=1920,1080", "--disable-blink-features=AutomationControlled",
+                         f"--user-agent={self.user_agent}"):
+            chrome_options.add_argument(argument)
+        if (browser_profile or self.browser_profile) == "lean":
+            # Remote sessions have no CDP, so images are the only resources the lean profile can block
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        logger.info(f"Starting remote Chrome session on {url}")
+        return webdriver.Remote(command_executor=url, options=chrome_options)
+    
+    def _get_driver_pool(self):
+        """
+        Get the process-wide pool of warm Chrome drivers, or the grid of remote nodes when configured
         
-        # Initialize the driver
-        driver = None
+        Images are switched off at launch, so each browser profile has its own
+        pool; the factories are bound to the profile rather than to whichever
+        scraper happened to create the pool.
+        """
+        profile = self.browser_profile
+        if self.remote_webdrivers:
+            pool = get_webdriver_grid(self.remote_webdrivers,
+                                      lambda url: self._create_remote_driver(url, profile),
+                                      self.drivers_per_node, profile)
+        else:
+            pool = get_driver_pool(lambda: self._create_driver(profile), self.driver_pool_size, profile)
+        # Recycling limits follow the current scraper's settings
+        pool.max_pages = self.driver_max_pages
+        pool.max_rss_mb = self.driver_max_rss_mb
+        return pool
+    
+    def _recycle_if_needed(self, pool, driver):
+        """Swap a driver that hit its page or memory limit for a fresh one with the same profile"""
+        if not pool.needs_recycle(driver):
+            return driver
+        new_driver = pool.recycle(driver)
+        if new_driver is not driver:
+            self._apply_browser_profile(new_driver)
+        return new_driver
+    
+    def _apply_browser_profile(self, driver):
+        """
+        Set this scraper's request blocking on a leased driver
+        
+        Pooled browsers outlive the scraper that started them, so blocking is
+        applied on every lease rather than only at launch.
+        """
+        if not hasattr(driver, "execute_cdp_cmd"):
+            # Remote sessions have no CDP; their lean profile is set through Chrome prefs at launch
+            return
+        blocked_urls = LEAN_BLOCKED_URLS if self.browser_profile == "lean" else []
         try:
-            logger.info("Initializing Chrome driver...")
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            logger.info(f"Successfully initialized Chrome driver, loading: {url}")
-            
-            # Load the page
-            driver.get(url)
-            logger.info("Page loaded successfully")
-            
-            # Wait for events to load with better error handling
-            try:
-                WebDriverWait(driver, 30).until(
-                    EC.presence_of_element_located((By.CLASS_NAME, "lw_cal_event"))
-                )
-                logger.info("Events container found")
-            except TimeoutException:
-                logger.warning("Timeout waiting for events to load")
-                # Check if page loaded at all
-                page_title = driver.title
-                logger.info(f"Page title: {page_title}")
-                # Return empty list instead of failing
-                return []
-            
-            # Add a small delay
-            time.sleep(2)
-            
-            # Find event elements with error checking
-            event_elements = driver.find_elements(By.CLASS_NAME, "lw_cal_event")
-            
-            # DEBUG: Check if event_elements is None
-            if event_elements is None:
-                logger.error("event_elements is None - this shouldn't happen with Selenium")
-                return []
-            
-            logger.info(f"Found {len(event_elements)} event elements")
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_urls})
+        except Exception as e:
+            # Non-Chromium or remote drivers may not expose CDP
+            logger.warning(f"Could not apply {self.browser_profile} browser profile: {e}")
+    
+    def _record_page_load(self, driver, url: str, seconds: float):
+        """Count a browser page load with its load time and bytes transferred"""
+        try:
+            transfer = driver.execute_script(PAGE_TRANSFER_SCRIPT) or {}
+        except Exception as e:
+            logger.warning(f"Could not read transfer size for {url}: {e}")
+            transfer = {}
+        
+        page_bytes = int(transfer.get("bytes") or 0)
+        rss_mb = self._get_driver_pool().record_page(driver, seconds)
+        logger.info(f"Loaded {url} in {seconds * 1000:.0f}ms ({page_bytes} bytes, "
+                    f"{transfer.get('resources', 0)} resources, {self.browser_profile} profile"
+                    f"{f', browser at {rss_mb:.0f}MB' if rss_mb is not None else ''})")
+        
+        stats = self._browser_stats
+        if stats is None:
+            return
+        with stats["lock"]:
+            stats["pages"] += 1
+            stats["bytes"] += page_bytes
+            stats["load_seconds"].append(seconds)
+    
+    def _hydrate_details(self, event_data: List[Dict[str, Any]], fetch_detail,
+                         workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch detail pages for events on a bounded worker pool
+        
+        Args:
+            event_data: Listing-level events
+            fetch_detail: Callable taking an event and returning the hydrated event; it raises
+                when the page cannot be fetched
+            workers: Detail pages fetched at once (defaults to detail_workers)
             
-            # If no events found, check page content
-            if len(event_elements) == 0:
-                logger.warning("No events found on page")
-                # Debug: check page source
-                page_source = driver.page_source
-                logger.info(f"Page source length: {len(page_source) if page_source else 'None'}")
-                if page_source and "lw_cal_event" in page_source:
-                    logger.warning("Events exist in source but not found by selector")
-                return []
+        Returns:
+            Hydrated events in their original order. A failed fetch keeps the basic event data,
+            marked "details_failed", and is neither journaled nor shared with duplicates, so it is retried.
+        """
+        total = len(event_data)
+        # Captured here: detail workers run on their own threads
+        emit = getattr(self._source_context, "emit", None)
+        journal = self._journal
+        lazy = self._lazy
+        
+        def hydrate(indexed_event):
+            event = hydrate_one(indexed_event)
+            if emit:
+                emit(event, total)
+            return event
+        
+        def hydrate_one(indexed_event):
+            i, event = indexed_event
+            previous = self._reuse_previous_event(event)
+            if previous is not None:
+                logger.info(f"Reusing unchanged event {i+1}/{total}: {event['event_name']}")
+                return previous
             
-            # Process events with better error handling
-            event_data = []
+            key = self._event_fingerprint(event)
+            # Another occurrence of this event (in any source) may already be fetching or
+            # replaying it; claimed before the journal so each copy is counted once.
+            # Lazy runs fetch nothing, so they have nothing to share
+            pending, is_owner = self._claim_detail_fetch(event) if lazy is None else (None, True)
+            if not is_owner:
+                original = pending.result()
+                if original is not None:
+                    logger.info(f"Copying details for duplicate event {i+1}/{total}: {event['event_name']}")
+                    hydrated = self._copy_detail_fields(original, event)
+                    if journal:
+                        journal.append(key, hydrated)
+                    return hydrated
+                # The first copy could not be fetched; try this one's page
             
-            for i, element in enumerate(event_elements):
+            hydrated = None
+            try:
+                journaled = journal.replay(key) if journal else None
+                if journaled is not None:
+                    logger.info(f"Replaying journaled event {i+1}/{total}: {event['event_name']}")
+                    hydrated = journaled
+                    return journaled
+                
+                if lazy is not None:
+                    if not event.get("event_link"):
+                        return event
+                    with lazy["lock"]:
+                        lazy["pending"] += 1
+                    return dict(event, details_pending=True)
+                
+                logger.info(f"Getting details for event {i+1}/{total}: {event['event_name']}")
+                fetch_started = time.perf_counter()
+                hydrated = fetch_detail(event)
+                self._record_timing("detail_fetch", time.perf_counter() - fetch_started)
+                if journal:
+                    journal.append(key, hydrated)
+                return hydrated
+            except Exception as e:
+                logger.warning(f"Error getting details for {event['event_name']}: {str(e)}")
+                # Continue with basic event data, flagged so the day cache and the next
+                # incremental run fetch it again
+                return dict(event, details_failed=True)
+            finally:
+                # Duplicates waiting on a failed fetch get None and fetch for themselves
+                if pending is not None and is_owner:
+                    pending.set_result(dict(hydrated) if hydrated is not None else None)
+        
+        workers = max(1, min(workers or self.detail_workers, total))
+        if workers == 1:
+            return [hydrate(indexed_event) for indexed_event in enumerate(event_data)]
+        
+        logger.info(f"Fetching {total} detail pages with {workers} workers")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map() yields results in submission order
+            return list(executor.map(hydrate, enumerate(event_data)))
+    
+    def _hydrate_events_selenium(self, driver, event_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Fetch detail pages with the listing driver plus up to detail_workers - 1 pooled drivers
+        
+        Extra drivers are only leased when every held driver is busy and the
+        shared pool has a browser to spare. A driver that reaches its page or
+        memory limit is swapped for a fresh one between events. This takes
+        ownership of the listing driver: every driver held at the end goes
+        back to the pool.
+        """
+        pool = self._get_driver_pool()
+        max_drivers = max(1, min(self.detail_workers, len(event_data)))
+        idle_drivers = queue.Queue()
+        idle_drivers.put(driver)
+        extra_drivers = []
+        lock = threading.Lock()
+        
+        def lease_driver():
+            try:
+                return idle_drivers.get_nowait()
+            except queue.Empty:
+                pass
+            with lock:
+                can_lease = len(extra_drivers) < max_drivers - 1
+                if can_lease:
+                    extra_drivers.append(None)
+            if can_lease:
                 try:
-                    logger.info(f"Processing event {i+1}/{len(event_elements)}")
-                    
-                    # Extract event details with None checks
-                    title_elements = element.find_elements(By.CSS_SELECTOR, "h4 a")
-                    if not title_elements:
-                        logger.warning(f"No title found for event {i+1}")
-                        continue
-                    
-                    title_element = title_elements[0]
-                    event_name = title_element.text
-                    event_link = title_element.get_attribute("href")
-                    
-                    if not event_name:
-                        logger.warning(f"Empty event name for event {i+1}")
-                        continue
-                    
-                    # Get date/time with None check
-                    date_time_elements = element.find_elements(By.CLASS_NAME, "date-time")
-                    if date_time_elements:
-                        date_time = date_time_elements[0].text
-                        if date_time:  # Check if not None/empty
-                            event_date = date_time.split("·")[0].strip() if "·" in date_time else date_time
-                            event_time = date_time.split("·")[1].strip() if "·" in date_time else ""
-                        else:
-                            logger.warning(f"Empty date_time for event: {event_name}")
-                            event_date = ""
-                            event_time = ""
+                    extra_driver = pool.try_acquire()
+                    if extra_driver:
+                        self._apply_browser_profile(extra_driver)
+                except Exception as e:
+                    logger.warning(f"Could not lease extra detail driver: {e}")
+                    extra_driver = None
+                with lock:
+                    if extra_driver:
+                        extra_drivers[extra_drivers.index(None)] = extra_driver
                     else:
-                        logger.warning(f"No date-time element for event: {event_name}")
-                        event_date = ""
-                        event_time = ""
-                    
-                    # Check if event is within date range
-                    if event_date and not self._is_within_date_range(event_date, start_date, end_date):
-                        logger.info(f"Event outside date range: {event_name}")
-                        continue
-                    
-                    # Get location with None check
-                    location_elements = element.find_elements(By.CLASS_NAME, "map-marker")
-                    location = location_elements[0].text if location_elements and location_elements[0].text else ""
-                    
-                    # Create event object
-                    event = {
-                        "event_name": event_name,
-                        "event_link": event_link or "",
-                        "event_date": event_date,
-                        "event_time": event_time,
-                        "event_location": location,
-                        "event_facilitators": "",
-                        "event_registration_link": "",
-                        "event_description": ""
-                    }
-                    
-                    event_data.append(event)
-                    logger.info(f"Successfully processed: {event_name}")
-                    
-                except (StaleElementReferenceException, NoSuchElementException) as e:
-                    logger.warning(f"Element error for event {i+1}: {str(e)}")
+                        extra_drivers.remove(None)
+                if extra_driver:
+                    logger.info(f"Leased extra detail driver ({len(extra_drivers) + 1}/{max_drivers})")
+                    return extra_driver
+            # Wait for a busy driver to come back
+            return idle_drivers.get()
+        
+        def fetch_detail(event):
+            leased = lease_driver()
+            try:
+                return self._get_event_details(leased, event)
+            finally:
+                idle_drivers.put(self._recycle_if_needed(pool, leased))
+        
+        try:
+            return self._hydrate_details(event_data, fetch_detail)
+        finally:
+            # Every held driver is idle once the pass is over (recycled ones were swapped in place)
+            while True:
+                try:
+                    held_driver = idle_drivers.get_nowait()
+                except queue.Empty:
+                    break
+                pool.release(held_driver)
+    
+    def _extract_listing_page_source(self, driver, selectors: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """
+        Extract every listing card from one page_source snapshot
+        
+        A single WebDriver round trip replaces the 5-7 element lookups per card.
+        Cards are returned unfiltered; the crawl limits them to the date range.
+        """
+        started = time.perf_counter()
+        page_source = driver.page_source
+        parse_started = time.perf_counter()
+        listing_events = self.parser.parse_listing(page_source, driver.current_url, selectors)
+        self._record_timing("listing_parse", time.perf_counter() - parse_started)
+        elapsed = time.perf_counter() - started
+        
+        logger.info(f"Found {len(listing_events)} event cards in {elapsed * 1000:.1f}ms")
+        if not listing_events:
+            logger.warning("No events found on page")
+            return []
+        
+        return listing_events
+    
+    def _extract_listing_elements(self, driver, end_date: date,
+                                  selectors: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """
+        Extract listing cards one WebDriver element lookup at a time
+        
+        Cards are returned unfiltered up to and including the first one past
+        end_date; the listing is chronological, so the rest are not read.
+        """
+        selectors = self.parser.listing_selectors(selectors)
+        
+        # Find event elements with error checking
+        event_elements = driver.find_elements(By.CLASS_NAME, selectors["card"])
+        
+        # DEBUG: Check if event_elements is None
+        if event_elements is None:
+            logger.error("event_elements is None - this shouldn't happen with Selenium")
+            return []
+        
+        logger.info(f"Found {len(event_elements)} event elements")
+        
+        # If no events found, check page content
+        if len(event_elements) == 0:
+            logger.warning("No events found on page")
+            # Debug: check page source
+            page_source = driver.page_source
+            logger.info(f"Page source length: {len(page_source) if page_source else 'None'}")
+            if page_source and selectors["card"] in page_source:
+                logger.warning("Events exist in source but not found by selector")
+            return []
+        
+        # Process events with better error handling
+        event_data = []
+        
+        for i, element in enumerate(event_elements):
+            try:
+                logger.info(f"Processing event {i+1}/{len(event_elements)}")
+                
+                # Extract event details with None checks
+                title_elements = element.find_elements(By.XPATH, selectors["title"])
+                if not title_elements:
+                    logger.warning(f"No title found for event {i+1}")
                     continue
-                except Exception as e:
-                    logger.error(f"Unexpected error processing event {i+1}: {str(e)}")
+                
+                title_element = title_elements[0]
+                event_name = title_element.text
+                event_link = title_element.get_attribute("href")
+                
+                if not event_name:
+                    logger.warning(f"Empty event name for event {i+1}")
                     continue
+                
+                # Get date/time with None check
+                date_time_elements = element.find_elements(By.CLASS_NAME, selectors["date_time"])
+                if date_time_elements:
+                    date_time = date_time_elements[0].text
+                    if date_time:  # Check if not None/empty
+                        event_date = date_time.split("·")[0].strip() if "·" in date_time else date_time
+                        event_time = date_time.split("·")[1].strip() if "·" in date_time else ""
+                    else:
+                        logger.warning(f"Empty date_time for event: {event_name}")
+                        event_date = ""
+                        event_time = ""
+                else:
+                    logger.warning(f"No date-time element for event: {event_name}")
+                    event_date = ""
+                    event_time = ""
+                
+                # The listing is chronological, so nothing after the first event past end_date can match
+                event_day = DateNormalizer.parse_date(event_date) if event_date else None
+                passed_end = event_day is not None and event_day > end_date
+                
+                # Get location with None check
+                location_elements = element.find_elements(By.CLASS_NAME, selectors["location"])
+                location = location_elements[0].text if location_elements and location_elements[0].text else ""
+                
+                # Create event object
+                event = {
+                    "event_name": event_name,
+                    "event_link": event_link or "",
+                    "event_date": event_date,
+                    "event_time": event_time,
+                    "event_location": location,
+                    "event_facilitators": "",
+                    "event_registration_link": "",
+                    "event_description": ""
+                }
+                
+                event_data.append(event)
+                logger.info(f"Successfully processed: {event_name}")
+                if passed_end:
+                    break
+                
+            except (StaleElementReferenceException, NoSuchElementException) as e:
+                logger.warning(f"Element error for event {i+1}: {str(e)}")
+                continue
+            except Exception as e:
+                logger.error(f"Unexpected error processing event {i+1}: {str(e)}")
+                continue
+        
+        return event_data
+    
+    def _scrape_events_from_url(self, url: str, start_date: date, end_date: date,
+                                selectors: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """Scrape events from a specified URL within the date range"""
+        # Lease a warm driver from the shared pool
+        pool = self._get_driver_pool()
+        driver = None
+        try:
+            logger.info("Leasing Chrome driver...")
+            driver = pool.acquire()
+            self._apply_browser_profile(driver)
+            logger.info("Successfully leased Chrome driver")
             
-            logger.info(f"Successfully processed {len(event_data)} events")
+            windows = self._listing_windows(url, start_date, end_date)
+            pages, failed = self._crawl_listing_selenium(driver, windows, start_date, end_date, selectors) if windows else ([], [])
+            if not windows or failed:
+                # Days whose window never rendered are read from the full listing instead
+                full_pages, full_failed = self._crawl_listing_selenium(driver, [url], start_date, end_date, selectors)
+                pages.extend(dict(page, order=(len(windows),) + page["order"]) for page in full_pages)
+                failed = failed + full_failed
+            self._record_listing_failures(failed)
+            if not pages:
+                # Return empty list instead of failing
+                return []
             
-            # Get additional details for each event
-            for i, event in enumerate(event_data):
-                try:
-                    logger.info(f"Getting details for event {i+1}/{len(event_data)}: {event['event_name']}")
-                    event_data[i] = self._get_event_details(driver, event)
-                except Exception as e:
-                    logger.warning(f"Error getting details for {event['event_name']}: {str(e)}")
-                    # Continue with basic event data
+            event_data = self._filter_listing_by_date(
+                self._merge_listing_pages(pages), start_date, end_date, chronological=False
+            )
             
-            return event_data
+            logger.info(f"Successfully processed {len(event_data)} events")
+            
+            # Get additional details for each event; the detail pass returns the driver to the pool
+            listing_driver, driver = driver, None
+            return self._hydrate_events_selenium(listing_driver, event_data)
             
         except Exception as e:
             logger.error(f"Error in _scrape_events_from_url: {str(e)}")
             raise Exception(f"Failed to scrape events: {str(e)}")
             
         finally:
-            # Always close the driver
+            # Always hand the driver back; the pool resets or replaces it
             if driver:
-                try:
-                    driver.quit()
-                    logger.info("Chrome driver closed successfully")
-                except Exception as e:
-                    logger.warning(f"Error closing driver: {e}")
-    def _get_event_details(self, driver, event: Dict[str, Any]) -> Dict[str, Any]:
-        """Visit the event detail page and extract additional information"""
-        try:
-            # Navigate to the event detail page
-            event_link = event.get("event_link", "")
-            if not event_link:
-                logger.warning("No event link provided")
-                return event
-                
-            logger.info(f"Navigating to: {event_link}")
-            driver.get(event_link)
-            
-            # Wait for the page to load
-            WebDriverWait(driver, 20).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+                pool.release(driver)
+                logger.info("Chrome driver returned to pool")
+    
+    def _crawl_listing_selenium(self, driver, seed_urls: List[str], start_date: date, end_date: date,
+                                selectors: Optional[Dict[str, str]] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Read listing pages one after another in the browser, following pagination links
+        
+        The same page and time limits as the HTTP crawl apply. A page that
+        renders an empty listing is read with no events; a page whose listing
+        never renders, or that is left unread when time runs out, is reported
+        as failed.
+        
+        Returns:
+            Tuple of (pages as {"order", "url", "events"} with events already limited
+            to the date range, URLs that could not be read)
+        """
+        selectors = self.parser.listing_selectors(selectors)
+        deadline = time.monotonic() + self.listing_crawl_timeout
+        to_visit = [((i,), page_url) for i, page_url in enumerate(seed_urls)]
+        seen = set(seed_urls)
+        pages = []
+        failed = []
+        
+        while to_visit:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(f"Listing crawl ran out of time with {len(to_visit)} pages unread")
+                failed.extend(page_url for _, page_url in to_visit)
+                break
             
-            # Add a small delay
-            time.sleep(1)
+            # An empty window never shows a card, so no page may wait longer than its share of the budget
+            timeout = min(30, remaining / len(to_visit))
+            order, page_url = to_visit.pop(0)
+            if not self._load_listing_page(driver, page_url, selectors, timeout):
+                failed.append(page_url)
+                continue
             
-            # Get registration link if available
-            try:
-                reg_elements = driver.find_elements(By.CLASS_NAME, "lw_join_online")
-                if reg_elements:
-                    reg_element = reg_elements[0]
-                    reg_link = reg_element.get_attribute("href")
-                    if reg_link:
-                        event["event_registration_link"] = reg_link
-            except Exception as e:
-                logger.warning(f"Error getting registration link: {e}")
+            # Extract the listing cards
+            if self.listing_extraction == "page_source":
+                cards = self._extract_listing_page_source(driver, selectors)
+            else:
+                cards = self._extract_listing_elements(driver, end_date, selectors)
+            events = self._filter_listing_by_date(cards, start_date, end_date)
+            pages.append({"order": order, "url": page_url, "events": events})
             
-            # Method 1: Try to get from the intro div
-            try:
-                intro_elements = driver.find_elements(By.CLASS_NAME, "intro")
-                if intro_elements:
-                    intro_div = intro_elements[0]
-                    intro_text = intro_div.text
-                    
-                    if intro_text:  # Check if not None/empty
-                        # Parse facilitator
-                        facilitator_match = re.search(r'Facilitator[s]?:\s*(.*?)(?:\s*Description:|$)', intro_text, re.DOTALL)
-                        if facilitator_match:
-                            event["event_facilitators"] = facilitator_match.group(1).strip()
-                        
-                        # Parse description (from intro)
-                        description_match = re.search(r'Description:\s*(.*?)$', intro_text, re.DOTALL)
-                        if description_match:
-                            event["event_description"] = description_match.group(1).strip()
-            except Exception as e:
-                logger.warning(f"Error parsing intro div: {e}")
+            # As in the HTTP crawl, the unfiltered cards decide whether the listing goes on,
+            # so a page whose cards all precede start_date still leads to the next one
+            if not self._follows_page_links(cards, start_date, end_date):
+                continue
+            links = [element.get_attribute("href") for element in driver.find_elements(By.XPATH, selectors["pagination"])]
+            for n, link in enumerate(link.split("#")[0] for link in links if link):
+                if link in seen:
+                    continue
+                if len(seen) >= self.max_listing_pages:
+                    logger.warning(f"Reached {self.max_listing_pages} listing pages, not following {link}")
+                    break
+                seen.add(link)
+                to_visit.append((order + (n,), link))
+        
+        return pages, failed
+    
+    def _load_listing_page(self, driver, listing_url: str, selectors: Dict[str, str], timeout: float) -> bool:
+        """
+        Load a listing page and wait for its event cards
+        
+        Returns:
+            True once cards appear or the page settles on an empty listing, False if
+            the listing never renders
+        """
+        card_class = selectors["card"]
+        logger.info(f"Loading listing: {listing_url}")
+        started = time.perf_counter()
+        with self._fetch_slot(listing_url):
+            driver.get(listing_url)
+        self._record_page_load(driver, listing_url, time.perf_counter() - started)
+        logger.info("Page loaded successfully")
+        
+        # Cards render in batches: the listing is ready once their count stops changing,
+        # or once the network goes quiet on a page that has none (an empty window)
+        ready_by = self._wait_until_ready(driver, "listing", [
+            ("cards_settled", self._cards_settled(card_class)),
+            ("network_idle", self._network_idle)
+        ], timeout)
+        if ready_by == "cards_settled" or driver.find_elements(By.CLASS_NAME, card_class):
+            logger.info("Events container found")
+            return True
+        if ready_by and self.parser.listing_rendered(driver.page_source, selectors):
+            logger.info(f"No events at {listing_url} (empty listing)")
+            return True
+        
+        logger.warning(f"No event cards at {listing_url} ({'page went idle' if ready_by else 'timed out'})")
+        # Check if page loaded at all
+        logger.info(f"Page title: {driver.title}")
+        return False
+    
+    def _wait_until_ready(self, driver, page_type: str, checks: List[Tuple[str, Callable[[Any], bool]]],
+                          timeout: float) -> Optional[str]:
+        """
+        Poll readiness checks until one passes and record the wait under page_type
+        
+        Args:
+            driver: Driver showing the page
+            page_type: Histogram the wait is recorded in ("listing" or "detail")
+            checks: (name, check) pairs tried in order on every poll
+            timeout: Seconds to wait before giving up
+        
+        Returns:
+            Name of the check that passed, or None on timeout
+        """
+        started = time.perf_counter()
+        try:
+            ready_by = WebDriverWait(driver, timeout, poll_frequency=self.readiness_poll_seconds).until(
+                lambda d: next((name for name, check in checks if check(d)), None)
+            )
+        except TimeoutException:
+            ready_by = None
+        
+        waits = self._waits
+        if waits is not None:
+            with waits["lock"]:
+                waits[page_type].append((time.perf_counter() - started, ready_by or "timeout"))
+        return ready_by
+    
+    def _cards_settled(self, card_class: str) -> Callable[[Any], bool]:
+        """Readiness check: event cards are present and their count held steady since the previous poll"""
+        last = {"count": 0}
+        
+        def check(driver) -> bool:
+            count = len(driver.find_elements(By.CLASS_NAME, card_class))
+            settled = count > 0 and count == last["count"]
+            last["count"] = count
+            return settled
+        
+        return check
+    
+    def _network_idle(self, driver) -> bool:
+        """Readiness check: the page has loaded and no request started for network_idle_ms"""
+        return bool(driver.execute_script(NETWORK_IDLE_SCRIPT, self.network_idle_ms))
+    
+    def _get_event_details(self, driver, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Visit the event detail page and extract additional information
+        
+        Errors are raised so the caller can tell a failed fetch from a hydrated event.
+        """
+        # Navigate to the event detail page
+        event_link = event.get("event_link", "")
+        if not event_link:
+            logger.warning("No event link provided")
+            return event
             
-            # Method 2: Try to get description from lw_calendar_event_description
-            if not event.get("event_description"):
-                try:
-                    desc_elements = driver.find_elements(By.CLASS_NAME, "lw_calendar_event_description")
-                    if desc_elements:
-                        description_div = desc_elements[0]
-                        desc_text = description_div.text
-                        if desc_text:  # Check if not None/empty
-                            event["event_description"] = desc_text.strip()
-                except Exception as e:
-                    logger.warning(f"Error getting description: {e}")
+        # Serve recently visited pages from the cache without touching the browser
+        cache = self._get_page_cache()
+        cached = cache.get(event_link) if cache else None
+        if cached and cache.is_fresh(cached):
+            logger.info(f"Using cached detail page: {event_link}")
+            cache.record_hit(cached)
+            return self._parse_detail(cached["body"], event)
             
-            # Method 3: If facilitator is still empty, try alternative parsing
-            if not event.get("event_facilitators"):
-                try:
-                    body_element = driver.find_element(By.TAG_NAME, "body")
-                    page_content = body_element.text if body_element else ""
-                    
-                    if page_content:  # Check if not None/empty
-                        # Look for typical facilitator patterns
-                        facilitator_patterns = [
-                            r'Facilitator[s]?:\s*(.*?)(?:\n|Description:)',
-                            r'Presenter[s]?:\s*(.*?)(?:\n|Description:)',
-                            r'Instructor[s]?:\s*(.*?)(?:\n|Description:)'
-                        ]
-                        
-                        for pattern in facilitator_patterns:
-                            match = re.search(pattern, page_content, re.DOTALL)
-                            if match:
-                                event["event_facilitators"] = match.group(1).strip()
-                                break
-                except Exception as e:
-                    logger.warning(f"Error in alternative facilitator parsing: {e}")
-                    
-        except Exception as e:
-            logger.warning(f"Error getting details for {event.get('event_name', 'unknown')}: {str(e)}")
+        logger.info(f"Navigating to: {event_link}")
+        started = time.perf_counter()
+        with self._fetch_slot(event_link):
+            driver.get(event_link)
+        load_seconds = time.perf_counter() - started
+        self._record_page_load(driver, event_link, load_seconds)
+        
+        # Parse as soon as a node the detail strategies read is present; pages without
+        # one are parsed once the network goes quiet, or as-is after the timeout
+        self._wait_until_ready(driver, "detail", [
+            ("detail_content", lambda d: bool(d.find_elements(By.CSS_SELECTOR, DETAIL_READY_SELECTOR))),
+            ("network_idle", self._network_idle)
+        ], self.detail_ready_timeout)
+        
+        # One round trip for the whole page; every field is extracted from the parsed HTML
+        page_source = driver.page_source
+        if cache:
+            cache.record_miss()
+            cache.put(event_link, page_source, fetch_seconds=load_seconds)
         
-        return event
\ No newline at end of file
+        return self._parse_detail(page_source, event)
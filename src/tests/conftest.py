@@ -0,0 +1,6 @@
+# app/tests/conftest.py
+import sys
+from pathlib import Path
+
+# Make the app modules importable the same way app.py and the benchmarks do
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
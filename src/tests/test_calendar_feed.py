@@ -0,0 +1,69 @@
+# app/tests/test_calendar_feed.py
+import datetime
+from pathlib import Path
+
+import pytest
+
+from services.calendar_feed import CalendarFeedParser
+from services.scraper import EventScraper
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+# Both saved feeds describe the same four events
+EXPECTED = [
+    ("GMA | Assessing Understanding", "Monday, July 21, 2025", "11:30am - 1:00pm CDT"),
+    ("Writing Retreat", "Tuesday, July 22, 2025", "2:00pm - 4:30pm CDT"),
+    ("Campus Closed", "Friday, July 25, 2025", "All day"),
+    ("Fall Kickoff", "Monday, August 18, 2025", "9:00am CDT"),
+]
+
+
+def read_fixture(name):
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("name, feed_format", [("feed.json", "json"), ("feed.ics", "ics")])
+def test_parse_saved_feed(name, feed_format):
+    events = CalendarFeedParser().parse(read_fixture(name), feed_format)
+    assert [(event["event_name"], event["event_date"], event["event_time"]) for event in events] == EXPECTED
+
+    first = events[0]
+    assert first["event_link"] == "https://calendar.tamu.edu/cte/event/354510"
+    assert first["event_location"] == "Zoom"
+    assert first["event_facilitators"] == "Jean Layne, CTE"
+    assert first["event_description"] == "Assessment choices are informed."
+    assert events[1]["event_description"] == "Quiet writing time."
+
+
+def test_json_feed_fields():
+    events = CalendarFeedParser().parse(read_fixture("feed.json"), "json")
+    assert events[0]["event_registration_link"] == "https://tamu.zoom.us/j/123"
+    # A bare list is read the same as the widget's {"data": [...]} wrapper
+    assert CalendarFeedParser().parse('[{"title": "Solo", "date_iso": "2025-07-21T10:00:00-05:00"}]', "json")[0]["event_time"] == "10:00am CDT"
+    assert CalendarFeedParser().parse("", "json") == []
+
+
+def test_ics_feed_escapes_and_folding():
+    events = CalendarFeedParser().parse(read_fixture("feed.ics"), "ics")
+    assert events[1]["event_location"] == "Evans Library 204; Room B"
+
+
+@pytest.mark.parametrize("dtstart, expected_date, expected_time", [
+    # Another zone's wall time is shown in the calendar's zone
+    ("DTSTART;TZID=America/New_York:20250721T130000", "Monday, July 21, 2025", "12:00pm CDT"),
+    # UTC past midnight is still the previous day in Texas
+    ("DTSTART:20250722T030000Z", "Monday, July 21, 2025", "10:00pm CDT"),
+    # Floating times are read in the calendar's zone, which is on standard time in winter
+    ("DTSTART:20251201T090000", "Monday, December 1, 2025", "9:00am CST"),
+    ("DTSTART;VALUE=DATE:20251201", "Monday, December 1, 2025", "All day"),
+])
+def test_ics_dates(dtstart, expected_date, expected_time):
+    text = f"BEGIN:VCALENDAR\nBEGIN:VEVENT\nSUMMARY:Event\n{dtstart}\nEND:VEVENT\nEND:VCALENDAR\n"
+    event = CalendarFeedParser().parse(text, "ics")[0]
+    assert (event["event_date"], event["event_time"]) == (expected_date, expected_time)
+
+
+def test_feed_engine_reads_saved_feed_and_filters_the_range():
+    scraper = EventScraper()
+    events = scraper._scrape_events_feed(str(FIXTURES / "feed.ics"), datetime.date(2025, 7, 21), datetime.date(2025, 7, 31))
+    assert [event["event_name"] for event in events] == ["GMA | Assessing Understanding", "Writing Retreat", "Campus Closed"]
@@ -0,0 +1,91 @@
+# app/tests/test_calendar_parser.py
+import datetime
+
+import pytest
+
+from services.calendar_parser import CalendarPageParser
+from services.scraper import EventScraper
+
+LISTING = """<html><body><div class="lw_cal_event_list">
+<div class="lw_cal_event"><h4><a href="/cte/event/1-foo">Foo</a></h4>
+<div class="date-time">Monday, July 21, 2025 · 11:30am - 1:00pm CDT</div><div class="map-marker">Zoom</div></div>
+</div></body></html>"""
+
+EMPTY_LISTING = """<html><body><div class="lw_cal_event_list">
+<p class="lw_cal_no_events">There are no events to display.</p>
+</div></body></html>"""
+
+# A calendar whose listing is built in the browser: only the app shell is served
+JS_SHELL = """<html><body><div id="lw_cal_app"></div><script src="/live/calendar.js"></script></body></html>"""
+
+
+@pytest.mark.parametrize("html, rendered", [
+    (LISTING, True),
+    (EMPTY_LISTING, True),
+    ("<html><body><div class='lw_widget_empty'>No events</div></body></html>", True),
+    (JS_SHELL, False),
+    ("", False),
+    (None, False),
+])
+def test_listing_rendered(html, rendered):
+    parser = CalendarPageParser()
+    assert parser.listing_rendered(html) is rendered
+    assert parser.needs_javascript(html) is not rendered
+
+
+def test_parse_listing_cards():
+    events = CalendarPageParser().parse_listing(LISTING, "https://calendar.tamu.edu/cte/all")
+    assert [(event["event_name"], event["event_link"], event["event_time"]) for event in events] == [
+        ("Foo", "https://calendar.tamu.edu/cte/event/1-foo", "11:30am - 1:00pm CDT")
+    ]
+    assert CalendarPageParser().parse_listing(EMPTY_LISTING, "https://calendar.tamu.edu/cte/all") == []
+
+
+def make_scraper(pages):
+    """Scraper reading listing pages from a dict, recording any fall back to the browser"""
+    scraper = EventScraper()
+    scraper.use_date_window = False
+    scraper._fetch_page = lambda url: pages[url]
+    scraper.browser_fallbacks = []
+    scraper._scrape_events_from_url = lambda url, *args: scraper.browser_fallbacks.append(url) or []
+    return scraper
+
+
+def test_empty_listing_does_not_fall_back_to_the_browser():
+    scraper = make_scraper({"https://calendar.tamu.edu/elp/all": EMPTY_LISTING})
+    events = scraper._scrape_events_http("https://calendar.tamu.edu/elp/all",
+                                         datetime.date(2025, 7, 20), datetime.date(2025, 8, 4))
+    assert events == []
+    assert scraper.browser_fallbacks == []
+
+
+def test_javascript_listing_falls_back_to_the_browser():
+    scraper = make_scraper({"https://calendar.tamu.edu/elp/all": JS_SHELL})
+    scraper._scrape_events_http("https://calendar.tamu.edu/elp/all",
+                                datetime.date(2025, 7, 20), datetime.date(2025, 8, 4))
+    assert scraper.browser_fallbacks == ["https://calendar.tamu.edu/elp/all"]
+
+
+def test_empty_date_window_is_not_a_failure():
+    base = "https://calendar.tamu.edu/cte/all"
+    scraper = make_scraper({
+        f"{base}/start/2025-07-14/end/2025-07-20": EMPTY_LISTING,
+        f"{base}/start/2025-07-21/end/2025-07-27": LISTING,
+    })
+    scraper.use_date_window = True
+    scraper._get_event_details_http = lambda event: dict(event, event_description="Details")
+    # Only the windows are fetched: a missing window or the full listing would raise KeyError
+    events = scraper._scrape_events_http(base, datetime.date(2025, 7, 14), datetime.date(2025, 7, 27))
+    assert [(event["event_name"], event["event_description"]) for event in events] == [("Foo", "Details")]
+    assert scraper.browser_fallbacks == []
+
+
+def test_empty_date_windows_return_no_events():
+    base = "https://calendar.tamu.edu/elp/all"
+    scraper = make_scraper({
+        f"{base}/start/2025-07-14/end/2025-07-20": EMPTY_LISTING,
+        f"{base}/start/2025-07-21/end/2025-07-27": EMPTY_LISTING,
+    })
+    scraper.use_date_window = True
+    assert scraper._scrape_events_http(base, datetime.date(2025, 7, 14), datetime.date(2025, 7, 27)) == []
+    assert scraper.browser_fallbacks == []
@@ -0,0 +1,32 @@
+# app/tests/test_calendar_sources.py
+import datetime
+
+from services.calendar_sources import events_by_source
+from services.scraper import EventScraper
+
+START, END = datetime.date(2025, 7, 21), datetime.date(2025, 7, 22)
+
+
+def test_events_by_source_groups_the_section_lists():
+    events_data = {
+        "cte_events": [{"event_name": "Foo", "source": "cte"}, {"event_name": "Added by hand"}],
+        "elp_events": [{"event_name": "Bar", "source": "elp"}, {"event_name": "Baz", "source": "library"}],
+    }
+    grouped = events_by_source(events_data)
+    assert {name: [event["event_name"] for event in events] for name, events in grouped.items()} == {
+        "cte": ["Foo", "Added by hand"], "elp": ["Bar"], "library": ["Baz"]
+    }
+    # Groups hold the section events themselves, so edits to either are the same edit
+    assert grouped["cte"][0] is events_data["cte_events"][0]
+
+
+def test_scrape_saves_only_the_section_lists(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    scraper = EventScraper()
+    scraper.use_day_cache = False
+    scraper._scrape_source = lambda url, *args: [{"event_name": url.split("/")[-2].upper()}]
+    success, data = scraper.scrape_events(START, END)
+    assert success
+    assert "events_by_source" not in data
+    assert data["cte_events"] == [{"event_name": "CTE", "source": "cte"}]
+    assert {name: len(events) for name, events in events_by_source(data).items()} == {"cte": 1, "elp": 1}
@@ -0,0 +1,63 @@
+# app/tests/test_date_normalizer.py
+import datetime
+
+import pytest
+
+from utils.date_normalizer import DateNormalizer
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Monday, June 9, 2025", datetime.date(2025, 6, 9)),
+    ("Sept 3 2025", datetime.date(2025, 9, 3)),
+    ("2025-06-09", datetime.date(2025, 6, 9)),
+    ("6/9/2025", datetime.date(2025, 6, 9)),
+    ("", None),
+])
+def test_parse_date(text, expected):
+    assert DateNormalizer.parse_date(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("11:30am - 1:00pm CDT", (datetime.time(11, 30), datetime.time(13, 0))),
+    ("11:30 - 1:00pm", (datetime.time(11, 30), datetime.time(13, 0))),
+    ("2 - 3pm", (datetime.time(14, 0), datetime.time(15, 0))),
+    ("10:00 - 1:00am", (datetime.time(10, 0), datetime.time(1, 0))),
+    ("10pm - 1am", (datetime.time(22, 0), datetime.time(1, 0))),
+    ("Noon - 1pm", (datetime.time(12, 0), datetime.time(13, 0))),
+    ("11am - noon", (datetime.time(11, 0), datetime.time(12, 0))),
+    ("9pm - Midnight", (datetime.time(21, 0), datetime.time(0, 0))),
+    ("2 pm", (datetime.time(14, 0), None)),
+    ("Noon", (datetime.time(12, 0), None)),
+    ("All day", (None, None)),
+    ("", (None, None)),
+])
+def test_parse_time_range(text, expected):
+    assert DateNormalizer.parse_time_range(text) == expected
+
+
+def test_normalize_event_with_time_range():
+    event = DateNormalizer.normalize_event({"event_date": "Monday, June 9, 2025", "event_time": "11:30am - 1:00pm"})
+    assert event["start"] == "2025-06-09T11:30:00-05:00"
+    assert event["end"] == "2025-06-09T13:00:00-05:00"
+
+
+def test_normalize_event_overnight_ends_next_day():
+    event = DateNormalizer.normalize_event({"event_date": "June 9, 2025", "event_time": "10:00pm - 1:00am"})
+    assert event["start"] == "2025-06-09T22:00:00-05:00"
+    assert event["end"] == "2025-06-10T01:00:00-05:00"
+
+
+def test_normalize_event_without_time_keeps_date_only():
+    event = DateNormalizer.normalize_event({"event_date": "June 9, 2025", "event_time": "", "end": "stale"})
+    assert event["start"] == "2025-06-09"
+    assert "end" not in event
+
+
+def test_normalize_event_without_date_drops_iso_fields():
+    event = DateNormalizer.normalize_event({"event_date": "", "start": "stale", "end": "stale"})
+    assert "start" not in event and "end" not in event
+
+
+def test_event_day_prefers_start():
+    assert DateNormalizer.event_day({"start": "2025-06-10T09:00:00-05:00", "event_date": "June 9, 2025"}) == datetime.date(2025, 6, 10)
+    assert DateNormalizer.event_day({"event_date": "June 9, 2025"}) == datetime.date(2025, 6, 9)
@@ -0,0 +1,97 @@
+# app/tests/test_day_cache.py
+import datetime
+
+import pytest
+import requests
+
+from services.scraper import EventScraper
+from utils.day_cache import DayCache
+
+START, END = datetime.date(2025, 7, 21), datetime.date(2025, 7, 22)
+CTE_URL = "https://calendar.tamu.edu/cte/all"
+ELP_URL = "https://calendar.tamu.edu/elp/all"
+
+LISTING = """<html><body><div class="lw_cal_event_list">
+<div class="lw_cal_event"><h4><a href="/cte/event/1-foo">Foo</a></h4>
+<div class="date-time">Monday, July 21, 2025 · 11:30am - 1:00pm CDT</div></div>
+</div></body></html>"""
+EMPTY_LISTING = """<html><body><div class="lw_cal_event_list"><p class="lw_cal_no_events">No events</p></div></body></html>"""
+
+
+def event(name, day, **fields):
+    return dict({"event_name": name, "event_link": f"https://calendar.tamu.edu/cte/event/{name}",
+                 "event_date": day.strftime("%A, %B %d, %Y"), "event_time": ""}, **fields)
+
+
+def test_days_with_failed_details_are_not_served(tmp_path):
+    cache = DayCache(str(tmp_path))
+    cache.put_range("cte", START, END, [event("a", START, details_failed=True), event("b", END)], "http")
+    cached, missing = cache.lookup("cte", START, END, "http")
+    assert list(cached) == [END]
+    assert missing == [START]
+
+
+@pytest.fixture
+def scraper_factory(tmp_path, monkeypatch):
+    """Scrapers sharing a day cache in tmp_path, reading pages from a dict"""
+    monkeypatch.chdir(tmp_path)
+
+    def make(pages, fetch_detail):
+        scraper = EventScraper()
+        scraper.sources.get("cte")["url"] = CTE_URL
+        scraper.sources.get("elp")["url"] = ELP_URL
+        scraper.use_date_window = False
+        scraper.use_page_cache = False
+
+        def fetch_page(url):
+            page = pages[url]
+            if isinstance(page, Exception):
+                raise page
+            return page
+
+        scraper._fetch_page = fetch_page
+        scraper._get_event_details_http = fetch_detail
+        return scraper
+
+    return make
+
+
+def test_failed_detail_fetch_is_retried_on_the_next_run(scraper_factory):
+    pages = {CTE_URL: LISTING, ELP_URL: EMPTY_LISTING}
+
+    def missing_page(event):
+        raise requests.HTTPError("404 Client Error")
+
+    success, data = scraper_factory(pages, missing_page).scrape_events(START, END)
+    assert success
+    assert data["cte_events"][0]["details_failed"] is True
+
+    success, data = scraper_factory(pages, lambda event: dict(event, event_description="Details")).scrape_events(START, END)
+    assert [event["event_description"] for event in data["cte_events"]] == ["Details"]
+    # Only the day holding the failed event is scraped again
+    assert data["scrape_stats"]["day_cache"]["sources"]["cte"] == {"cached_days": 1, "fetched_days": 1, "cached_events": 0}
+
+
+def test_range_with_an_unread_listing_window_is_not_cached(scraper_factory):
+    details = lambda event: dict(event, event_description="Details")
+    first_window, second_window = (f"{CTE_URL}/start/{day}/end/{day}" for day in ("2025-07-21", "2025-07-22"))
+    pages = {
+        first_window: requests.ConnectionError("timed out"),
+        second_window: EMPTY_LISTING,
+        CTE_URL: requests.ConnectionError("timed out"),
+        **{f"{ELP_URL}/start/{day}/end/{day}": EMPTY_LISTING for day in ("2025-07-21", "2025-07-22")}
+    }
+
+    def make(pages):
+        scraper = scraper_factory(pages, details)
+        scraper.use_date_window = True
+        scraper.listing_window_days = 1
+        return scraper
+
+    success, data = make(pages).scrape_events(START, END)
+    assert data["cte_events"] == []
+
+    pages[first_window] = LISTING
+    success, data = make(pages).scrape_events(START, END)
+    assert [event["event_name"] for event in data["cte_events"]] == ["Foo"]
+    assert data["scrape_stats"]["day_cache"]["sources"]["cte"]["cached_days"] == 0
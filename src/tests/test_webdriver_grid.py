@@ -0,0 +1,137 @@
+# app/tests/test_webdriver_grid.py
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from utils.webdriver_grid import WebDriverGrid
+
+
+class FakeDriver:
+    """Just enough of a WebDriver for the pools to reset, health-check and quit it"""
+
+    def __init__(self, url):
+        self.url = url
+        self.window_handles = ["main"]
+        self.quit_called = False
+        self.switch_to = self
+
+    def window(self, handle):
+        pass
+
+    def delete_all_cookies(self):
+        pass
+
+    def get(self, url):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+def serve_status(ready):
+    """Start a local WebDriver /status endpoint; ready is a dict so tests can flip it"""
+    class StatusHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = json.dumps({"value": {"ready": ready["value"], "message": "busy"}}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StatusHandler)
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+@pytest.fixture
+def nodes():
+    """Two local nodes, both ready"""
+    servers = [serve_status({"value": True}) for _ in range(2)]
+    yield [url for _, url in servers]
+    for server, _ in servers:
+        server.shutdown()
+
+
+def make_grid(urls, **kwargs):
+    started = []
+
+    def create_driver(url):
+        driver = FakeDriver(url)
+        started.append(driver)
+        return driver
+
+    return WebDriverGrid(urls, create_driver, **kwargs), started
+
+
+def test_leases_spread_across_nodes(nodes):
+    grid, _ = make_grid(nodes, drivers_per_node=1)
+    first, second = grid.acquire(timeout=1), grid.acquire(timeout=1)
+    assert {first.url, second.url} == set(nodes)
+    assert grid.try_acquire() is None
+    grid.release(first)
+    assert grid.acquire(timeout=1) is first
+
+
+def test_node_that_is_not_ready_is_skipped():
+    ready, unready = serve_status({"value": True}), serve_status({"value": False})
+    try:
+        grid, _ = make_grid([unready[1], ready[1]], drivers_per_node=2)
+        drivers = [grid.acquire(timeout=1) for _ in range(2)]
+        assert {driver.url for driver in drivers} == {ready[1]}
+        assert grid.get_stats()["nodes"][unready[1]]["healthy"] is False
+    finally:
+        ready[0].shutdown()
+        unready[0].shutdown()
+
+
+def test_retired_and_recycled_drivers_are_forgotten(nodes):
+    grid, started = make_grid(nodes[:1], drivers_per_node=1, max_pages=1)
+    driver = grid.acquire(timeout=1)
+    grid.record_page(driver)
+    assert grid.needs_recycle(driver)
+
+    replacement = grid.recycle(driver)
+    assert replacement is not driver and driver.quit_called
+    assert grid._node_of(driver) is None
+    assert grid._node_of(replacement)["url"] == nodes[0]
+
+    grid.record_page(replacement)
+    grid.release(replacement)
+    assert replacement.quit_called
+    assert grid._owners == {}
+    assert len(started) == 2
+
+
+def test_shutdown_forgets_idle_and_released_drivers(nodes):
+    grid, _ = make_grid(nodes, drivers_per_node=1)
+    idle, leased = grid.acquire(timeout=1), grid.acquire(timeout=1)
+    grid.release(idle)
+
+    grid.shutdown()
+    assert idle.quit_called
+    assert grid._node_of(idle) is None
+
+    grid.release(leased)
+    assert leased.quit_called
+    assert grid._owners == {}
+
+
+def test_work_moves_off_a_slow_node(nodes):
+    grid, _ = make_grid(nodes, drivers_per_node=1, max_pages=None)
+    slow, fast = grid.acquire(timeout=1), grid.acquire(timeout=1)
+    grid.record_page(slow, 2.0)
+    grid.record_page(fast, 0.1)
+    grid.release(fast)
+
+    assert grid.needs_recycle(slow) == f"node {slow.url} is slow"
+    moved = grid.recycle(slow)
+    assert moved is fast
+    assert grid.get_stats()["rebalanced"] == 1
+    # The slow node's driver went back to its pool, not away
+    assert not slow.quit_called and grid._node_of(slow)["url"] == slow.url
@@ -3,5 +3,10 @@ from .logger import app_logger
 from .state_manager import StateManager
 from .process_runner import ProcessRunner
 from .data_persistence import DataPersistence
+from .driver_pool import DriverPool, get_driver_pool
+from .webdriver_grid import WebDriverGrid, get_webdriver_grid
+from .async_browser import AsyncBrowser, get_async_browser
+from .scrape_journal import ScrapeJournal
+from .rate_limiter import HostRateLimiter, get_rate_limiter
 
-__all__ = ['app_logger', 'StateManager', 'ProcessRunner']
\ No newline at end of file
+__all__ = ['app_logger', 'StateManager', 'ProcessRunner', 'DriverPool', 'WebDriverGrid', 'AsyncBrowser', 'ScrapeJournal', 'HostRateLimiter']
\ No newline at end of file
@@ -0,0 +1,241 @@
+# app/utils/async_browser.py
+import os
+import atexit
+import asyncio
+import shutil
+import threading
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    from playwright.async_api import async_playwright, Error as PlaywrightError
+except ImportError:
+    async_playwright = None
+    PlaywrightError = Exception
+
+from utils.driver_pool import process_tree_rss_mb
+
+logger = logging.getLogger("tamu_newsletter")
+
+# Resource types the lean profile aborts: we only read text and hrefs
+LEAN_BLOCKED_RESOURCES = ("image", "media", "font", "stylesheet")
+LEAN_BLOCKED_HOSTS = ("google-analytics.com", "googletagmanager.com", "doubleclick.net", "facebook.net")
+
+
+class BrowserPageError(Exception):
+    """A page could not be loaded in the async browser"""
+
+
+class AsyncBrowser:
+    """
+    One headless Chromium shared by many concurrent pages, driven from its own asyncio loop
+
+    Each page gets its own lightweight browser context (separate cookies and
+    storage, same browser process), so concurrency costs a renderer per page
+    instead of a whole browser per worker. An asyncio semaphore caps the pages
+    open at once. Scraper threads call fetch_html, which schedules the load
+    on the loop thread and blocks until it finishes.
+    """
+
+    def __init__(self, max_pages: int = 8, lean: bool = True, user_agent: Optional[str] = None):
+        """
+        Initialize the browser (Chromium starts on first use)
+
+        Args:
+            max_pages: Pages open at once across every caller
+            lean: Abort image, media, font, stylesheet and analytics requests for pages that do not choose
+            user_agent: User agent for every context
+        """
+        self.max_pages = max_pages
+        self.lean = lean
+        self.user_agent = user_agent
+        self._loop = None
+        self._thread = None
+        self._playwright = None
+        self._browser = None
+        self._semaphore = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {"pages": 0, "open_pages": 0, "peak_open_pages": 0, "peak_rss_mb": 0.0}
+
+    def start(self) -> "AsyncBrowser":
+        """Start the event loop thread and launch Chromium, if not already running"""
+        if async_playwright is None:
+            raise RuntimeError("The async engine needs Playwright: pip install playwright")
+
+        with self._start_lock:
+            if self._browser is not None:
+                return self
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever, name="async-browser", daemon=True)
+            self._thread.start()
+            try:
+                asyncio.run_coroutine_threadsafe(self._launch(), self._loop).result()
+            except Exception:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop = None
+                raise
+        return self
+
+    def run(self, coroutine, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the browser's loop from any other thread and return its result"""
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result(timeout)
+
+    def fetch_html(self, url: str, wait_for_class: Optional[str] = None, timeout: float = 30,
+                   lean: Optional[bool] = None) -> Tuple[str, Optional[int]]:
+        """
+        Load a page in a fresh context and return its rendered HTML (blocking)
+
+        Args:
+            url: Page to load
+            wait_for_class: Wait until an element with this class exists; the page is
+                returned as-is if none appears within the timeout (e.g. an empty listing)
+            timeout: Seconds allowed for navigation and for the wait
+            lean: Block unneeded resources on this page (None uses the browser's default);
+                blocking is set per context, so callers with different profiles can share the browser
+
+        Returns:
+            Tuple of (HTML, HTTP status or None)
+        """
+        # Start first so a missing Playwright fails before the coroutine is created
+        self.start()
+        return self.run(self.fetch_html_async(url, wait_for_class, timeout, lean))
+
+    async def fetch_html_async(self, url: str, wait_for_class: Optional[str] = None,
+                               timeout: float = 30, lean: Optional[bool] = None) -> Tuple[str, Optional[int]]:
+        """Coroutine behind fetch_html; must run on the browser's loop"""
+        async with self._semaphore:
+            self._count_open(1)
+            context = await self._browser.new_context(user_agent=self.user_agent)
+            try:
+                if self.lean if lean is None else lean:
+                    await context.route("**/*", self._route_lean)
+                page = await context.new_page()
+                try:
+                    response = await page.goto(url, wait_until="domcontentloaded", timeout=timeout * 1000)
+                except PlaywrightError as e:
+                    raise BrowserPageError(f"Could not load {url}: {e}") from e
+                if wait_for_class:
+                    try:
+                        await page.wait_for_selector(f".{wait_for_class}", timeout=timeout * 1000)
+                    except PlaywrightError:
+                        logger.warning(f"No .{wait_for_class} element appeared at {url}")
+                self.record_memory()
+                return await page.content(), response.status if response else None
+            finally:
+                await context.close()
+                self._count_open(-1)
+
+    def rss_mb(self) -> Optional[float]:
+        """
+        Resident memory of the browser: every process this Python process started
+
+        Playwright does not expose the browser's pid, so this counts all child
+        processes; other browsers started by the process are included too.
+        """
+        total = process_tree_rss_mb(os.getpid())
+        own = process_tree_rss_mb(os.getpid(), include_children=False)
+        if total is None or own is None:
+            return None
+        return total - own
+
+    def record_memory(self) -> Optional[float]:
+        """Sample the browser's memory and keep the peak"""
+        rss = self.rss_mb()
+        if rss is not None:
+            with self._stats_lock:
+                self._stats["peak_rss_mb"] = max(self._stats["peak_rss_mb"], rss)
+        return rss
+
+    def reset_stats(self):
+        """Zero the counters for a new scrape run"""
+        with self._stats_lock:
+            self._stats.update(pages=0, peak_open_pages=self._stats["open_pages"], peak_rss_mb=0.0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pages loaded, most pages open at once and peak browser memory since the last reset"""
+        with self._stats_lock:
+            return {
+                "pages": self._stats["pages"],
+                "peak_open_pages": self._stats["peak_open_pages"],
+                "peak_rss_mb": round(self._stats["peak_rss_mb"], 1) or None
+            }
+
+    def shutdown(self):
+        """Close Chromium and stop the loop thread"""
+        with self._start_lock:
+            if self._loop is None:
+                return
+            try:
+                asyncio.run_coroutine_threadsafe(self._close(), self._loop).result(30)
+            except Exception as e:
+                logger.warning(f"Error closing async browser: {e}")
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(5)
+            self._loop = None
+            self._thread = None
+            logger.info("Async browser shut down")
+
+    async def _launch(self):
+        """Start Playwright and Chromium (runs on the loop thread)"""
+        # Prefer the system Chromium installed from packages.txt over Playwright's own download
+        executable = shutil.which("chromium") or shutil.which("chromium-browser") or shutil.which("google-chrome")
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(
+            headless=True,
+            executable_path=executable,
+            args=["--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu"]
+        )
+        self._semaphore = asyncio.Semaphore(max(1, self.max_pages))
+        logger.info(f"Launched async browser ({executable or 'bundled Chromium'}, up to {self.max_pages} pages)")
+
+    async def _close(self):
+        """Close Chromium and Playwright (runs on the loop thread)"""
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def _route_lean(self, route):
+        """Abort requests the lean profile does not need"""
+        request = route.request
+        if request.resource_type in LEAN_BLOCKED_RESOURCES or any(host in request.url for host in LEAN_BLOCKED_HOSTS):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _count_open(self, delta: int):
+        """Track open pages; opening one also counts a page load"""
+        with self._stats_lock:
+            self._stats["open_pages"] += delta
+            if delta > 0:
+                self._stats["pages"] += 1
+                self._stats["peak_open_pages"] = max(self._stats["peak_open_pages"], self._stats["open_pages"])
+
+
+# Process-wide browser: one Chromium for every scrape in the process
+_shared_browser: Optional[AsyncBrowser] = None
+_shared_browser_lock = threading.Lock()
+
+def get_async_browser(max_pages: int = 8, lean: bool = True, user_agent: Optional[str] = None) -> AsyncBrowser:
+    """
+    Get the process-wide async browser, creating it on first use
+
+    Args:
+        max_pages: Pages open at once (only applied on creation)
+        lean: Default resource blocking for pages that do not choose (only applied on creation)
+        user_agent: User agent for every context (only applied on creation)
+
+    Returns:
+        The shared AsyncBrowser (Chromium starts on its first page)
+    """
+    global _shared_browser
+    with _shared_browser_lock:
+        if _shared_browser is None:
+            _shared_browser = AsyncBrowser(max_pages, lean, user_agent)
+            atexit.register(_shared_browser.shutdown)
+            logger.info(f"Created shared async browser (up to {max_pages} pages)")
+        return _shared_browser
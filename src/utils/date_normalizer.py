@@ -0,0 +1,163 @@
+# app/utils/date_normalizer.py
+import re
+import datetime
+import logging
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger("tamu_newsletter")
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "sept": 9, "oct": 10, "nov": 11, "dec": 12
+}
+
+# "Monday, June 9, 2025", "June 9, 2025", "Jun 9 2025"
+MONTH_DAY_YEAR = re.compile(
+    r'^(?:[A-Za-z]+,?\s+)?([A-Za-z]{3,9})\.?\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})\b'
+)
+ISO_DATE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})\b')
+US_DATE = re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{4})\b')
+# "11:30am", "2 pm", "11:30" (meridiem inherited from the end time)
+CLOCK_TIME = re.compile(r'(\d{1,2})(?::(\d{2}))?\s*([ap])\.?m?\.?', re.IGNORECASE)
+# "Noon" and "midnight" are rewritten as clock times before matching
+NAMED_TIMES = re.compile(r'\b(noon|midnight)\b', re.IGNORECASE)
+TIME_RANGE = re.compile(
+    r'(\d{1,2}(?::\d{2})?)\s*([ap]\.?m\.?)?\s*[-–]\s*(\d{1,2}(?::\d{2})?)\s*([ap]\.?m\.?)',
+    re.IGNORECASE
+)
+
+class DateNormalizer:
+    """
+    Fast, memoized parsing of the display date/time strings on event records
+
+    Scraped events keep their display strings for rendering; the ISO "start"
+    and "end" fields added here are what later stages compare and format.
+    """
+
+    timezone = ZoneInfo("America/Chicago")
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def parse_date(text: str) -> Optional[datetime.date]:
+        """
+        Parse a display date such as "Monday, June 9, 2025"
+
+        Compiled fast paths cover the formats the calendars produce; anything
+        else falls back to dateutil's fuzzy parser. Results are memoized.
+
+        Returns:
+            The date, or None if it cannot be parsed
+        """
+        if not text:
+            return None
+        text = text.strip()
+
+        try:
+            match = MONTH_DAY_YEAR.match(text)
+            if match:
+                month = MONTHS.get(match.group(1)[:4].lower()) or MONTHS.get(match.group(1)[:3].lower())
+                if month:
+                    return datetime.date(int(match.group(3)), month, int(match.group(2)))
+
+            match = ISO_DATE.match(text)
+            if match:
+                return datetime.date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+
+            match = US_DATE.match(text)
+            if match:
+                return datetime.date(int(match.group(3)), int(match.group(1)), int(match.group(2)))
+        except ValueError:
+            pass
+
+        try:
+            from dateutil.parser import parse
+            return parse(text, fuzzy=True).date()
+        except Exception as e:
+            logger.warning(f"Could not parse date '{text}': {e}")
+            return None
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def parse_time_range(text: str) -> Tuple[Optional[datetime.time], Optional[datetime.time]]:
+        """
+        Parse a display time such as "11:30am - 1:00pm CDT"
+
+        Returns:
+            Tuple of (start_time, end_time); either may be None
+        """
+        if not text:
+            return None, None
+
+        text = NAMED_TIMES.sub(lambda named: "12:00pm" if named.group(1).lower() == "noon" else "12:00am", text)
+
+        match = TIME_RANGE.search(text)
+        if match:
+            end_time = DateNormalizer._to_time(match.group(3), match.group(4))
+            start_time = DateNormalizer._to_time(match.group(1), match.group(2) or match.group(4))
+            # "11:30 - 1:00pm": an inherited meridiem cannot put the start after the end
+            # ("10:00 - 1:00am" runs overnight and keeps its morning start)
+            if not match.group(2) and start_time and end_time and start_time > end_time and start_time.hour >= 12:
+                start_time = start_time.replace(hour=start_time.hour - 12)
+            return start_time, end_time
+
+        match = CLOCK_TIME.search(text)
+        if match:
+            return DateNormalizer._to_time(f"{match.group(1)}:{match.group(2) or '00'}", match.group(3)), None
+
+        return None, None
+
+    @staticmethod
+    def normalize_event(event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add ISO "start" and "end" fields to an event record in place
+
+        "start" is a date ("2025-06-09") when no time is known, otherwise a
+        timezone-aware datetime ("2025-06-09T11:30:00-05:00"). An end time
+        before the start time falls on the next day.
+        """
+        event_day = DateNormalizer.parse_date(event.get("event_date", ""))
+        if event_day is None:
+            event.pop("start", None)
+            event.pop("end", None)
+            return event
+
+        start_time, end_time = DateNormalizer.parse_time_range(event.get("event_time", ""))
+        if start_time is None:
+            event["start"] = event_day.isoformat()
+            event.pop("end", None)
+            return event
+
+        event["start"] = datetime.datetime.combine(event_day, start_time, DateNormalizer.timezone).isoformat()
+        if end_time is not None:
+            end_day = event_day + datetime.timedelta(days=1) if end_time < start_time else event_day
+            event["end"] = datetime.datetime.combine(end_day, end_time, DateNormalizer.timezone).isoformat()
+        else:
+            event.pop("end", None)
+        return event
+
+    @staticmethod
+    def event_day(event: Dict[str, Any]) -> Optional[datetime.date]:
+        """Get an event's calendar day, preferring the normalized "start" field"""
+        start = event.get("start")
+        if start:
+            try:
+                return datetime.date.fromisoformat(start[:10])
+            except ValueError:
+                pass
+        return DateNormalizer.parse_date(event.get("event_date", ""))
+
+    @staticmethod
+    def _to_time(clock: str, meridiem: Optional[str]) -> Optional[datetime.time]:
+        """Convert "11:30" plus "pm" to a time"""
+        try:
+            hour, _, minute = clock.partition(":")
+            hour = int(hour)
+            minute = int(minute or 0)
+            if meridiem:
+                is_pm = meridiem[0].lower() == "p"
+                hour = hour % 12 + (12 if is_pm else 0)
+            return datetime.time(hour, minute)
+        except ValueError:
+            return None
@@ -0,0 +1,183 @@
+# app/utils/day_cache.py
+import os
+import json
+import time
+import datetime
+import threading
+import logging
+from datetime import date, timedelta
+from typing import Dict, List, Any, Optional, Tuple
+from pathlib import Path
+
+from utils.date_normalizer import DateNormalizer
+
+logger = logging.getLogger("tamu_newsletter")
+
+class DayCache:
+    """
+    On-disk cache of scraped events per calendar source and day
+
+    Each file holds one source's events for one day (possibly none), the
+    engine that scraped them and when. Overlapping date-range scrapes are
+    served from fresh days and only fetch the missing or stale ones. Undated
+    events are kept with the first day of the range they were scraped for.
+    A day with an event whose detail fetch failed is never served.
+    """
+
+    def __init__(self, cache_dir: str = "day_cache", ttl_seconds: int = 6 * 3600):
+        """
+        Initialize the day cache
+
+        Args:
+            cache_dir: Directory holding one subdirectory of day files per source
+            ttl_seconds: How long a scraped day is served before it is fetched again
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def lookup(self, source: str, start_date: date, end_date: date, engine: str,
+               lazy_details: bool = False) -> Tuple[Dict[date, List[Dict[str, Any]]], List[date]]:
+        """
+        Split a date range into days served from the cache and days that need scraping
+
+        Args:
+            source: Calendar source name
+            start_date: First day of the range
+            end_date: Last day of the range
+            engine: Engine of the run; feed entries lack detail fields and only serve feed runs
+            lazy_details: Whether the run accepts events whose details are still pending
+
+        Returns:
+            Tuple of (events by cached day, missing or stale days in order)
+        """
+        cached, missing = {}, []
+        for day in self.days(start_date, end_date):
+            entry = self._read(source, day)
+            if entry is not None and self._usable(entry, engine, lazy_details):
+                cached[day] = entry["events"]
+            else:
+                missing.append(day)
+        return cached, missing
+
+    def coverage(self, source: str, start_date: date, end_date: date, engine: str,
+                 lazy_details: bool = False) -> Dict[str, Any]:
+        """
+        Describe how much of a date range a scrape would serve from the cache
+
+        Returns:
+            Dict with cached_days, total_days, missing (ISO dates) and oldest (ISO time of the oldest cached day, or None)
+        """
+        cached_at = []
+        missing = []
+        for day in self.days(start_date, end_date):
+            entry = self._read(source, day)
+            if entry is not None and self._usable(entry, engine, lazy_details):
+                cached_at.append(entry["fetched_at"])
+            else:
+                missing.append(day.isoformat())
+        oldest = datetime.datetime.fromtimestamp(min(cached_at)).isoformat(timespec="minutes") if cached_at else None
+        return {
+            "cached_days": len(cached_at),
+            "total_days": len(cached_at) + len(missing),
+            "missing": missing,
+            "oldest": oldest
+        }
+
+    def put_range(self, source: str, start_date: date, end_date: date, events: List[Dict[str, Any]], engine: str):
+        """
+        Store the events scraped for a date range, one file per day
+
+        Days without events are stored too, so they are not fetched again
+        within the TTL.
+        """
+        by_day = DayCache.split_by_day(events, start_date, end_date)
+        fetched_at = time.time()
+        for day in self.days(start_date, end_date):
+            self._write(source, day, {"fetched_at": fetched_at, "engine": engine, "events": by_day.get(day, [])})
+
+    @staticmethod
+    def split_by_day(events: List[Dict[str, Any]], start_date: date, end_date: date) -> Dict[date, List[Dict[str, Any]]]:
+        """Group events by calendar day; undated events and days outside the range go to start_date"""
+        by_day: Dict[date, List[Dict[str, Any]]] = {}
+        for event in events:
+            day = DateNormalizer.event_day(event)
+            if day is None or not start_date <= day <= end_date:
+                day = start_date
+            by_day.setdefault(day, []).append(event)
+        return by_day
+
+    @staticmethod
+    def days(start_date: date, end_date: date) -> List[date]:
+        """Every day from start_date to end_date inclusive"""
+        return [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+
+    @staticmethod
+    def missing_ranges(missing: List[date]) -> List[Tuple[date, date]]:
+        """Group missing days into contiguous (start, end) ranges, each scraped with one listing crawl"""
+        ranges: List[Tuple[date, date]] = []
+        for day in missing:
+            if ranges and day == ranges[-1][1] + timedelta(days=1):
+                ranges[-1] = (ranges[-1][0], day)
+            else:
+                ranges.append((day, day))
+        return ranges
+
+    def record(self, source: str, cached_days: int, fetched_days: int, cached_events: int):
+        """Count a source's cached and fetched days for the run's statistics"""
+        with self._lock:
+            self.stats[source] = {"cached_days": cached_days, "fetched_days": fetched_days, "cached_events": cached_events}
+
+    def reset_stats(self):
+        """Zero the per-source counters for a new scrape run"""
+        with self._lock:
+            self.stats: Dict[str, Dict[str, int]] = {}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cached and fetched days per source plus run totals"""
+        with self._lock:
+            sources = {name: dict(counts) for name, counts in self.stats.items()}
+        return {
+            "cached_days": sum(counts["cached_days"] for counts in sources.values()),
+            "fetched_days": sum(counts["fetched_days"] for counts in sources.values()),
+            "sources": sources
+        }
+
+    def _usable(self, entry: Dict[str, Any], engine: str, lazy_details: bool) -> bool:
+        """Whether a cached day is fresh, complete and was scraped with the detail level this run needs"""
+        if time.time() - entry.get("fetched_at", 0) >= self.ttl_seconds:
+            return False
+        if (entry.get("engine") == "feed") != (engine == "feed"):
+            return False
+        if any(event.get("details_failed") for event in entry["events"]):
+            return False
+        return lazy_details or not any(event.get("details_pending") for event in entry["events"])
+
+    def _path(self, source: str, day: date) -> Path:
+        """File holding one source's events for one day"""
+        return self.cache_dir / source / f"{day.isoformat()}.json"
+
+    def _read(self, source: str, day: date) -> Optional[Dict[str, Any]]:
+        """Load a day's entry, or None if it is missing or unreadable"""
+        try:
+            with open(self._path(source, day), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable day cache entry for {source} {day}: {e}")
+            return None
+        return entry if isinstance(entry.get("events"), list) else None
+
+    def _write(self, source: str, day: date, entry: Dict[str, Any]):
+        """Write a day's entry atomically so a concurrent reader never sees half a file"""
+        path = self._path(source, day)
+        temp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write day cache entry for {source} {day}: {e}")
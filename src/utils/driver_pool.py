@@ -0,0 +1,365 @@
+# app/utils/driver_pool.py
+import os
+import atexit
+import threading
+import logging
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger("tamu_newsletter")
+
+
+def browser_rss_mb(driver) -> Optional[float]:
+    """
+    Resident memory of a local driver's browser: chromedriver plus every process it started
+
+    Uses psutil when installed and /proc otherwise. Returns None when the
+    memory cannot be read (remote drivers, or no psutil outside Linux).
+    """
+    process = getattr(getattr(driver, "service", None), "process", None)
+    pid = getattr(process, "pid", None)
+    if pid is None:
+        return None
+    return process_tree_rss_mb(pid)
+
+
+def process_tree_rss_mb(pid: int, include_children: bool = True) -> Optional[float]:
+    """Resident memory in MB of a process and (optionally) all its descendants, or None if unreadable"""
+    try:
+        if psutil is not None:
+            root = psutil.Process(pid)
+            processes = [root] + (root.children(recursive=True) if include_children else [])
+            return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+        if os.path.isdir("/proc"):
+            return _proc_tree_rss(pid, include_children) / (1024 * 1024)
+    except Exception as e:
+        logger.warning(f"Could not read browser memory: {e}")
+    return None
+
+
+def _proc_tree_rss(root_pid: int, include_children: bool = True) -> int:
+    """Sum the RSS in bytes of a process and its descendants from /proc"""
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir("/proc") if include_children else ():
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                # The command name may contain spaces, so split after its closing parenthesis
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    pending = [root_pid]
+    while pending:
+        pid = pending.pop()
+        try:
+            with open(f"/proc/{pid}/statm", "r") as f:
+                total += int(f.read().split()[1]) * page_size
+        except (OSError, IndexError, ValueError):
+            continue
+        pending.extend(children.get(pid, []))
+    return total
+
+class DriverPool:
+    """
+    Keeps a bounded set of warm WebDriver instances that scrapes lease and return
+
+    Browsers survive between scrape runs, so only the first scrape in a
+    process pays the Chrome startup cost. Drivers that have served
+    max_pages pages or grown past max_rss_mb are replaced with fresh ones.
+    """
+
+    def __init__(self, create_driver: Callable[[], Any], size: int = 2,
+                 max_pages: Optional[int] = 150, max_rss_mb: Optional[float] = 1024,
+                 on_quit: Optional[Callable[[Any], None]] = None):
+        """
+        Initialize the driver pool
+
+        Args:
+            create_driver: Factory that starts a new driver
+            size: Maximum number of browsers alive at once
+            max_pages: Pages a driver serves before it is recycled (None disables)
+            max_rss_mb: Browser memory that triggers recycling (None disables)
+            on_quit: Called with every driver the pool quits, before it is quit
+        """
+        self.create_driver = create_driver
+        self.on_quit = on_quit
+        self.size = size
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self._idle: List[Any] = []
+        self._total = 0
+        self._condition = threading.Condition()
+        self._closed = False
+        # Per-driver usage keyed by id(driver): pages served and last measured RSS
+        self._usage: Dict[int, Dict[str, Any]] = {}
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+    def acquire(self, timeout: Optional[float] = None):
+        """
+        Lease a healthy driver, waiting for one to be released if the pool is full
+
+        Args:
+            timeout: Seconds to wait for a free driver (None waits forever)
+
+        Returns:
+            A WebDriver instance
+        """
+        driver = self._acquire(block=True, timeout=timeout)
+        if driver is None:
+            raise TimeoutError("Timed out waiting for a free browser")
+        return driver
+
+    def try_acquire(self):
+        """Lease a driver only if one is idle or the pool has room, otherwise return None"""
+        return self._acquire(block=False)
+
+    def release(self, driver):
+        """
+        Return a driver to the pool after resetting it
+
+        Drivers that fail the reset or are due for recycling are quit and their slot is freed.
+        """
+        reason = self.needs_recycle(driver)
+        if reason:
+            logger.info(f"Retiring Chrome driver on release ({reason})")
+            with self._stats_lock:
+                self._stats["recycled"] += 1
+        healthy = not self._closed and not reason and self._reset(driver)
+        with self._condition:
+            if healthy:
+                self._idle.append(driver)
+            else:
+                self._total -= 1
+            self._condition.notify()
+
+        if not healthy:
+            self._quit(driver)
+
+    def record_page(self, driver, seconds: Optional[float] = None) -> Optional[float]:
+        """
+        Count a page load on a driver and sample its browser memory
+
+        Args:
+            driver: Driver that loaded the page
+            seconds: How long the load took, folded into the pool's average load time
+
+        Returns:
+            Current browser RSS in MB, or None if it cannot be measured
+        """
+        rss_mb = browser_rss_mb(driver)
+        with self._stats_lock:
+            usage = self._usage.setdefault(id(driver), {"pages": 0, "rss_mb": None})
+            usage["pages"] += 1
+            usage["rss_mb"] = rss_mb
+            if rss_mb is not None and rss_mb > self._stats["peak_rss_mb"]:
+                self._stats["peak_rss_mb"] = rss_mb
+            self._stats["pages"] += 1
+            if seconds is not None:
+                # Exponential moving average, so a browser that slows down shows up within a few pages
+                average = self._stats["avg_load_seconds"]
+                self._stats["avg_load_seconds"] = seconds if average is None else 0.7 * average + 0.3 * seconds
+        return rss_mb
+
+    def needs_recycle(self, driver) -> Optional[str]:
+        """Return why a driver should be replaced, or None if it is within its limits"""
+        with self._stats_lock:
+            usage = self._usage.get(id(driver))
+        if not usage:
+            return None
+        if self.max_pages and usage["pages"] >= self.max_pages:
+            return f"{usage['pages']} pages served"
+        if self.max_rss_mb and usage["rss_mb"] is not None and usage["rss_mb"] >= self.max_rss_mb:
+            return f"{usage['rss_mb']:.0f}MB resident"
+        return None
+
+    def recycle(self, driver):
+        """
+        Replace a leased driver with a fresh browser, keeping its pool slot
+
+        The new driver is started before the old one is quit, so a failed
+        start leaves the caller with the old, still working driver.
+
+        Returns:
+            The driver to keep using
+        """
+        reason = self.needs_recycle(driver) or "requested"
+        try:
+            new_driver = self.create_driver()
+        except Exception as e:
+            logger.warning(f"Could not start a replacement Chrome driver: {e}")
+            return driver
+
+        self._quit(driver)
+        with self._stats_lock:
+            self._stats["recycled"] += 1
+        logger.info(f"Recycled Chrome driver ({reason})")
+        return new_driver
+
+    def capacity(self) -> int:
+        """Drivers that could be leased right now without waiting: idle ones plus free slots"""
+        with self._condition:
+            return 0 if self._closed else len(self._idle) + self.size - self._total
+
+    def reset_stats(self):
+        """Start counting recycles, pages, load time and peak memory for a new scrape run"""
+        with self._stats_lock:
+            self._stats = {"recycled": 0, "peak_rss_mb": 0.0, "pages": 0, "avg_load_seconds": None}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get recycle count, pages loaded, average load time and peak browser memory since the last reset"""
+        with self._stats_lock:
+            average = self._stats["avg_load_seconds"]
+            return {
+                "recycled": self._stats["recycled"],
+                "peak_rss_mb": round(self._stats["peak_rss_mb"], 1),
+                "pages": self._stats["pages"],
+                "avg_load_ms": round(average * 1000) if average is not None else None
+            }
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None):
+        """Context manager that acquires a driver and always releases it"""
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def warm(self, count: Optional[int] = None):
+        """Start browsers ahead of time so the next scrape skips startup"""
+        count = min(count or self.size, self.size)
+        drivers = []
+        for _ in range(count):
+            driver = self.try_acquire()
+            if driver is None:
+                break
+            drivers.append(driver)
+        for driver in drivers:
+            self.release(driver)
+        logger.info(f"Driver pool warmed with {len(drivers)} browser(s)")
+
+    def shutdown(self):
+        """Quit every idle browser and refuse further leases"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._total -= len(idle)
+            self._condition.notify_all()
+
+        for driver in idle:
+            self._quit(driver)
+        if idle:
+            logger.info(f"Driver pool shut down ({len(idle)} browser(s) closed)")
+
+    def _acquire(self, block: bool, timeout: Optional[float] = None):
+        """Shared acquire logic: reuse an idle driver, start a new one, or wait"""
+        while True:
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError("Driver pool is shut down")
+
+                driver = self._idle.pop() if self._idle else None
+                start_new = driver is None and self._total < self.size
+                if start_new:
+                    # Reserve the slot before starting Chrome outside the lock
+                    self._total += 1
+
+                if driver is None and not start_new:
+                    if not block:
+                        return None
+                    if not self._condition.wait(timeout):
+                        return None
+                    continue
+
+            if driver is not None:
+                if self._is_healthy(driver):
+                    logger.info("Reusing warm Chrome driver from pool")
+                    return driver
+                logger.warning("Discarding unhealthy Chrome driver from pool")
+                self._quit(driver)
+                with self._condition:
+                    self._total -= 1
+                continue
+
+            try:
+                logger.info(f"Starting new Chrome driver for pool ({self._total}/{self.size})")
+                return self.create_driver()
+            except Exception:
+                with self._condition:
+                    self._total -= 1
+                    self._condition.notify()
+                raise
+
+    def _is_healthy(self, driver) -> bool:
+        """Check that the browser still answers WebDriver commands"""
+        try:
+            driver.window_handles
+            return True
+        except Exception as e:
+            logger.warning(f"Driver health check failed: {e}")
+            return False
+
+    def _reset(self, driver) -> bool:
+        """Close extra tabs, clear cookies and park the driver on a blank page"""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            logger.warning(f"Error resetting driver: {e}")
+            return False
+
+    def _quit(self, driver):
+        """Quit a driver, ignoring errors from browsers that already died"""
+        with self._stats_lock:
+            self._usage.pop(id(driver), None)
+        if self.on_quit is not None:
+            self.on_quit(driver)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error closing driver: {e}")
+
+
+# Process-wide pools: Streamlit re-creates EventScraper on every rerun,
+# so the browsers have to live outside the scraper instance. Browsers are
+# launched with their profile's settings, so each profile gets its own pool.
+_shared_pools: Dict[str, DriverPool] = {}
+_shared_pool_lock = threading.Lock()
+
+def get_driver_pool(create_driver: Callable[[], Any], size: int = 2, profile: str = "default") -> DriverPool:
+    """
+    Get the process-wide driver pool for a browser profile, creating it on first use
+
+    Args:
+        create_driver: Factory that starts new drivers with this profile
+        size: Maximum number of browsers (only applied when the pool is created)
+        profile: Browser profile the factory launches
+
+    Returns:
+        The shared DriverPool
+    """
+    with _shared_pool_lock:
+        pool = _shared_pools.get(profile)
+        if pool is None:
+            pool = DriverPool(create_driver, size)
+            _shared_pools[profile] = pool
+            atexit.register(pool.shutdown)
+            logger.info(f"Created shared driver pool for the {profile} profile (size {size})")
+        return pool
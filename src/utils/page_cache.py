@@ -0,0 +1,177 @@
+# app/utils/page_cache.py
+import json
+import time
+import hashlib
+import threading
+import logging
+from typing import Dict, List, Any, Optional
+from pathlib import Path
+
+logger = logging.getLogger("tamu_newsletter")
+
+class PageCache:
+    """
+    Size-bounded on-disk cache of fetched pages keyed by URL
+
+    Each entry keeps the body, ETag/Last-Modified validators and the fetch
+    time. HTTP fetches revalidate entries with conditional GETs; browser
+    fetches, which cannot send validators, use the TTL instead.
+    """
+
+    def __init__(self, cache_dir: str = "page_cache", max_bytes: int = 50 * 1024 * 1024, ttl_seconds: int = 6 * 3600):
+        """
+        Initialize the page cache
+
+        Args:
+            cache_dir: Directory holding cached bodies and the index
+            max_bytes: Total body size kept before least recently used entries are evicted
+            ttl_seconds: How long an entry is served without revalidation (browser fetches)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(exist_ok=True)
+        self.index_path = self.cache_dir / "index.json"
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+        self.reset_stats()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached page
+
+        Returns:
+            Entry dict with body, etag, last_modified and fetched_at, or None
+        """
+        with self._lock:
+            meta = self._index.get(self._key(url))
+            if not meta:
+                return None
+            meta["last_access"] = time.time()
+
+        try:
+            body = (self.cache_dir / meta["file"]).read_text(encoding="utf-8")
+        except OSError:
+            # Body file vanished; forget the entry
+            with self._lock:
+                self._index.pop(self._key(url), None)
+            return None
+
+        return dict(meta, body=body)
+
+    def urls(self) -> List[str]:
+        """Get the URL of every cached page"""
+        with self._lock:
+            return [meta["url"] for meta in self._index.values()]
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Return True if an entry is younger than the TTL"""
+        return time.time() - entry.get("fetched_at", 0) < self.ttl_seconds
+
+    def put(self, url: str, body: str, etag: Optional[str] = None, last_modified: Optional[str] = None, fetch_seconds: float = 0.0):
+        """Store a freshly fetched page and evict old entries if over the size limit"""
+        key = self._key(url)
+        file_name = f"{key}.html"
+        data = body.encode("utf-8")
+
+        try:
+            (self.cache_dir / file_name).write_bytes(data)
+        except OSError as e:
+            logger.warning(f"Could not write page cache entry for {url}: {e}")
+            return
+
+        now = time.time()
+        with self._lock:
+            self._index[key] = {
+                "url": url,
+                "file": file_name,
+                "size": len(data),
+                "etag": etag,
+                "last_modified": last_modified,
+                "fetched_at": now,
+                "last_access": now,
+                "fetch_seconds": round(fetch_seconds, 3)
+            }
+            self._evict()
+            self._save_index()
+
+    def touch(self, url: str):
+        """Mark an entry as just revalidated (e.g. after a 304 response)"""
+        with self._lock:
+            meta = self._index.get(self._key(url))
+            if meta:
+                meta["fetched_at"] = meta["last_access"] = time.time()
+
+    def record_hit(self, entry: Dict[str, Any], revalidated: bool = False):
+        """Count a request served from the cache"""
+        with self._lock:
+            self._stats["hits"] += 1
+            self._stats["bytes_saved"] += entry.get("size", 0)
+            if revalidated:
+                self._stats["revalidated"] += 1
+            else:
+                # No request was made at all, so the whole fetch time was saved
+                self._stats["seconds_saved"] += entry.get("fetch_seconds", 0.0)
+
+    def record_miss(self):
+        """Count a request that had to be fetched in full"""
+        with self._lock:
+            self._stats["misses"] += 1
+
+    def reset_stats(self):
+        """Start counting for a new scrape run"""
+        with self._lock:
+            self._stats = {"hits": 0, "misses": 0, "revalidated": 0, "bytes_saved": 0, "seconds_saved": 0.0}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counts for the current run"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["seconds_saved"] = round(stats["seconds_saved"], 2)
+        return stats
+
+    def flush(self):
+        """Persist the index (access times change on every lookup)"""
+        with self._lock:
+            self._save_index()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        total = sum(meta["size"] for meta in self._index.values())
+        if total <= self.max_bytes:
+            return
+
+        for key, meta in sorted(self._index.items(), key=lambda item: item[1]["last_access"]):
+            if total <= self.max_bytes:
+                break
+            try:
+                (self.cache_dir / meta["file"]).unlink()
+            except OSError:
+                pass
+            total -= meta["size"]
+            del self._index[key]
+            logger.info(f"Evicted cached page: {meta['url']}")
+
+    def _key(self, url: str) -> str:
+        """Cache key for a URL"""
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the index file, starting empty if it is missing or corrupt"""
+        try:
+            if self.index_path.exists():
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load page cache index: {e}")
+        return {}
+
+    def _save_index(self):
+        """Write the index atomically"""
+        try:
+            tmp_path = self.index_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._index, f)
+            tmp_path.replace(self.index_path)
+        except Exception as e:
+            logger.warning(f"Could not save page cache index: {e}")
@@ -0,0 +1,176 @@
+# app/utils/rate_limiter.py
+import time
+import threading
+import logging
+from typing import Dict, Any, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger("tamu_newsletter")
+
+class HostRateLimiter:
+    """
+    Adaptive token-bucket rate limiter with one bucket per host
+
+    Every worker takes a token before loading a page. Each host's rate is
+    halved on a 429/503 (the server's Retry-After is honored) and cut by a
+    quarter on a slow response, then creeps back up by a fixed step on every
+    healthy response, up to max_rate.
+    """
+
+    def __init__(self, rate: float = 4.0, burst: int = 4, min_rate: float = 0.25, max_rate: float = 16.0,
+                 slow_seconds: float = 8.0, recovery_step: float = 0.1):
+        """
+        Initialize the rate limiter
+
+        Args:
+            rate: Starting requests per second for each host
+            burst: Tokens a host can bank while idle
+            min_rate: Floor the rate never drops below
+            max_rate: Ceiling for recovery
+            slow_seconds: Responses slower than this count as a throttle signal
+            recovery_step: Requests per second added after each healthy response
+        """
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.slow_seconds = slow_seconds
+        self.recovery_step = recovery_step
+        self._hosts: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> float:
+        """
+        Wait for a token for the URL's host
+
+        Returns:
+            Seconds spent waiting
+        """
+        host = self._host(url)
+        waited = 0.0
+        while True:
+            with self._lock:
+                bucket = self._bucket(host)
+                now = time.monotonic()
+                bucket["tokens"] = min(self.burst, bucket["tokens"] + (now - bucket["updated"]) * bucket["rate"])
+                bucket["updated"] = now
+
+                if now >= bucket["paused_until"] and bucket["tokens"] >= 1:
+                    bucket["tokens"] -= 1
+                    bucket["requests"] += 1
+                    bucket["waited_seconds"] += waited
+                    return waited
+
+                delay = max(bucket["paused_until"] - now, (1 - bucket["tokens"]) / bucket["rate"])
+
+            time.sleep(delay)
+            waited += delay
+
+    def report(self, url: str, status: Optional[int], seconds: float, retry_after: Optional[str] = None):
+        """
+        Adapt the host's rate to a finished request
+
+        Args:
+            url: Requested URL
+            status: HTTP status, or None when unknown (browser loads, network errors)
+            seconds: Time the request took
+            retry_after: Retry-After header value, if the server sent one
+        """
+        host = self._host(url)
+        with self._lock:
+            bucket = self._bucket(host)
+            old_rate = bucket["rate"]
+
+            if status in (429, 503):
+                bucket["rate"] = max(self.min_rate, bucket["rate"] / 2)
+                bucket["throttled"] += 1
+                pause = self._parse_retry_after(retry_after)
+                if pause:
+                    bucket["paused_until"] = max(bucket["paused_until"], time.monotonic() + pause)
+                reason = f"HTTP {status}"
+            elif seconds > self.slow_seconds:
+                bucket["rate"] = max(self.min_rate, bucket["rate"] * 0.75)
+                bucket["slow"] += 1
+                reason = f"slow response ({seconds:.1f}s)"
+            else:
+                bucket["rate"] = min(self.max_rate, bucket["rate"] + self.recovery_step)
+                return
+            new_rate = bucket["rate"]
+
+        logger.warning(f"Throttling {host} after {reason}: {old_rate:.2f} -> {new_rate:.2f} req/s")
+
+    def get_rate(self, url: str) -> float:
+        """Current requests per second allowed for the URL's host"""
+        with self._lock:
+            return self._bucket(self._host(url))["rate"]
+
+    def reset_stats(self):
+        """Zero the counters for a new scrape run; learned rates are kept"""
+        with self._lock:
+            for bucket in self._hosts.values():
+                bucket.update(requests=0, throttled=0, slow=0, waited_seconds=0.0)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Current rate, request count, throttle events and time spent waiting, per host"""
+        with self._lock:
+            return {
+                host: {
+                    "rate": round(bucket["rate"], 2),
+                    "requests": bucket["requests"],
+                    "throttled": bucket["throttled"],
+                    "slow": bucket["slow"],
+                    "waited_seconds": round(bucket["waited_seconds"], 2)
+                }
+                for host, bucket in self._hosts.items()
+            }
+
+    def _bucket(self, host: str) -> Dict[str, Any]:
+        """Get a host's bucket, creating it full (caller holds the lock)"""
+        bucket = self._hosts.get(host)
+        if bucket is None:
+            bucket = {
+                "rate": self.rate,
+                "tokens": float(self.burst),
+                "updated": time.monotonic(),
+                "paused_until": 0.0,
+                "requests": 0,
+                "throttled": 0,
+                "slow": 0,
+                "waited_seconds": 0.0
+            }
+            self._hosts[host] = bucket
+        return bucket
+
+    def _host(self, url: str) -> str:
+        """Bucket key for a URL"""
+        return urlsplit(url).netloc or "local"
+
+    def _parse_retry_after(self, value: Optional[str]) -> float:
+        """Seconds to pause for a Retry-After header (HTTP dates are ignored)"""
+        try:
+            return min(float(value), 60.0) if value else 0.0
+        except ValueError:
+            return 0.0
+
+
+# Process-wide limiter: every scraper and worker must share one budget per host
+_shared_limiter: Optional[HostRateLimiter] = None
+_shared_limiter_lock = threading.Lock()
+
+def get_rate_limiter(rate: float = 4.0, burst: int = 4) -> HostRateLimiter:
+    """
+    Get the process-wide rate limiter, creating it on first use
+
+    Args:
+        rate: Starting requests per second per host (only applied on creation)
+        burst: Bucket size (only applied on creation)
+
+    Returns:
+        The shared HostRateLimiter
+    """
+    global _shared_limiter
+    with _shared_limiter_lock:
+        if _shared_limiter is None:
+            _shared_limiter = HostRateLimiter(rate, burst)
+            logger.info(f"Created shared rate limiter ({rate} req/s per host, burst {burst})")
+        return _shared_limiter
@@ -0,0 +1,118 @@
+# app/utils/scrape_journal.py
+import os
+import json
+import threading
+import logging
+from typing import Dict, Any, Optional, Set
+from pathlib import Path
+
+logger = logging.getLogger("tamu_newsletter")
+
+class ScrapeJournal:
+    """
+    Append-only JSON lines journal of hydrated events for one scrape run
+
+    Every fetched event is appended as soon as it is hydrated and the file is
+    fsync'd in batches, so a crash late in a run only loses the last batch.
+    A resumed run replays the journal and fetches only the remaining pages.
+    """
+
+    def __init__(self, path: str, batch_size: int = 10):
+        """
+        Initialize the journal
+
+        Args:
+            path: Journal file path
+            batch_size: Number of appended events between fsyncs
+        """
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._file = None
+        self._pending = 0
+        # Entries of the interrupted run, loaded on resume; only these are replayed
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        # Keys journaled by this run
+        self._written: Set[str] = set()
+        self.stats = {"replayed": 0, "journaled": 0}
+
+    def open(self, resume: bool = False) -> "ScrapeJournal":
+        """
+        Open the journal for writing
+
+        Args:
+            resume: Load the existing entries instead of starting a new journal
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if resume:
+            self._entries = self._load()
+            logger.info(f"Resuming scrape with {len(self._entries)} journaled events from {self.path}")
+        self._file = open(self.path, "a" if resume else "w", encoding="utf-8")
+        return self
+
+    def replay(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the event an interrupted run journaled for key, or None if it still needs fetching"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self.stats["replayed"] += 1
+        return dict(entry)
+
+    def append(self, key: str, event: Dict[str, Any]):
+        """Record a hydrated event; the file is fsync'd every batch_size events"""
+        line = json.dumps({"key": key, "event": event}, ensure_ascii=False)
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line + "\n")
+            self._written.add(key)
+            self.stats["journaled"] += 1
+            self._pending += 1
+            if self._pending >= self.batch_size:
+                self._sync()
+
+    def close(self, completed: bool = False):
+        """
+        Flush and close the journal
+
+        Args:
+            completed: The run finished, so the journal is deleted
+        """
+        with self._lock:
+            if self._file is not None:
+                self._sync()
+                self._file.close()
+                self._file = None
+
+        if completed:
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+        else:
+            logger.info(f"Scrape journal kept at {self.path} ({len(self._entries.keys() | self._written)} events)")
+
+    def _sync(self):
+        """Flush buffered lines to disk (caller holds the lock)"""
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except OSError as e:
+            logger.warning(f"Could not sync scrape journal: {e}")
+        self._pending = 0
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read journaled events, skipping a torn last line from a crash"""
+        entries = {}
+        if not self.path.exists():
+            return entries
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    entries[record["key"]] = record["event"]
+                except (ValueError, KeyError):
+                    logger.warning(f"Skipping unreadable line in {self.path}")
+        return entries
@@ -0,0 +1,336 @@
+# app/utils/webdriver_grid.py
+import time
+import atexit
+import threading
+import logging
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from utils.driver_pool import DriverPool
+
+logger = logging.getLogger("tamu_newsletter")
+
+
+class WebDriverGrid:
+    """
+    Shards browser work across remote WebDriver endpoints (Selenium Grid or standalone nodes)
+
+    Each node gets its own DriverPool, and the grid offers the same lease
+    interface, so the scraper uses it in place of the local pool. A lease goes
+    to the healthy node with the most free capacity, preferring fast nodes.
+    Nodes are health-checked through the WebDriver /status endpoint, and a
+    node that fails to start a session is skipped until its next check. A node
+    whose average page load is slow_factor times the fastest node's is
+    demoted, and drivers leased from it move to a faster node with room
+    between events.
+    """
+
+    def __init__(self, urls: List[str], create_driver: Callable[[str], Any], drivers_per_node: int = 2,
+                 health_interval: float = 30.0, slow_factor: float = 2.0,
+                 max_pages: Optional[int] = 150, max_rss_mb: Optional[float] = 1024):
+        """
+        Initialize the grid
+
+        Args:
+            urls: WebDriver endpoint URLs, e.g. http://grid-node:4444
+            create_driver: Factory taking an endpoint URL and starting a remote driver on it
+            drivers_per_node: Browsers each node runs at once
+            health_interval: Seconds between /status checks of a node
+            slow_factor: How many times slower than the fastest node a node may be before it is demoted
+            max_pages: Pages a driver serves before it is recycled (None disables)
+            max_rss_mb: Browser memory that triggers recycling (None disables; remote memory is rarely readable)
+        """
+        self.health_interval = health_interval
+        self.slow_factor = slow_factor
+        self.size = len(urls) * drivers_per_node
+        self._nodes = [
+            {
+                "url": url,
+                "pool": DriverPool(lambda url=url: create_driver(url), drivers_per_node, max_pages, max_rss_mb,
+                                   on_quit=self._forget),
+                "healthy": True,
+                "checked_at": 0.0,
+                "failures": 0
+            }
+            for url in urls
+        ]
+        # Leased and idle drivers keyed by id(driver), mapped to the node that started them;
+        # entries go when a node's pool quits the driver, before its id can be reused
+        self._owners: Dict[int, Dict[str, Any]] = {}
+        self._condition = threading.Condition()
+        self._stats_lock = threading.Lock()
+        self._rebalanced = 0
+
+    @property
+    def max_pages(self) -> Optional[int]:
+        return self._nodes[0]["pool"].max_pages if self._nodes else None
+
+    @max_pages.setter
+    def max_pages(self, value: Optional[int]):
+        for node in self._nodes:
+            node["pool"].max_pages = value
+
+    @property
+    def max_rss_mb(self) -> Optional[float]:
+        return self._nodes[0]["pool"].max_rss_mb if self._nodes else None
+
+    @max_rss_mb.setter
+    def max_rss_mb(self, value: Optional[float]):
+        for node in self._nodes:
+            node["pool"].max_rss_mb = value
+
+    def acquire(self, timeout: Optional[float] = None):
+        """
+        Lease a driver from the best available node, waiting for one to free up if all are busy
+
+        Args:
+            timeout: Seconds to wait for a free driver (None waits forever)
+
+        Returns:
+            A WebDriver instance
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            driver = self.try_acquire()
+            if driver is not None:
+                return driver
+            if not any(node["healthy"] for node in self._nodes) and not self._due_for_check():
+                raise RuntimeError("No healthy WebDriver nodes")
+
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise TimeoutError("Timed out waiting for a free browser on any WebDriver node")
+            with self._condition:
+                # Wake up periodically so nodes coming back online are noticed
+                self._condition.wait(min(remaining, 1.0) if remaining is not None else 1.0)
+
+    def try_acquire(self, exclude: Optional[Dict[str, Any]] = None):
+        """Lease a driver only if some healthy node has one idle or room to start one, otherwise return None"""
+        self.check_health()
+        for node in self._ranked_nodes():
+            if node is exclude:
+                continue
+            try:
+                driver = node["pool"].try_acquire()
+            except Exception as e:
+                self._mark_unhealthy(node, f"could not start a session: {e}")
+                continue
+            if driver is not None:
+                with self._condition:
+                    self._owners[id(driver)] = node
+                return driver
+        return None
+
+    def release(self, driver):
+        """Return a driver to its node's pool"""
+        node = self._node_of(driver)
+        if node is None:
+            logger.warning("Releasing a driver the grid did not start; quitting it")
+            self._quit_unowned(driver)
+            return
+        node["pool"].release(driver)
+        with self._condition:
+            self._condition.notify()
+
+    def record_page(self, driver, seconds: Optional[float] = None) -> Optional[float]:
+        """Count a page load on a driver's node; returns the browser's RSS in MB if readable"""
+        node = self._node_of(driver)
+        return node["pool"].record_page(driver, seconds) if node else None
+
+    def needs_recycle(self, driver) -> Optional[str]:
+        """Return why a driver should be replaced or moved to another node, or None"""
+        node = self._node_of(driver)
+        if node is None:
+            return None
+        reason = node["pool"].needs_recycle(driver)
+        if reason:
+            return reason
+        if self._is_slow(node) and self._has_faster_capacity(node):
+            return f"node {node['url']} is slow"
+        return None
+
+    def recycle(self, driver):
+        """
+        Replace a driver that hit its limits on the same node, or move work off a slow node
+
+        Returns:
+            The driver to keep using
+        """
+        node = self._node_of(driver)
+        if node is None:
+            return driver
+
+        if node["pool"].needs_recycle(driver):
+            new_driver = node["pool"].recycle(driver)
+            with self._condition:
+                self._owners[id(new_driver)] = node
+            return new_driver
+
+        new_driver = self.try_acquire(exclude=node)
+        if new_driver is None:
+            return driver
+        target = self._node_of(new_driver)
+        self.release(driver)
+        with self._stats_lock:
+            self._rebalanced += 1
+        logger.info(f"Moved browser work from slow node {node['url']} to {target['url']}")
+        return new_driver
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None):
+        """Context manager that acquires a driver and always releases it"""
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def check_health(self, force: bool = False):
+        """Query /status on every node whose last check is older than health_interval"""
+        now = time.monotonic()
+        for node in self._nodes:
+            if not force and now - node["checked_at"] < self.health_interval:
+                continue
+            node["checked_at"] = now
+            ready, message = self._query_status(node["url"])
+            if ready and not node["healthy"]:
+                logger.info(f"WebDriver node {node['url']} is back online")
+            if not ready:
+                self._mark_unhealthy(node, message)
+            node["healthy"] = ready
+
+    def reset_stats(self):
+        """Start counting recycles, moves and load times for a new scrape run"""
+        for node in self._nodes:
+            node["pool"].reset_stats()
+        with self._stats_lock:
+            self._rebalanced = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Grid-wide recycle and memory counters plus per-node health, load time and page counts"""
+        nodes = {}
+        recycled = 0
+        peak_rss_mb = 0.0
+        for node in self._nodes:
+            pool_stats = node["pool"].get_stats()
+            recycled += pool_stats["recycled"]
+            peak_rss_mb = max(peak_rss_mb, pool_stats["peak_rss_mb"])
+            nodes[node["url"]] = {
+                "healthy": node["healthy"],
+                "slow": self._is_slow(node),
+                "pages": pool_stats["pages"],
+                "avg_load_ms": pool_stats["avg_load_ms"],
+                "failures": node["failures"]
+            }
+        with self._stats_lock:
+            rebalanced = self._rebalanced
+        return {"recycled": recycled, "peak_rss_mb": peak_rss_mb, "rebalanced": rebalanced, "nodes": nodes}
+
+    def shutdown(self):
+        """Quit every idle browser on every node; leased ones are quit when released"""
+        for node in self._nodes:
+            node["pool"].shutdown()
+
+    def _ranked_nodes(self) -> List[Dict[str, Any]]:
+        """Healthy nodes, fast ones first, then by free capacity and average load time"""
+        healthy = [node for node in self._nodes if node["healthy"]]
+
+        def rank(node) -> Tuple[bool, float, float]:
+            pool = node["pool"]
+            busy = 1 - pool.capacity() / pool.size if pool.size else 1.0
+            return self._is_slow(node), busy, pool.get_stats()["avg_load_ms"] or 0.0
+
+        return sorted(healthy, key=rank)
+
+    def _is_slow(self, node: Dict[str, Any]) -> bool:
+        """A node is slow when its average load is slow_factor times the fastest healthy node's"""
+        load = node["pool"].get_stats()["avg_load_ms"]
+        if not load:
+            return False
+        loads = [
+            other["pool"].get_stats()["avg_load_ms"]
+            for other in self._nodes if other["healthy"] and other is not node
+        ]
+        loads = [other_load for other_load in loads if other_load]
+        return bool(loads) and load > self.slow_factor * min(loads)
+
+    def _has_faster_capacity(self, node: Dict[str, Any]) -> bool:
+        """Whether a healthy node that is not slow could take a driver right now"""
+        return any(
+            other is not node and other["healthy"] and not self._is_slow(other) and other["pool"].capacity() > 0
+            for other in self._nodes
+        )
+
+    def _due_for_check(self) -> bool:
+        """Whether any node's health check is due"""
+        now = time.monotonic()
+        return any(now - node["checked_at"] >= self.health_interval for node in self._nodes)
+
+    def _mark_unhealthy(self, node: Dict[str, Any], reason: str):
+        """Skip a node until its next health check"""
+        if node["healthy"]:
+            logger.warning(f"WebDriver node {node['url']} marked unhealthy: {reason}")
+        node["healthy"] = False
+        node["failures"] += 1
+        node["checked_at"] = time.monotonic()
+
+    def _query_status(self, url: str) -> Tuple[bool, str]:
+        """Ask a node's W3C /status endpoint whether it can start sessions"""
+        try:
+            response = requests.get(f"{url.rstrip('/')}/status", timeout=5)
+            response.raise_for_status()
+            value = response.json().get("value", {})
+        except (requests.RequestException, ValueError) as e:
+            return False, f"status check failed: {e}"
+        if not value.get("ready", False):
+            return False, value.get("message") or "node reports it is not ready"
+        return True, ""
+
+    def _node_of(self, driver) -> Optional[Dict[str, Any]]:
+        """The node that started a driver"""
+        with self._condition:
+            return self._owners.get(id(driver))
+
+    def _forget(self, driver):
+        """Drop a driver a node's pool is quitting"""
+        with self._condition:
+            self._owners.pop(id(driver), None)
+
+    def _quit_unowned(self, driver):
+        """Quit a driver that did not come from this grid"""
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error closing driver: {e}")
+
+
+# Process-wide grids keyed by their endpoint list and browser profile, for the same reason as the driver pool
+_shared_grids: Dict[Tuple[Tuple[str, ...], str], WebDriverGrid] = {}
+_shared_grids_lock = threading.Lock()
+
+def get_webdriver_grid(urls: List[str], create_driver: Callable[[str], Any], drivers_per_node: int = 2,
+                       profile: str = "default") -> WebDriverGrid:
+    """
+    Get the process-wide grid for a list of WebDriver endpoints and a browser profile, creating it on first use
+
+    Args:
+        urls: WebDriver endpoint URLs
+        create_driver: Factory taking an endpoint URL and starting a remote driver on it with this profile
+        drivers_per_node: Browsers per node (only applied when the grid is created)
+        profile: Browser profile the factory launches
+
+    Returns:
+        The shared WebDriverGrid
+    """
+    key = (tuple(urls), profile)
+    with _shared_grids_lock:
+        grid = _shared_grids.get(key)
+        if grid is None:
+            grid = WebDriverGrid(list(urls), create_driver, drivers_per_node)
+            _shared_grids[key] = grid
+            atexit.register(grid.shutdown)
+            logger.info(f"Created WebDriver grid for the {profile} profile with {len(urls)} node(s), "
+                        f"{drivers_per_node} browser(s) each")
+        return grid